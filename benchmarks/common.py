@@ -0,0 +1,103 @@
+########################################################################################################################
+# Research Centers
+# ----------------
+# Medical Informatics Group
+# BIH - Berlin Institute of Health
+# Charité - Universitätsmedizin Berlin
+# https://www.bihealth.org/en/research/research-groups/fabian-prasser/
+#
+# Centro ALGORITMI - School of Engineering – University of Minho
+# Braga - Portugal
+# http://algoritmi.uminho.pt/
+#
+#
+# Description
+# -----------
+# Common helpers of the benchmarks, i.e., loading (and encoding) a bundled dataset, amputing it, and
+# measuring the memory footprint of the running process.
+#
+#
+# Moto
+# ----
+# "We think too much and feel too little. More than machinery we need humanity."
+#                         -- Excerpt of the final speech from The Great Dictator
+#
+#
+# Authors
+# -------
+# diogo telmo neves -- {dneves@di.uminho.pt, diogo-telmo.neves@charite.de, tada.science@gmail.com}
+#
+#
+# Copyright
+# ---------
+# Copyright (c) 2021 diogo telmo neves.
+# All rights reserved.
+#
+#
+# Conditions
+# ----------
+# This code is free/open source code but the following conditions must be met:
+#   * Redistributions of source code must retain the above copyright notice, this list of conditions and
+#     the following disclaimer in the documentation and/or other materials provided with the distribution.
+#   * Redistributions in binary form must reproduce the above copyright notice, this list of conditions and
+#     the following disclaimer in the documentation and/or other materials provided with the distribution.
+#
+#
+# DISCLAIMER
+# ----------
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND
+# FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR
+# TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#
+# Date
+# ----
+# October 2026
+########################################################################################################################
+
+import numpy as np
+import pandas as pd
+
+from purify.dataset.metadata import Metadata
+from purify.dataset.processors import PreProcessor
+from purify.encoders import label_encoders_fit_transform
+
+import resource
+
+
+def load_dataset(dataset: str = 'iris', in_folder: str = './datasets') -> np.ndarray:
+    """Loads one of the bundled datasets and applies the same preprocessing as `main.run_tabulator()`,
+    with the label encoder, which yields a numeric `np.ndarray`.
+    """
+    df: pd.DataFrame = pd.read_csv(
+        filepath_or_buffer=f"{in_folder}/{dataset}.csv", skipinitialspace=True, na_values='?', skip_blank_lines=True)
+
+    df = PreProcessor.drop_vars(dataset=dataset, df=df)
+    df = PreProcessor.replace_miss_values_by_nans(df=df, dataset=dataset)
+    df = PreProcessor.drop_nans(df=df)
+    df, _ = label_encoders_fit_transform(data=df, discrete_vars=Metadata.discrete_vars(dataset=dataset, df=df))
+    return df.to_numpy(dtype=float)
+
+
+def ampute(data: np.ndarray, miss_rate: float = 0.2, seed: int = None) -> np.ndarray:
+    """Returns a copy of the given `data` in which a `miss_rate` fraction of the cells is amputated (MCAR)."""
+    data_miss: np.ndarray = data.astype(dtype=float)
+
+    data_miss[np.random.default_rng(seed=seed).uniform(size=data.shape) < miss_rate] = np.NaN
+    return data_miss
+
+
+def rss_mb() -> float:
+    """Returns the resident set size of the running process in MiB, or its peak if the current one is unknown."""
+    try:
+        with open(file='/proc/self/statm', mode='r') as statm:
+            return int(statm.read().split()[1]) * resource.getpagesize() / 2 ** 20
+    except OSError:  # NOT a Linux box, `ru_maxrss` is in bytes on macOS
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 2 ** 20
+
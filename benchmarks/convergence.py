@@ -0,0 +1,138 @@
+########################################################################################################################
+# Research Centers
+# ----------------
+# Medical Informatics Group
+# BIH - Berlin Institute of Health
+# Charité - Universitätsmedizin Berlin
+# https://www.bihealth.org/en/research/research-groups/fabian-prasser/
+#
+# Centro ALGORITMI - School of Engineering – University of Minho
+# Braga - Portugal
+# http://algoritmi.uminho.pt/
+#
+#
+# Description
+# -----------
+# Convergence benchmark of WSGAIN-GP against WSGAIN-CP, i.e., it trains both algorithms on the bundled datasets and
+# reports the number of (generator) iterations that each one takes to reach a target reconstruction loss (`MSE_loss`),
+# which is smoothed by a moving average over the last checks, as well as the final losses of the critic and of
+# the reconstruction. Both algorithms train their critic `n_critic` times per iteration, thus the iterations of one
+# cost (approximately) the same as the ones of the other.
+#
+#
+# Moto
+# ----
+# "We think too much and feel too little. More than machinery we need humanity."
+#                         -- Excerpt of the final speech from The Great Dictator
+#
+#
+# Authors
+# -------
+# diogo telmo neves -- {dneves@di.uminho.pt, diogo-telmo.neves@charite.de, tada.science@gmail.com}
+#
+#
+# Copyright
+# ---------
+# Copyright (c) 2021 diogo telmo neves.
+# All rights reserved.
+#
+#
+# Conditions
+# ----------
+# This code is free/open source code but the following conditions must be met:
+#   * Redistributions of source code must retain the above copyright notice, this list of conditions and
+#     the following disclaimer in the documentation and/or other materials provided with the distribution.
+#   * Redistributions in binary form must reproduce the above copyright notice, this list of conditions and
+#     the following disclaimer in the documentation and/or other materials provided with the distribution.
+#
+#
+# DISCLAIMER
+# ----------
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND
+# FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR
+# TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#
+# Date
+# ----
+# October 2026
+########################################################################################################################
+
+import numpy as np
+
+from benchmarks.common import ampute, load_dataset
+from benchmarks.engines import ALGOS, ENGINES
+from purify.imputation.base import BaseSGAIN
+
+import importlib
+
+from argparse import ArgumentParser, Namespace
+from collections import deque
+from typing import Callable, Deque, Dict, List, Tuple
+
+
+def convergence(data: np.ndarray,
+                engine: str = 'session',
+                algo: str = 'WSGAIN-GP',
+                target: float = 0.05,
+                n_iterations: int = 3000,
+                check_every: int = 10,
+                window: int = 5,
+                seed: int = 0) -> Tuple[int, float, float]:
+    """Trains a model and returns the first iteration at which the moving average of its `MSE_loss` (over the last
+    `window` checks, which are `check_every` iterations apart) reaches the `target`, or `None` if it never does,
+    along with the final `D_loss` and `MSE_loss`.
+    """
+    algo_class: Callable[..., BaseSGAIN] = getattr(importlib.import_module(name=ENGINES[engine]), ALGOS[algo])
+    recent: Deque[float] = deque(maxlen=window)
+    reached: List[int] = []
+    last: Dict[str, float] = {}
+    model: BaseSGAIN
+
+    def callback(iteration: int, losses: Dict[str, float]) -> None:
+        recent.append(losses['MSE_loss'])
+        last.update(losses)
+        if not reached and len(recent) == window and np.mean(recent) <= target:
+            reached.append(iteration)
+
+    with algo_class(data=data, algo_parameters={'n_iterations': n_iterations, 'seed': seed}) as model:
+        model.fit(callback=callback, callback_every=check_every)
+    return reached[0] if reached else None, last['D_loss'], last['MSE_loss']
+
+
+def main(args: Namespace) -> None:
+    print(f"{'dataset':>12} {'algo':>10} {'iterations':>10} {'D_loss':>10} {'MSE_loss':>10}")
+    for dataset in args.datasets.split(','):
+        data: np.ndarray = ampute(data=load_dataset(dataset=dataset), miss_rate=args.miss_rate, seed=0)
+
+        for algo in ('WSGAIN-CP', 'WSGAIN-GP'):
+            iterations: int
+            D_loss: float
+            MSE_loss: float
+
+            iterations, D_loss, MSE_loss = convergence(data=data, engine=args.engine, algo=algo, target=args.target,
+                                                       n_iterations=args.n_iterations, check_every=args.check_every)
+            print(f"{dataset:>12} {algo:>10} {'-' if iterations is None else iterations:>10} "
+                  f"{D_loss:10.4f} {MSE_loss:10.4f}")
+
+
+if __name__ == "__main__":
+    parser: ArgumentParser = ArgumentParser()
+
+    parser.add_argument('--datasets', help="comma separated list of dataset short names",
+                        default='iris,wine-red,breast,spam,letter', type=str)
+    parser.add_argument('--engine', help="engine", choices=list(ENGINES), default='session', type=str)
+    parser.add_argument('--miss_rate', help="amputation rate ([0.00, 1.00])", default=0.2, type=float)
+    parser.add_argument('--target', help="target (moving average of the) reconstruction loss", default=0.05,
+                        type=float)
+    parser.add_argument('--n_iterations', help="number of training iterations (of SGAIN, see `WSGAIN`)",
+                        default=3000, type=int)
+    parser.add_argument('--check_every', help="number of iterations between checks of the loss", default=10, type=int)
+
+    main(args=parser.parse_args())
@@ -0,0 +1,141 @@
+########################################################################################################################
+# Research Centers
+# ----------------
+# Medical Informatics Group
+# BIH - Berlin Institute of Health
+# Charité - Universitätsmedizin Berlin
+# https://www.bihealth.org/en/research/research-groups/fabian-prasser/
+#
+# Centro ALGORITMI - School of Engineering – University of Minho
+# Braga - Portugal
+# http://algoritmi.uminho.pt/
+#
+#
+# Description
+# -----------
+# Benchmark of the engines of the SGAIN family, i.e., it measures the training throughput (iterations per second) of
+# the session engine (see `purify.imputation.gain`) and of the TensorFlow 2 engine, whose training steps are compiled
+# by XLA (see `purify.imputation.gain_tf2`), over the bundled datasets. The PyTorch engine can be compared as well
+# (e.g., `--engines=session,torch`).
+# The first iterations of each training are warm-up ones (e.g., tracing and compiling the steps), hence,
+# the throughput is measured from the metrics callback of `fit()` after those.
+#
+#
+# Moto
+# ----
+# "We think too much and feel too little. More than machinery we need humanity."
+#                         -- Excerpt of the final speech from The Great Dictator
+#
+#
+# Authors
+# -------
+# diogo telmo neves -- {dneves@di.uminho.pt, diogo-telmo.neves@charite.de, tada.science@gmail.com}
+#
+#
+# Copyright
+# ---------
+# Copyright (c) 2021 diogo telmo neves.
+# All rights reserved.
+#
+#
+# Conditions
+# ----------
+# This code is free/open source code but the following conditions must be met:
+#   * Redistributions of source code must retain the above copyright notice, this list of conditions and
+#     the following disclaimer in the documentation and/or other materials provided with the distribution.
+#   * Redistributions in binary form must reproduce the above copyright notice, this list of conditions and
+#     the following disclaimer in the documentation and/or other materials provided with the distribution.
+#
+#
+# DISCLAIMER
+# ----------
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND
+# FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR
+# TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#
+# Date
+# ----
+# October 2026
+########################################################################################################################
+
+import numpy as np
+
+from benchmarks.common import ampute, load_dataset
+from purify.imputation.base import BaseSGAIN
+
+import importlib
+import time
+
+from argparse import ArgumentParser, Namespace
+from typing import Any, Callable, Dict, List
+
+ENGINES: Dict[str, str] = {
+    'session': 'purify.imputation.gain', 'tf2': 'purify.imputation.gain_tf2', 'torch': 'purify.imputation.gain_torch'}
+"""The modules of the engines, which are imported lazily (e.g., the 'torch' one does NOT import TensorFlow)."""
+
+ALGOS: Dict[str, str] = {'SGAIN': 'SGAIN', 'WSGAIN-CP': 'WSGAIN_CP', 'WSGAIN-GP': 'WSGAIN_GP'}
+
+
+def throughput(data: np.ndarray,
+               engine: str = 'session',
+               algo: str = 'SGAIN',
+               n_iterations: int = 3000,
+               n_warmup: int = 100,
+               seed: int = 0,
+               algo_parameters: Dict[str, Any] = {}) -> float:
+    """Trains a model and returns its throughput, i.e., the number of training iterations per second after
+    the first `n_warmup` ones (an iteration of WSGAIN-CP/GP trains the critic `n_critic` times).
+    Any other algorithm parameter (e.g., the threading of the engine) is given by `algo_parameters`, whose
+    `cpu_affinity` (if any) pins the process (see `BaseSGAIN.pin()`).
+    """
+    start: List[float] = []
+    algo_class: Callable[..., BaseSGAIN] = getattr(importlib.import_module(name=ENGINES[engine]), ALGOS[algo])
+    model: BaseSGAIN
+
+    # the process is pinned (if asked to) before the engine creates its thread pools
+    BaseSGAIN.pin(cpu_affinity=algo_parameters['cpu_affinity'] if 'cpu_affinity' in algo_parameters else None)
+    with algo_class(data=data,
+                    algo_parameters={**algo_parameters, 'n_iterations': n_iterations, 'seed': seed}) as model:
+        n_warmup = max(1, min(n_warmup, model.n_iterations - 2))
+        # the callback is only asked at the end of the warm-up, thus the losses are (almost) never fetched
+        model.fit(callback=lambda iteration, losses: start.append(time.perf_counter()) if iteration else None,
+                  callback_every=n_warmup)
+        return (model.n_iterations - n_warmup - 1) / (time.perf_counter() - start[0])
+
+
+def main(args: Namespace) -> None:
+    print(f"{'dataset':>12} {'algo':>10} " + ' '.join(f"{engine:>10}" for engine in args.engines.split(',')) +
+          f" {'speed-up':>9}")
+    for dataset in args.datasets.split(','):
+        data: np.ndarray = ampute(data=load_dataset(dataset=dataset), miss_rate=args.miss_rate, seed=0)
+
+        for algo in args.algos.split(','):
+            steps: List[float] = [throughput(data=data, engine=engine, algo=algo,
+                                             n_iterations=args.n_iterations, n_warmup=args.n_warmup)
+                                  for engine in args.engines.split(',')]
+
+            print(f"{dataset:>12} {algo:>10} " + ' '.join(f"{step:10.1f}" for step in steps) +
+                  f" {steps[-1] / steps[0]:8.2f}x")
+
+
+if __name__ == "__main__":
+    parser: ArgumentParser = ArgumentParser()
+
+    parser.add_argument('--datasets', help="comma separated list of dataset short names",
+                        default='iris,wine-red,breast,spam,letter', type=str)
+    parser.add_argument('--algos', help="comma separated list of algorithms",
+                        default='SGAIN,WSGAIN-CP,WSGAIN-GP', type=str)
+    parser.add_argument('--engines', help="comma separated list of engines, the last one is compared to the first one",
+                        default='session,tf2', type=str)
+    parser.add_argument('--miss_rate', help="amputation rate ([0.00, 1.00])", default=0.2, type=float)
+    parser.add_argument('--n_iterations', help="number of training iterations", default=3000, type=int)
+    parser.add_argument('--n_warmup', help="number of warm-up iterations", default=100, type=int)
+
+    main(args=parser.parse_args())
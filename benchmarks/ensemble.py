@@ -0,0 +1,124 @@
+########################################################################################################################
+# Research Centers
+# ----------------
+# Medical Informatics Group
+# BIH - Berlin Institute of Health
+# Charité - Universitätsmedizin Berlin
+# https://www.bihealth.org/en/research/research-groups/fabian-prasser/
+#
+# Centro ALGORITMI - School of Engineering – University of Minho
+# Braga - Portugal
+# http://algoritmi.uminho.pt/
+#
+#
+# Description
+# -----------
+# Benchmark of the ensembles of SGAIN replicas (see `purify.imputation.ensemble`), i.e., it measures the training
+# throughput per replica (replica iterations per second) of ensembles of K replicas, which are trained by a single
+# batched step, and compares it to the one of a single SGAIN model on the same (TensorFlow 2) engine.
+# The first iterations of each training are warm-up ones (e.g., tracing and compiling the step), hence,
+# the throughput is measured from the metrics callback of `fit()` after those.
+#
+#
+# Moto
+# ----
+# "We think too much and feel too little. More than machinery we need humanity."
+#                         -- Excerpt of the final speech from The Great Dictator
+#
+#
+# Authors
+# -------
+# diogo telmo neves -- {dneves@di.uminho.pt, diogo-telmo.neves@charite.de, tada.science@gmail.com}
+#
+#
+# Copyright
+# ---------
+# Copyright (c) 2021 diogo telmo neves.
+# All rights reserved.
+#
+#
+# Conditions
+# ----------
+# This code is free/open source code but the following conditions must be met:
+#   * Redistributions of source code must retain the above copyright notice, this list of conditions and
+#     the following disclaimer in the documentation and/or other materials provided with the distribution.
+#   * Redistributions in binary form must reproduce the above copyright notice, this list of conditions and
+#     the following disclaimer in the documentation and/or other materials provided with the distribution.
+#
+#
+# DISCLAIMER
+# ----------
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND
+# FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR
+# TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#
+# Date
+# ----
+# October 2026
+########################################################################################################################
+
+import numpy as np
+
+from benchmarks.common import ampute, load_dataset
+from benchmarks.engines import throughput
+from purify.imputation.ensemble import SGAINEnsemble
+
+import time
+
+from argparse import ArgumentParser, Namespace
+from typing import List
+
+
+def ensemble_throughput(data: np.ndarray,
+                        n_replicas: int = 8,
+                        n_iterations: int = 3000,
+                        n_warmup: int = 100,
+                        seed: int = 0) -> float:
+    """Trains an ensemble of `n_replicas` replicas and returns its throughput per replica, i.e., the number of
+    training iterations per second after the first `n_warmup` ones times the number of replicas.
+    """
+    start: List[float] = []
+    model: SGAINEnsemble
+
+    with SGAINEnsemble(data=data, algo_parameters={'n_iterations': n_iterations, 'seed': seed,
+                                                   'n_replicas': n_replicas}) as model:
+        n_warmup = max(1, min(n_warmup, model.n_iterations - 2))
+        model.fit(callback=lambda iteration, losses: start.append(time.perf_counter()) if iteration else None,
+                  callback_every=n_warmup)
+        return n_replicas * (model.n_iterations - n_warmup - 1) / (time.perf_counter() - start[0])
+
+
+def main(args: Namespace) -> None:
+    n_replicas: List[int] = [int(k) for k in args.n_replicas.split(',')]
+
+    print(f"{'dataset':>12} {'single':>10} " + ' '.join(f"{f'K={k}':>10}" for k in n_replicas) + f" {'speed-up':>9}")
+    for dataset in args.datasets.split(','):
+        data: np.ndarray = ampute(data=load_dataset(dataset=dataset), miss_rate=args.miss_rate, seed=0)
+        single: float = throughput(data=data, engine='tf2', algo='SGAIN',
+                                   n_iterations=args.n_iterations, n_warmup=args.n_warmup)
+        steps: List[float] = [ensemble_throughput(data=data, n_replicas=k, n_iterations=args.n_iterations,
+                                                  n_warmup=args.n_warmup) for k in n_replicas]
+
+        print(f"{dataset:>12} {single:10.1f} " + ' '.join(f"{step:10.1f}" for step in steps) +
+              f" {max(steps) / single:8.2f}x")
+
+
+if __name__ == "__main__":
+    parser: ArgumentParser = ArgumentParser()
+
+    parser.add_argument('--datasets', help="comma separated list of dataset short names",
+                        default='iris,wine-red,breast,spam,letter', type=str)
+    parser.add_argument('--n_replicas', help="comma separated list of the numbers of replicas of the ensembles",
+                        default='2,4,8,16,32', type=str)
+    parser.add_argument('--miss_rate', help="amputation rate ([0.00, 1.00])", default=0.2, type=float)
+    parser.add_argument('--n_iterations', help="number of training iterations", default=3000, type=int)
+    parser.add_argument('--n_warmup', help="number of warm-up iterations", default=100, type=int)
+
+    main(args=parser.parse_args())
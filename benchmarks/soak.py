@@ -0,0 +1,135 @@
+########################################################################################################################
+# Research Centers
+# ----------------
+# Medical Informatics Group
+# BIH - Berlin Institute of Health
+# Charité - Universitätsmedizin Berlin
+# https://www.bihealth.org/en/research/research-groups/fabian-prasser/
+#
+# Centro ALGORITMI - School of Engineering – University of Minho
+# Braga - Portugal
+# http://algoritmi.uminho.pt/
+#
+#
+# Description
+# -----------
+# Soak benchmark of the SGAIN family, i.e., it trains (and closes) hundreds of models in a single process, just like
+# a grid of `main.py` over datasets x amputation rates x algorithms, and it reports the resident set size as well as
+# the time per training iteration along the way.
+# Since each model owns its graph and its session (see `purify.imputation.gain.SGAIN.close()`),
+# both the resident set size and the time per iteration are expected to stay flat, which is summarized at the end.
+#
+#
+# Moto
+# ----
+# "We think too much and feel too little. More than machinery we need humanity."
+#                         -- Excerpt of the final speech from The Great Dictator
+#
+#
+# Authors
+# -------
+# diogo telmo neves -- {dneves@di.uminho.pt, diogo-telmo.neves@charite.de, tada.science@gmail.com}
+#
+#
+# Copyright
+# ---------
+# Copyright (c) 2021 diogo telmo neves.
+# All rights reserved.
+#
+#
+# Conditions
+# ----------
+# This code is free/open source code but the following conditions must be met:
+#   * Redistributions of source code must retain the above copyright notice, this list of conditions and
+#     the following disclaimer in the documentation and/or other materials provided with the distribution.
+#   * Redistributions in binary form must reproduce the above copyright notice, this list of conditions and
+#     the following disclaimer in the documentation and/or other materials provided with the distribution.
+#
+#
+# DISCLAIMER
+# ----------
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND
+# FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR
+# TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#
+# Date
+# ----
+# October 2026
+########################################################################################################################
+
+import numpy as np
+
+import tensorflow as tf
+
+from benchmarks.common import ampute, load_dataset, rss_mb
+from purify.imputation.gain import SGAIN, WSGAIN_CP, WSGAIN_GP
+
+import time
+
+from argparse import ArgumentParser, Namespace
+from typing import Callable, Dict, List, Tuple
+
+ALGOS: Dict[str, Callable[..., SGAIN]] = {'SGAIN': SGAIN, 'WSGAIN-CP': WSGAIN_CP, 'WSGAIN-GP': WSGAIN_GP}
+
+
+def soak(dataset: str = 'iris',
+         algo: str = 'SGAIN',
+         miss_rate: float = 0.2,
+         n_trainings: int = 300,
+         n_iterations: int = 100,
+         report_every: int = 25) -> List[Tuple[float, float]]:
+    """Trains `n_trainings` models in a row and returns, for each one, the resident set size (in MiB) after closing
+    the model and the mean time (in milliseconds) per training iteration.
+    """
+    data: np.ndarray = ampute(data=load_dataset(dataset=dataset), miss_rate=miss_rate, seed=0)
+    records: List[Tuple[float, float]] = []
+    model: SGAIN
+
+    for training in range(n_trainings):
+        step: float
+
+        with ALGOS[algo](data=data, algo_parameters={'n_iterations': n_iterations, 'seed': training}) as model:
+            start: float = time.perf_counter()
+
+            model.fit()
+            step = 1e3 * (time.perf_counter() - start) / model.n_iterations
+        records.append((rss_mb(), step))
+        if training % report_every == 0 or training == n_trainings - 1:
+            print(f"training: {training:4d}; RSS: {records[-1][0]:8.1f} MiB; step: {records[-1][1]:7.3f} ms; "
+                  f"default graph ops: {len(tf.compat.v1.get_default_graph().get_operations())}")
+    return records
+
+
+def main(args: Namespace) -> None:
+    records: np.ndarray = np.array(soak(dataset=args.dataset,
+                                        algo=args.algo,
+                                        miss_rate=args.miss_rate,
+                                        n_trainings=args.n_trainings,
+                                        n_iterations=args.n_iterations))
+    # the first trainings are warm-up ones (e.g., lazy loading of kernels), thus they are skipped
+    window: int = max(1, len(records) // 10)
+    first: np.ndarray = records[window:(2 * window)].mean(axis=0)
+    last: np.ndarray = records[-window:].mean(axis=0)
+
+    print()
+    print(f"RSS:  {first[0]:8.1f} MiB --> {last[0]:8.1f} MiB ({last[0] - first[0]:+.1f} MiB)")
+    print(f"step: {first[1]:8.3f} ms  --> {last[1]:8.3f} ms  ({100 * (last[1] / first[1] - 1):+.1f}%)")
+
+
+if __name__ == "__main__":
+    parser: ArgumentParser = ArgumentParser()
+
+    parser.add_argument('--dataset', help="dataset short name", default='iris', type=str)
+    parser.add_argument('--algo', help="algorithm", choices=list(ALGOS), default='SGAIN', type=str)
+    parser.add_argument('--miss_rate', help="amputation rate ([0.00, 1.00])", default=0.2, type=float)
+    parser.add_argument('--n_trainings', help="number of trainings", default=300, type=int)
+    parser.add_argument('--n_iterations', help="number of training iterations", default=100, type=int)
+
+    main(args=parser.parse_args())
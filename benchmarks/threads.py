@@ -0,0 +1,198 @@
+########################################################################################################################
+# Research Centers
+# ----------------
+# Medical Informatics Group
+# BIH - Berlin Institute of Health
+# Charité - Universitätsmedizin Berlin
+# https://www.bihealth.org/en/research/research-groups/fabian-prasser/
+#
+# Centro ALGORITMI - School of Engineering – University of Minho
+# Braga - Portugal
+# http://algoritmi.uminho.pt/
+#
+#
+# Description
+# -----------
+# Auto-tuner of the threading of the engines of the SGAIN family, i.e., for a given number of variables (`m_dim`) and
+# batch size, it measures the aggregated training throughput (iterations per second) of `n_concurrent` trainings that
+# run side by side, each one in its own process, for every combination of intra-op and inter-op threads (and, if asked,
+# with each process pinned to its own cores), and it reports the best one, which can then be given to `main.py`
+# (e.g., `--intra_op_threads=2 --inter_op_threads=1`).
+# The data is drawn at random, since the throughput only depends on its shape, and every configuration is measured
+# by fresh processes because the thread pools of the TensorFlow 2 and the PyTorch engines are process-wide.
+# With `--check_workers=True`, it rather checks the threads that each worker process of the tabulator pool gets.
+#
+#
+# Moto
+# ----
+# "We think too much and feel too little. More than machinery we need humanity."
+#                         -- Excerpt of the final speech from The Great Dictator
+#
+#
+# Authors
+# -------
+# diogo telmo neves -- {dneves@di.uminho.pt, diogo-telmo.neves@charite.de, tada.science@gmail.com}
+#
+#
+# Copyright
+# ---------
+# Copyright (c) 2021 diogo telmo neves.
+# All rights reserved.
+#
+#
+# Conditions
+# ----------
+# This code is free/open source code but the following conditions must be met:
+#   * Redistributions of source code must retain the above copyright notice, this list of conditions and
+#     the following disclaimer in the documentation and/or other materials provided with the distribution.
+#   * Redistributions in binary form must reproduce the above copyright notice, this list of conditions and
+#     the following disclaimer in the documentation and/or other materials provided with the distribution.
+#
+#
+# DISCLAIMER
+# ----------
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND
+# FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR
+# TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#
+# Date
+# ----
+# October 2026
+########################################################################################################################
+
+import numpy as np
+
+from benchmarks.common import ampute
+from benchmarks.engines import ALGOS, ENGINES, throughput
+
+from purify.generation import tabulator
+from purify.generation.tabulator import TabularDataGenerator
+
+import multiprocessing
+import os
+
+from argparse import ArgumentParser, Namespace
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Tuple
+
+
+def configurations(n_concurrent: int = 1) -> List[Tuple[int, int]]:
+    """Returns the (intra-op threads, inter-op threads) combinations to try, i.e., powers of two up to the share of
+    the cores of each training, as well as the defaults of the engine (zero threads, i.e., one per core).
+    """
+    n_cores: int = max(1, os.cpu_count() // n_concurrent)
+    intra_op_threads: List[int] = [2 ** k for k in range(int(np.log2(n_cores)) + 1)]
+
+    if n_cores not in intra_op_threads:
+        intra_op_threads.append(n_cores)
+    return [(0, 0)] + [(intra, inter) for intra in intra_op_threads for inter in (1, 2)]
+
+
+def tune(m_dim: int = 16,
+         batch_size: int = 128,
+         n_obs: int = 10000,
+         engine: str = 'session',
+         algo: str = 'SGAIN',
+         n_concurrent: int = 1,
+         pin: bool = False,
+         n_iterations: int = 2000,
+         n_warmup: int = 100) -> List[Tuple[int, int, float]]:
+    """Measures every configuration (see `configurations()`) and returns, for each one, the intra-op threads,
+    the inter-op threads and the aggregated throughput of the `n_concurrent` trainings, from the best to the worst.
+    """
+    data: np.ndarray = ampute(data=np.random.default_rng(seed=0).uniform(size=(n_obs, m_dim)), miss_rate=0.2, seed=0)
+    records: List[Tuple[int, int, float]] = []
+
+    for intra, inter in configurations(n_concurrent=n_concurrent):
+        n_cores: int = max(1, intra)
+        # `spawn` since TensorFlow does NOT cope with forked processes
+        with ProcessPoolExecutor(max_workers=n_concurrent,
+                                 mp_context=multiprocessing.get_context(method='spawn')) as executor:
+            steps: List[float] = [future.result() for future in [executor.submit(
+                throughput, data=data, engine=engine, algo=algo, n_iterations=n_iterations, n_warmup=n_warmup,
+                algo_parameters={
+                    'batch_size': batch_size, 'intra_op_threads': intra, 'inter_op_threads': inter,
+                    # each training is pinned to its own cores (wrapping around if there are not enough of them)
+                    **({'cpu_affinity': [(k * n_cores + core) % os.cpu_count() for core in range(n_cores)]}
+                       if pin and intra > 0 else {})}) for k in range(n_concurrent)]]
+        records.append((intra, inter, sum(steps)))
+        print(f"intra-op threads: {intra:3d}; inter-op threads: {inter:3d}; throughput: {sum(steps):10.1f} it/s")
+    return sorted(records, key=lambda record: -record[2])
+
+
+def _worker_threads() -> Tuple[int, int]:
+    """Returns the intra-op and the inter-op threads a worker process of the tabulator pool received."""
+    return tabulator._worker['algo_parameters']['intra_op_threads'], \
+        tabulator._worker['algo_parameters']['inter_op_threads']
+
+
+def check_workers(n_jobs: int = 2) -> None:
+    """Checks that each worker process of the tabulator pool (see `TabularDataGenerator._runs()`) gets its share of
+    the cores (i.e., `cpu_count // n_jobs` intra-op threads and one inter-op thread), also when the thread counts are
+    given as zeros (i.e., the defaults of the engine), which `main.py` used to pass.
+    """
+    expected: Tuple[int, int] = (max(1, os.cpu_count() // n_jobs), 1)
+    algo_parameters: Dict[str, Any]
+
+    for algo_parameters in ({}, {'intra_op_threads': 0, 'inter_op_threads': 0}):
+        generator: TabularDataGenerator = TabularDataGenerator(
+            data=np.zeros(shape=(4, 2)), algo_parameters={'miss_rate': 0.5, 'n_jobs': n_jobs, **algo_parameters})
+
+        # `spawn` since TensorFlow does NOT cope with forked processes
+        with ProcessPoolExecutor(max_workers=n_jobs,
+                                 mp_context=multiprocessing.get_context(method='spawn'),
+                                 initializer=tabulator._init_worker,
+                                 initargs=(generator.algo, generator.data, generator._worker_parameters())) as executor:
+            threads: List[Tuple[int, int]] = [future.result() for future in [
+                executor.submit(_worker_threads) for _ in range(n_jobs)]]
+        if any(thread != expected for thread in threads):
+            raise AssertionError(f"Expecting each worker to get {expected} (intra-op, inter-op) threads "
+                                 f"but got: {threads}.")
+        print(f"algo_parameters: {algo_parameters}; worker threads: {threads}")
+
+
+def main(args: Namespace) -> None:
+    if args.check_workers == 'True':
+        check_workers(n_jobs=args.n_concurrent)
+        return
+    records: List[Tuple[int, int, float]] = tune(m_dim=args.m_dim,
+                                                 batch_size=args.batch_size,
+                                                 n_obs=args.n_obs,
+                                                 engine=args.engine,
+                                                 algo=args.algo,
+                                                 n_concurrent=args.n_concurrent,
+                                                 pin=args.pin == 'True',
+                                                 n_iterations=args.n_iterations,
+                                                 n_warmup=args.n_warmup)
+    default: float = [step for intra, inter, step in records if intra == 0 and inter == 0][0]
+
+    print()
+    print(f"best: --intra_op_threads={records[0][0]} --inter_op_threads={records[0][1]} "
+          f"({records[0][2]:.1f} it/s, {records[0][2] / default:.2f}x the defaults of the engine)")
+
+
+if __name__ == "__main__":
+    parser: ArgumentParser = ArgumentParser()
+
+    parser.add_argument('--m_dim', help="number of variables (i.e., columns) of the data", default=16, type=int)
+    parser.add_argument('--batch_size', help="size of the mini-batches", default=128, type=int)
+    parser.add_argument('--n_obs', help="number of observations (i.e., rows) of the data", default=10000, type=int)
+    parser.add_argument('--engine', help="engine", choices=list(ENGINES), default='session', type=str)
+    parser.add_argument('--algo', help="algorithm", choices=list(ALGOS), default='SGAIN', type=str)
+    parser.add_argument('--n_concurrent', help="number of trainings that run side by side", default=1, type=int)
+    parser.add_argument('--pin', help="to pin each training to its own cores", choices=['False', 'True'],
+                        default='False', type=str)
+    parser.add_argument('--n_iterations', help="number of training iterations", default=2000, type=int)
+    parser.add_argument('--n_warmup', help="number of warm-up iterations", default=100, type=int)
+    parser.add_argument('--check_workers', help="to check the threads the worker processes of the tabulator get "
+                                                "(`--n_concurrent` of them) rather than tuning",
+                        choices=['False', 'True'], default='False', type=str)
+
+    main(args=parser.parse_args())
@@ -96,10 +96,12 @@ from purify.dataset.metadata import Metadata
 from purify.dataset.profiling import profiler
 from purify.dataset.processors import PreProcessor
 from purify.encoders import label_encoders_fit_transform, label_encoders_inverse_transform
+from purify.encoders import label_encoders_state, label_encoders_from_state
 from purify.encoders import get_dummies_fit_transform, get_dummies_inverse_transform
 from purify.generation.tabulator import TabularDataGenerator
+from purify.imputation.base import BaseSGAIN
 
-from typing import List, Dict, Tuple, Union
+from typing import Any, List, Dict, Tuple, Union
 
 pd.set_option('display.max_rows', None)
 pd.set_option('display.max_columns', None)
@@ -172,6 +174,18 @@ def run_tabulator(dataset: str = 'adult',
                   batch_size: int = 128,
                   n_iterations: int = 1000,
                   n_samples: int = 100,
+                  train_once: bool = False,
+                  warm_start: bool = False,
+                  warm_iterations: int = 250,
+                  ensemble: bool = False,
+                  n_jobs: int = 1,
+                  engine: str = 'session',
+                  intra_op_threads: int = 0,
+                  inter_op_threads: int = 0,
+                  cpu_affinity: List[int] = None,
+                  mmap_dir: str = None,
+                  save_generator: bool = False,
+                  load_generator: bool = False,
                   in_folder: str = './datasets',
                   out_folder: str = './experiments',
                   verbose: bool = False) -> Tuple[pd.DataFrame, pd.DataFrame]:
@@ -186,6 +200,9 @@ def run_tabulator(dataset: str = 'adult',
     generator: TabularDataGenerator
     new_discrete_vars: Union[List[str], List[int]]
     filename: str = f"{dataset}_{ampu_rate}_{encoder_type}_{algo}_{batch_size}_{loss}_{n_iterations}"
+    # the generator (along with the state of its label encoders, if any) is saved into (and loaded from) this file,
+    # only a generator in the train-once mode keeps its trained model, thus it samples without any training once loaded
+    generator_path: str = f"{out_folder}/{filename}_generator.npz"
 
     # data preprocessing
     df_pre = PreProcessor.drop_vars(dataset=dataset, df=df_raw)
@@ -204,11 +221,28 @@ def run_tabulator(dataset: str = 'adult',
     else:  # 'label' --> default encoder
         df_enc, label_encoders = label_encoders_fit_transform(
             data=df_pre, discrete_vars=Metadata.discrete_vars(dataset=dataset, df=df_pre))
-    # create an instance of the generator
-    generator = TabularDataGenerator(
-        data=df_enc.to_numpy(),
-        algo=algo,
-        algo_parameters={'miss_rate': ampu_rate, 'batch_size': batch_size, 'loss': loss, 'n_iterations': n_iterations})
+    # the settings of the host, which a saved generator does NOT keep (see `TabularDataGenerator.HOST_PARAMETERS`)
+    host_parameters: Dict[str, Any] = {
+        'n_jobs': n_jobs,
+        # zero threads (i.e., the default) are left out, thus the workers get their share of the cores
+        **({'intra_op_threads': intra_op_threads} if intra_op_threads else {}),
+        **({'inter_op_threads': inter_op_threads} if inter_op_threads else {}),
+        **({'cpu_affinity': cpu_affinity} if cpu_affinity else {}),
+        **({'mmap_dir': mmap_dir} if mmap_dir else {})}
+    # create an instance of the generator (or load a saved one, along with the label encoders it was trained with)
+    if load_generator:
+        generator = TabularDataGenerator.load(path=generator_path, algo_parameters=host_parameters)
+    else:
+        generator = TabularDataGenerator(
+            data=df_enc.to_numpy(),
+            algo=algo,
+            algo_parameters={'miss_rate': ampu_rate, 'batch_size': batch_size, 'loss': loss,
+                             'n_iterations': n_iterations, 'train_once': train_once, 'warm_start': warm_start,
+                             'warm_iterations': warm_iterations, 'ensemble': ensemble, 'engine': engine,
+                             **host_parameters})
+    if generator.n_jobs == 1 or generator.train_once:
+        # the rounds run in this process, which is then pinned (the worker processes pin themselves, if any)
+        BaseSGAIN.pin(cpu_affinity=cpu_affinity)
     # logging some execution info
     if verbose:
         logging.basicConfig(filename=f"{out_folder}/{filename}.txt", level=logging.INFO)
@@ -224,8 +258,25 @@ def run_tabulator(dataset: str = 'adult',
         logging.info(f"loss: {loss}")
         logging.info(f"n_iterations: {n_iterations}")
         logging.info(f"n_samples: {n_samples}")
+        logging.info(f"train once: {train_once}")
+        logging.info(f"warm start: {warm_start}")
+        logging.info(f"warm iterations: {warm_iterations}")
+        logging.info(f"ensemble: {ensemble}")
+        logging.info(f"n_jobs: {n_jobs}")
+        logging.info(f"engine: {engine}")
+        logging.info(f"intra-op threads: {intra_op_threads}")
+        logging.info(f"inter-op threads: {inter_op_threads}")
+        logging.info(f"cpu affinity: {cpu_affinity}")
+        logging.info(f"memory-mapped data directory: {mmap_dir}")
+    if load_generator and encoder_type != 'one-hot':
+        label_encoders = label_encoders_from_state(encoder_state=generator.encoder_state)
     # sampling (i.e., get the samples)
     samples = generator.sampler(n_samples=n_samples)
+    if save_generator:
+        generator.save(path=generator_path,
+                       encoder_state=label_encoders_state(label_encoders=label_encoders)
+                       if encoder_type != 'one-hot' else None)
+    generator.close()
     # decoding the discrete variables
     if encoder_type == 'one-hot':
         df_sam = pd.DataFrame(data=samples, columns=df_enc.columns)
@@ -300,6 +351,20 @@ def main(args: Namespace) -> None:
                                                batch_size=128,
                                                n_iterations=1000,
                                                n_samples=DATASETS[dataset],
+                                               train_once=args.train_once == 'True',
+                                               warm_start=args.warm_start == 'True',
+                                               warm_iterations=args.warm_iterations,
+                                               # the WSGAIN-CP/GP generators are NOT trained as ensembles
+                                               ensemble=args.ensemble == 'True' and algo == 'tabulator',
+                                               n_jobs=args.n_jobs,
+                                               engine=args.engine,
+                                               intra_op_threads=args.intra_op_threads,
+                                               inter_op_threads=args.inter_op_threads,
+                                               cpu_affinity=[int(cpu) for cpu in args.cpu_affinity.split(',')
+                                                             if cpu] or None,
+                                               mmap_dir=args.mmap_dir or None,
+                                               save_generator=args.save_generator == 'True',
+                                               load_generator=args.load_generator == 'True',
                                                verbose=False)
 
 
@@ -400,6 +465,76 @@ if __name__ == "__main__":
         help="number of runs",
         default=3,
         type=int)
+    parser.add_argument(
+        '--train_once',
+        help="to train a single model that imputes every amputation round instead of one model per round",
+        choices=['False', 'True'],  # `bool` type does NOT work as expected
+        default='False',  # `bool` type does NOT work as expected
+        type=str)  # `bool` type does NOT work as expected
+    parser.add_argument(
+        '--warm_start',
+        help="to start each amputation round from the weights (and optimizer state) of the previous round",
+        choices=['False', 'True'],  # `bool` type does NOT work as expected
+        default='False',  # `bool` type does NOT work as expected
+        type=str)  # `bool` type does NOT work as expected
+    parser.add_argument(
+        '--warm_iterations',
+        help="number of iterations of each warm-started amputation round (i.e., of every round but the first one)",
+        default=250,
+        type=int)
+    parser.add_argument(
+        '--ensemble',
+        help="to train the amputation rounds of each run at once, as an ensemble of SGAIN replicas (tabulator only)",
+        choices=['False', 'True'],  # `bool` type does NOT work as expected
+        default='False',  # `bool` type does NOT work as expected
+        type=str)  # `bool` type does NOT work as expected
+    parser.add_argument(
+        '--n_jobs',
+        help="number of worker processes to execute the amputation rounds (a non-positive value means all the CPUs)",
+        default=1,
+        type=int)
+    parser.add_argument(
+        '--engine',
+        help="engine of the tabular data generators, i.e., TensorFlow 1 sessions, TensorFlow 2 compiled (XLA) steps "
+             "or PyTorch (which does NOT import TensorFlow)",
+        choices=['session', 'tf2', 'torch'],
+        default='session',
+        type=str)
+    parser.add_argument(
+        '--intra_op_threads',
+        help="number of threads of the intra-op pool of the engine (zero means one per core)",
+        default=0,
+        type=int)
+    parser.add_argument(
+        '--inter_op_threads',
+        help="number of threads of the inter-op pool of the engine (zero means one per core)",
+        default=0,
+        type=int)
+    parser.add_argument(
+        '--cpu_affinity',
+        help="comma separated list of the cores to pin the process to (e.g., 0,1,2,3), by default all of them",
+        default='',
+        type=str)
+    parser.add_argument(
+        '--mmap_dir',
+        help="directory of the memory-mapped (scaled) data and masks the generators are trained on, which allows "
+             "tables larger than the memory (by default, the data is kept in memory)",
+        default='',
+        type=str)
+    parser.add_argument(
+        '--save_generator',
+        help="to save each generator (along with the state of its encoders) into the experiments folder, only the "
+             "train-once mode keeps its trained model",
+        choices=['False', 'True'],  # `bool` type does NOT work as expected
+        default='False',  # `bool` type does NOT work as expected
+        type=str)  # `bool` type does NOT work as expected
+    parser.add_argument(
+        '--load_generator',
+        help="to load each generator (along with the state of its encoders) that was saved into the experiments folder "
+             "rather than creating a new one",
+        choices=['False', 'True'],  # `bool` type does NOT work as expected
+        default='False',  # `bool` type does NOT work as expected
+        type=str)  # `bool` type does NOT work as expected
     parser.add_argument(
         '--verbose',
         help="to control verbosity",
@@ -67,10 +67,12 @@ __email__ = 'tada.science@gmail.com'
 __version__ = '1.0.2'
 
 from purify.encoders.encoders import label_encoders_fit_transform, label_encoders_inverse_transform
+from purify.encoders.encoders import label_encoders_state, label_encoders_from_state
 from purify.encoders.encoders import get_dummies_fit_transform, get_dummies_inverse_transform
 
 __all__ = (
     'label_encoders_fit_transform', 'label_encoders_inverse_transform',
+    'label_encoders_state', 'label_encoders_from_state',
     'get_dummies_fit_transform', 'get_dummies_inverse_transform'
 )
 
@@ -70,6 +70,7 @@
 # September 2021
 ########################################################################################################################
 
+import numpy as np
 import pandas as pd
 
 from sklearn.preprocessing import LabelEncoder
@@ -77,7 +78,7 @@ from sklearn.preprocessing import LabelEncoder
 from purify.dataset.metadata import Metadata
 from purify.dataset.processors import PostProcessor
 
-from typing import Dict, List, Tuple, Union
+from typing import Any, Dict, List, Tuple, Union
 
 
 # TODO: TURN `label_encoders_fit_transform()` AND `label_encoders_inverse_transform()` MEMBERS OF A CLASS
@@ -167,6 +168,37 @@ def label_encoders_inverse_transform(dataset: str,
     return df
 
 
+def label_encoders_state(label_encoders: Dict[Union[str, int], LabelEncoder]) -> Dict[str, Any]:
+    """Turns the given (fitted) `label_encoders` into a JSON serializable state, i.e., the classes of each one,
+    which is how they are kept along with a saved generator (see `TabularDataGenerator.save()`).
+
+    :param label_encoders: A dictionary that maps each column's name or column's index to an instance of `LabelEncoder`
+    (see `label_encoders_fit_transform()`).
+    :return: The state of the label encoders, which can be depicted as follows:
+    {'label_encoders': [[<column's name> | <column's index>, [<class>, ...]], ...]}
+    (i.e., a list of pairs rather than a dictionary, since JSON would turn the columns' indices into strings).
+    """
+    return {'label_encoders': [[discrete_var, label_encoder.classes_.tolist()]
+                               for discrete_var, label_encoder in label_encoders.items()]}
+
+
+def label_encoders_from_state(encoder_state: Dict[str, Any]) -> Dict[Union[str, int], LabelEncoder]:
+    """Turns the given state (see `label_encoders_state()`) back into fitted label encoders.
+
+    :param encoder_state: The state of the label encoders, e.g., the `encoder_state` of a loaded generator.
+    :return: A dictionary that maps each column's name or column's index to an instance of `LabelEncoder`,
+    which allows to invert (i.e., to revert) the transformation (see `label_encoders_inverse_transform()`).
+    """
+    label_encoders: Dict[Union[str, int], LabelEncoder] = {}
+
+    if encoder_state is None or 'label_encoders' not in encoder_state:
+        raise ValueError(f"Expecting the state of label encoders but got: {encoder_state}.")
+    for discrete_var, classes in encoder_state['label_encoders']:
+        label_encoders[discrete_var] = LabelEncoder()
+        label_encoders[discrete_var].classes_ = np.asarray(classes)
+    return label_encoders
+
+
 # TODO: TURN `get_dummies_fit_transform()` AND `get_dummies_inverse_transform()` MEMBERS OF A CLASS
 def get_dummies_fit_transform(data: pd.DataFrame,
                               discrete_vars: Union[List[str], List[int]],
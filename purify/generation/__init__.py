@@ -62,11 +62,10 @@
 # September 2021
 ########################################################################################################################
 
-from purify.generation.tabulator import tabulator
-from purify.generation.tabulator import tabulator_CP
-from purify.generation.tabulator import tabulator_GP
 from purify.generation.tabulator import TabularDataGenerator
 
+from typing import Any
+
 __all__ = (
     'tabulator',
     'tabulator_CP',
@@ -74,3 +73,12 @@ __all__ = (
     'TabularDataGenerator'
 )
 
+
+def __getattr__(name: str) -> Any:
+    # the facades of the session engine are imported lazily, i.e., TensorFlow is only imported when they are used
+    if name in ('tabulator', 'tabulator_CP', 'tabulator_GP'):
+        from purify.generation import facades
+
+        return getattr(facades, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
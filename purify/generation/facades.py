@@ -0,0 +1,119 @@
+########################################################################################################################
+# Research Centers
+# ----------------
+# Medical Informatics Group
+# BIH - Berlin Institute of Health
+# Charité - Universitätsmedizin Berlin
+# https://www.bihealth.org/en/research/research-groups/fabian-prasser/
+#
+# Centro ALGORITMI - School of Engineering – University of Minho
+# Braga - Portugal
+# http://algoritmi.uminho.pt/
+#
+#
+# Description
+# -----------
+# This module holds the facades of the SGAIN, WSGAIN-CP and WSGAIN-GP algorithms that are used by tabulator on
+# the session engine (see `purify.generation.tabulator.TabularDataGenerator`).
+# They live apart from tabulator such that tabulator only imports TensorFlow when the session engine is used.
+#
+#
+# Moto
+# ----
+# "We think too much and feel too little. More than machinery we need humanity."
+#                         -- Excerpt of the final speech from The Great Dictator
+#
+#
+# Authors
+# -------
+# diogo telmo neves -- {dneves@di.uminho.pt, diogo-telmo.neves@charite.de, tada.science@gmail.com}
+#
+#
+# Copyright
+# ---------
+# Copyright (c) 2021 diogo telmo neves.
+# All rights reserved.
+#
+#
+# Conditions
+# ----------
+# This code is free/open source code but the following conditions must be met:
+#   * Redistributions of source code must retain the above copyright notice, this list of conditions and
+#     the following disclaimer in the documentation and/or other materials provided with the distribution.
+#   * Redistributions in binary form must reproduce the above copyright notice, this list of conditions and
+#     the following disclaimer in the documentation and/or other materials provided with the distribution.
+#
+#
+# DISCLAIMER
+# ----------
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND
+# FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR
+# TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#
+# Date
+# ----
+# October 2026
+########################################################################################################################
+
+import numpy as np
+
+from purify.imputation.gain import SGAIN, WSGAIN_CP, WSGAIN_GP
+
+from typing import Any, Dict
+
+
+class tabulator(SGAIN):
+    """This class is a facade of the SGAIN algorithm [1, 2].
+
+    References
+    ----------
+    [1] Diogo Telmo Neves, João Alves, Marcel Ganesh Naik, Alberto José Proença, Fabian Praßer.
+        "From Missing Data Imputation to Data Generation."
+        Journal of Computational Science (JCS), 2022.
+    [2] Diogo Telmo Neves, Marcel Ganesh Naik, Alberto Proença.
+        "SGAIN, WSGAIN-CP and WSGAIN-GP: Novel GAN Methods for Missing Data Imputation."
+        International Conference on Computational Science (ICCS), 2021.
+    """
+    def __init__(self, data: np.ndarray, algo_parameters: Dict[str, Any] = {}):
+        super().__init__(data=data, algo_parameters=algo_parameters)
+
+
+class tabulator_CP(WSGAIN_CP):
+    """This class is a facade of the WSGAIN-CP algorithm [1, 2].
+
+    References
+    ----------
+    [1] Diogo Telmo Neves, João Alves, Marcel Ganesh Naik, Alberto José Proença, Fabian Praßer.
+        "From Missing Data Imputation to Data Generation."
+        Journal of Computational Science (JCS), 2022.
+    [2] Diogo Telmo Neves, Marcel Ganesh Naik, Alberto Proença.
+        "SGAIN, WSGAIN-CP and WSGAIN-GP: Novel GAN Methods for Missing Data Imputation."
+        International Conference on Computational Science (ICCS), 2021.
+    """
+
+    def __init__(self, data: np.ndarray, algo_parameters: Dict[str, Any] = {}):
+        super().__init__(data=data, algo_parameters=algo_parameters)
+
+
+class tabulator_GP(WSGAIN_GP):
+    """This class is a facade of the WSGAIN-GP algorithm [1, 2].
+
+    References
+    ----------
+    [1] Diogo Telmo Neves, João Alves, Marcel Ganesh Naik, Alberto José Proença, Fabian Praßer.
+        "From Missing Data Imputation to Data Generation."
+        Journal of Computational Science (JCS), 2022.
+    [2] Diogo Telmo Neves, Marcel Ganesh Naik, Alberto Proença.
+        "SGAIN, WSGAIN-CP and WSGAIN-GP: Novel GAN Methods for Missing Data Imputation."
+        International Conference on Computational Science (ICCS), 2021.
+    """
+
+    def __init__(self, data: np.ndarray, algo_parameters: Dict[str, Any] = {}):
+        super().__init__(data=data, algo_parameters=algo_parameters)
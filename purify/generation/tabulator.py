@@ -103,85 +103,254 @@
 ########################################################################################################################
 
 import numpy as np
+import pandas as pd
 
-from purify.imputation.gain import SGAIN, WSGAIN_CP, WSGAIN_GP
-
-import random
+from purify.imputation.base import BaseSGAIN
+from purify.imputation.mask import Mask
 
+import importlib
+import json
 import math
+import multiprocessing
+import os
+import shutil
+import tempfile
+
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 
-from typing import Any, Callable, Dict, List, Tuple
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Tuple
 
 
-class tabulator(SGAIN):
-    """This class is a facade of the SGAIN algorithm [1, 2].
+def _amputate_and_impute(algo: Callable[[np.ndarray, Dict[str, Any]], BaseSGAIN],
+                         data: np.ndarray,
+                         algo_parameters: Dict[str, Any],
+                         mask: Mask,
+                         seed: int,
+                         rows: np.ndarray = None,
+                         warm_state: Dict[str, Dict[str, np.ndarray]] = None,
+                         keep_state: bool = False) -> Tuple[np.ndarray, Dict[str, Dict[str, np.ndarray]]]:
+    """Executes one amputation round, i.e., ampute the cells of `data` marked by `mask` and
+    impute them with a new model (seeded by `seed`).
+    If `rows` is given, the model is still trained on the whole amputated data, but only those rows are imputed.
+    If `warm_state` is given, the model resumes the training of the model of a previous round (see
+    `BaseSGAIN.warm_state()`) rather than starting from scratch.
+    If `mmap_data` is given (see `TabularDataGenerator`), the model attaches to the data mapped once per generator and
+    hides the cells of `mask` (see `BaseSGAIN.amputate()`), thus the round holds no (dense) copy of the data.
 
-    References
-    ----------
-    [1] Diogo Telmo Neves, João Alves, Marcel Ganesh Naik, Alberto José Proença, Fabian Praßer.
-        "From Missing Data Imputation to Data Generation."
-        Journal of Computational Science (JCS), 2022.
-    [2] Diogo Telmo Neves, Marcel Ganesh Naik, Alberto Proença.
-        "SGAIN, WSGAIN-CP and WSGAIN-GP: Novel GAN Methods for Missing Data Imputation."
-        International Conference on Computational Science (ICCS), 2021.
+    Returns
+    -------
+    Tuple[np.ndarray, Dict[str, Dict[str, np.ndarray]]]
+        The imputed values of the amputated cells (i.e., a flat array with one value per `True` cell of `mask`,
+        or of `mask[rows]` if `rows` is given) and, if `keep_state`, the warm state of the trained model.
     """
-    def __init__(self, data: np.ndarray, algo_parameters: Dict[str, Any] = {}):
-        super().__init__(data=data, algo_parameters=algo_parameters)
+    model: BaseSGAIN
+    values: np.ndarray
+
+    if algo_parameters.get('mmap_data') is None:
+        # for each round there is the need of using a fresh copy of the original data
+        # (i.e., the synthetic data will always be generated from the original data)
+        # additionally, after the preprocessing stage, the original data is only composed by numeric data
+        # (i.e., each variable is either an `int` or a `float` data type) yet there is the need to ensure
+        # that it is only a `float` data type, otherwise there will be a data type mismatch
+        # when introducing missing values into an `int` variable (float32 is the precision of the models)
+        data = data.astype(dtype=np.float32)
+        data[mask.unpack()] = np.NaN  # ampute the cells marked by the mask
+    else:
+        data = None
+    with algo(data=data, algo_parameters={**algo_parameters, 'seed': seed}) as model:  # frees the model afterwards
+        if data is None:
+            model.amputate(ampu_mask=mask)
+        if warm_state is not None:
+            model.warm_start(state=warm_state)
+        values = _imputed_values(model=model.fit(), mask=mask, rows=rows)
+        warm_state = model.warm_state() if keep_state else None
+    return values, warm_state
 
 
-class tabulator_CP(WSGAIN_CP):
-    """This class is a facade of the WSGAIN-CP algorithm [1, 2].
+def _imputed_values(model: BaseSGAIN, mask: Mask, rows: np.ndarray = None) -> np.ndarray:
+    """Imputes the cells marked by `mask` (of the given `rows`, by default all of them) with a trained `model`,
+    chunk by chunk of rows (see `BaseSGAIN.chunk_rows`), thus only a chunk of the imputed data is held in memory.
 
-    References
-    ----------
-    [1] Diogo Telmo Neves, João Alves, Marcel Ganesh Naik, Alberto José Proença, Fabian Praßer.
-        "From Missing Data Imputation to Data Generation."
-        Journal of Computational Science (JCS), 2022.
-    [2] Diogo Telmo Neves, Marcel Ganesh Naik, Alberto Proença.
-        "SGAIN, WSGAIN-CP and WSGAIN-GP: Novel GAN Methods for Missing Data Imputation."
-        International Conference on Computational Science (ICCS), 2021.
+    Returns
+    -------
+    np.ndarray
+        The imputed values, a flat array with one value per `True` cell of `mask` (or of `mask[rows]`).
     """
+    rows = np.arange(model.n_obs) if rows is None else rows
 
-    def __init__(self, data: np.ndarray, algo_parameters: Dict[str, Any] = {}):
-        super().__init__(data=data, algo_parameters=algo_parameters)
+    return np.concatenate([model.impute_many(ampu_masks=[None], rows=rows[start:(start + model.chunk_rows)])[0][
+                               mask.unpack(rows=rows[start:(start + model.chunk_rows)])]
+                           for start in range(0, len(rows), model.chunk_rows)])
 
 
-class tabulator_GP(WSGAIN_GP):
-    """This class is a facade of the WSGAIN-GP algorithm [1, 2].
+def _amputate_and_impute_rounds(algo: Callable[[np.ndarray, Dict[str, Any]], BaseSGAIN],
+                                data: np.ndarray,
+                                algo_parameters: Dict[str, Any],
+                                plan: List[Tuple[Mask, int]],
+                                rows: np.ndarray = None) -> Iterator[np.ndarray]:
+    """Executes, in order, the amputation rounds of a `plan` and yields the imputed values of each round,
+    see `_amputate_and_impute()`. If `warm_start` is set (see `TabularDataGenerator`), each round resumes the training
+    of the previous one, i.e., its weights and the state of its optimizers, for `warm_iterations` iterations only.
+    """
+    if 'ensemble' in algo_parameters and algo_parameters['ensemble']:
+        yield from _amputate_and_impute_ensemble(data=data, algo_parameters=algo_parameters, plan=plan, rows=rows)
+        return
+    warm_start: bool = algo_parameters['warm_start'] if 'warm_start' in algo_parameters else False
+    warm_iterations: int = algo_parameters['warm_iterations'] if 'warm_iterations' in algo_parameters \
+        else max(1, (algo_parameters['n_iterations'] if 'n_iterations' in algo_parameters else 1000) // 4)
+    warm_state: Dict[str, Dict[str, np.ndarray]] = None
+    values: np.ndarray
+
+    for mask, seed in plan:
+        values, warm_state = _amputate_and_impute(
+            algo=algo, data=data,
+            algo_parameters=algo_parameters if warm_state is None else {**algo_parameters,
+                                                                        'n_iterations': warm_iterations},
+            mask=mask, seed=seed, rows=rows, warm_state=warm_state, keep_state=warm_start)
+        yield values
 
-    References
-    ----------
-    [1] Diogo Telmo Neves, João Alves, Marcel Ganesh Naik, Alberto José Proença, Fabian Praßer.
-        "From Missing Data Imputation to Data Generation."
-        Journal of Computational Science (JCS), 2022.
-    [2] Diogo Telmo Neves, Marcel Ganesh Naik, Alberto Proença.
-        "SGAIN, WSGAIN-CP and WSGAIN-GP: Novel GAN Methods for Missing Data Imputation."
-        International Conference on Computational Science (ICCS), 2021.
+
+def _amputate_and_impute_ensemble(data: np.ndarray,
+                                  algo_parameters: Dict[str, Any],
+                                  plan: List[Tuple[Mask, int]],
+                                  rows: np.ndarray = None) -> List[np.ndarray]:
+    """Executes the amputation rounds of a `plan` at once, i.e., an ensemble of one SGAIN replica per round, each one
+    trained on its own amputation of the data, is trained by a single batched step (see
+    `purify.imputation.ensemble.SGAINEnsemble`), which is seeded by the seed of the first round.
+
+    Returns
+    -------
+    List[np.ndarray]
+        The imputed values of the amputated cells of each round, as `_amputate_and_impute()` does.
     """
+    masks: List[Mask] = [mask for mask, _ in plan]
+    model: BaseSGAIN
+
+    with _import(name='purify.imputation.ensemble.SGAINEnsemble')(
+            data=data.astype(dtype=np.float32), algo_parameters={**algo_parameters, 'seed': plan[0][1]},
+            ampu_masks=masks) as model:
+        imputed: np.ndarray = model.fit().impute_many(
+            ampu_masks=masks if rows is None else [mask[rows] for mask in masks], rows=rows)
+    return [imputed_data[mask.unpack(rows=rows)] for imputed_data, mask in zip(imputed, masks)]
+
+
+def _import(name: str) -> Any:
+    """Imports an attribute (e.g., a class) given its qualified name, e.g., `purify.imputation.gain_torch.SGAIN`."""
+    module, _, attribute = name.rpartition('.')
+    return getattr(importlib.import_module(name=module), attribute)
+
+
+def __getattr__(name: str) -> Any:
+    # the facades of the session engine used to live in this module, thus they are still reachable from here,
+    # yet imported lazily, i.e., only when they are used (see `purify.generation.facades`)
+    if name in ('tabulator', 'tabulator_CP', 'tabulator_GP'):
+        return _import(name=f"purify.generation.facades.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+_worker: Dict[str, Any] = {}
+"""The state of a worker process of the pool, it is set once per worker to avoid shipping the data with each task."""
+
+
+def _init_worker(algo: Callable[[np.ndarray, Dict[str, Any]], BaseSGAIN],
+                 data: np.ndarray,
+                 algo_parameters: Dict[str, Any]) -> None:
+    # each worker pins itself once, before any model (i.e., any thread pool of the engine) is created
+    BaseSGAIN.pin(cpu_affinity=algo_parameters['cpu_affinity'] if 'cpu_affinity' in algo_parameters else None)
+    _worker.update(algo=algo, data=data, algo_parameters=algo_parameters)
+
 
-    def __init__(self, data: np.ndarray, algo_parameters: Dict[str, Any] = {}):
-        super().__init__(data=data, algo_parameters=algo_parameters)
+def _execute_rounds(plan: List[Tuple[Mask, int]], rows: np.ndarray = None) -> List[np.ndarray]:
+    return list(_amputate_and_impute_rounds(
+        algo=_worker['algo'], data=_worker['data'], algo_parameters=_worker['algo_parameters'], plan=plan, rows=rows))
 
 
 class TabularDataGenerator:
 
-    TABULAR_DATA_GENERATORS: Dict[str, Callable[[np.ndarray, Dict[str, Any]], np.ndarray]] = {
-        'tabulator': tabulator,
-        'tabulator-CP': tabulator_CP,
-        'tabulator-GP': tabulator_GP
-    }
+    FORMAT_VERSION: int = 1
+    """The version of the format of the files written by `save()`."""
+
+    TABULAR_DATA_GENERATORS: Tuple[str, ...] = ('tabulator', 'tabulator-CP', 'tabulator-GP')
     """The supported tabular data generators."""
 
+    HOST_PARAMETERS: Tuple[str, ...] = (*BaseSGAIN.HOST_PARAMETERS, 'n_jobs')
+    """The algorithm parameters that are settings of the host rather than of the generator, which `save()` leaves
+    out (see `BaseSGAIN.HOST_PARAMETERS`)."""
+
+    ENGINES: Dict[str, Dict[str, str]] = {
+        'session': {
+            'tabulator': 'purify.generation.facades.tabulator',
+            'tabulator-CP': 'purify.generation.facades.tabulator_CP',
+            'tabulator-GP': 'purify.generation.facades.tabulator_GP'
+        },
+        'tf2': {
+            'tabulator': 'purify.imputation.gain_tf2.SGAIN',
+            'tabulator-CP': 'purify.imputation.gain_tf2.WSGAIN_CP',
+            'tabulator-GP': 'purify.imputation.gain_tf2.WSGAIN_GP'
+        },
+        'torch': {
+            'tabulator': 'purify.imputation.gain_torch.SGAIN',
+            'tabulator-CP': 'purify.imputation.gain_torch.WSGAIN_CP',
+            'tabulator-GP': 'purify.imputation.gain_torch.WSGAIN_GP'
+        }
+    }
+    """The engines that implement the tabular data generators, i.e., the TensorFlow 1 (compat) graphs and sessions
+    (see `purify.imputation.gain`), the TensorFlow 2 compiled (XLA) training steps (see `purify.imputation.gain_tf2`)
+    and PyTorch (see `purify.imputation.gain_torch`). The classes are given by their qualified names and imported
+    lazily, thus only the framework of the engine in use is imported (e.g., the 'torch' one does NOT import TensorFlow).
+    """
+
     def __init__(self, data: np.ndarray, algo: str = 'tabulator', algo_parameters: Dict[str, Any] = {}):
-        self.data: np.ndarray = data.copy()  # to NOT mess up with the given `data`
+        # if `mmap_dir` is given, the data is scaled and mapped only once (see `_map()`) into that directory, unless
+        # it is already mapped (i.e., `mmap_data`, see `BaseSGAIN.map_data()`), and every model (of every round and
+        # of every worker process) attaches to that single copy, thus the given `data` is neither copied nor shipped
+        self.mmap_dir: str = algo_parameters['mmap_dir'] if 'mmap_dir' in algo_parameters else None
+        self.mmap_data: str = algo_parameters['mmap_data'] if 'mmap_data' in algo_parameters else None
+        self.mmap_path: str = None
+        self.data: np.ndarray = data if self.mmap_dir is not None or self.mmap_data is not None else \
+            data.copy()  # to NOT mess up with the given `data`
         # if algo not in Generator.GENERATORS:
         #     raise ValueError("Expecting one of the supported tabular data generators -- "
         #                      f"{' ,'.join([TabularDataGenerator.TABULAR_DATA_GENERATORS])} -- "
         #                      f"as the algorithm to be used for tabular data generation but got: {algo}.")
-        self.algo: Callable[[np.ndarray, Dict[str, Any]], np.ndarray] = \
-            TabularDataGenerator.TABULAR_DATA_GENERATORS[algo] \
-                if algo in TabularDataGenerator.TABULAR_DATA_GENERATORS else tabulator
+        self.algo_name: str = algo if algo in TabularDataGenerator.TABULAR_DATA_GENERATORS else 'tabulator'
+        self.engine: str = algo_parameters['engine'] if 'engine' in algo_parameters else 'session'
+        if self.engine not in TabularDataGenerator.ENGINES:
+            raise ValueError(f"Expecting one of the supported engines -- {', '.join(TabularDataGenerator.ENGINES)} -- "
+                             f"but got: {self.engine}.")
+        self.algo: Callable[[np.ndarray, Dict[str, Any]], BaseSGAIN] = _import(
+            name=TabularDataGenerator.ENGINES[self.engine][self.algo_name])
         self.algo_parameters: Dict[str, Any] = algo_parameters
+        # if True, a single model is trained on the (whole) data with amputation masks that are re-drawn for each
+        # mini-batch, which then imputes every amputation round (and every call of `sampler()`) by inference only,
+        # otherwise a new model is trained for each amputation round
+        self.train_once: bool = algo_parameters['train_once'] if 'train_once' in algo_parameters else False
+        # if True, each amputation round of a run resumes the training of the previous round (i.e., its weights and
+        # the state of its optimizers) for `warm_iterations` iterations (by default, a quarter of `n_iterations`)
+        # rather than training a new model from scratch, thus the rounds of a run are executed one after the other
+        self.warm_start: bool = algo_parameters['warm_start'] if 'warm_start' in algo_parameters else False
+        # if True, the amputation rounds of a run are trained at once, as the replicas of an ensemble (i.e., stacked
+        # weights and batched matrix multiplications, see `purify.imputation.ensemble`) on the TensorFlow 2 engine
+        self.ensemble: bool = algo_parameters['ensemble'] if 'ensemble' in algo_parameters else False
+        if self.ensemble and self.algo_name != 'tabulator':
+            raise ValueError(f"Expecting the 'tabulator' algorithm for an ensemble but got: {self.algo_name}.")
+        if self.ensemble and (self.mmap_dir is not None or self.mmap_data is not None):
+            raise ValueError(f"Expecting the data of an ensemble in memory but got it memory-mapped in: "
+                             f"{self.mmap_dir or self.mmap_data}.")
+        # the number of rows that are written back at once (see `_execute()`)
+        self.chunk_rows: int = algo_parameters['chunk_rows'] if 'chunk_rows' in algo_parameters else 2 ** 16
+        self.model: BaseSGAIN = None
+        # the (JSON serializable) state of the encoders of the data, if any, it is kept along with a saved generator
+        self.encoder_state: Dict[str, Any] = None
+        # number of worker processes that execute the amputation rounds, a non-positive value means all the CPUs,
+        # each one is pinned to the cores given by `cpu_affinity` (if any, see `BaseSGAIN.pin()`)
+        self.n_jobs: int = algo_parameters['n_jobs'] if 'n_jobs' in algo_parameters else 1
+        self.n_jobs = self.n_jobs if self.n_jobs > 0 else os.cpu_count()
+        # drives the amputation plans as well as the seeds of the rounds, thus a given seed makes the generator
+        # reproducible regardless of the number of worker processes
+        self.rng: np.random.Generator = np.random.default_rng(
+            seed=algo_parameters['seed'] if 'seed' in algo_parameters else None)
         ################################################################################################################
         # TODO: VERIFY IF THIS CAN BE REMOVED --> LOOK AT THE `SGAIN` IMPLEMENTATION
         self.verbose: bool = algo_parameters['verbose'] if 'verbose' in algo_parameters else False
@@ -189,49 +358,134 @@ class TabularDataGenerator:
         self.dim: int = self.data.shape[1]
         ################################################################################################################
 
-    def _execute(self, n_samples: int = 100) -> np.ndarray:
-        # TODO: THIS ALGORITHM IS EXTREMELY SLOW DUE TO ITERATIONS OVER THE CELLS OF THE pandas DataFrame
-        #       POSSIBLE OPTIMIZATIONS ARE:
-        #           1. CHANGE THE ORDER OF LOOPS FOM ROW..COLUMN TO COLUMN..ROW
-        #           2. USE MASK MATRICES AND "LINEAR ALGEBRA"
-        #           3. USE DICTIONARIES AND SORTING
-        synthetic_data: np.ndarray = self.data.copy()
-        indices: Dict[int, Tuple[int, int]] = {}
-        row: int
-        col: int
-        key: int = 0
+    def __enter__(self) -> 'TabularDataGenerator':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Closes the trained model of the train-once mode, if any (the models of the rounds are closed right away),
+        and removes the data mapped by the generator, if any (see `_map()`).
+        """
+        if self.model is not None:
+            self.model.close()
+            self.model = None
+        if self.mmap_path is not None:
+            shutil.rmtree(path=self.mmap_path, ignore_errors=True)
+            self.mmap_path = None
+            self.mmap_data = None
+
+    def _map(self) -> str:
+        """Maps the data into a new directory within `mmap_dir` (see `BaseSGAIN.map_data()`), once per generator,
+        unless it is already mapped (see `mmap_data`) or NOT memory-mapped at all.
+
+        Returns
+        -------
+        str
+            The directory of the mapped data, if any, which the models attach to (see `BaseSGAIN.attach()`).
+        """
+        if self.mmap_data is None and self.mmap_dir is not None:
+            os.makedirs(name=self.mmap_dir, exist_ok=True)
+            self.mmap_path = tempfile.mkdtemp(prefix='tabulator-', dir=self.mmap_dir)
+            BaseSGAIN.map_data(data=self.data, path=self.mmap_path, chunk_rows=self.chunk_rows)
+            self.mmap_data = self.mmap_path
+        return self.mmap_data
+
+    def _model_parameters(self) -> Dict[str, Any]:
+        """Returns the algorithm parameters of the models, i.e., the ones of the generator along with the directory
+        of the mapped data, if any (see `_map()`).
+        """
+        mmap_data: str = self._map()
+
+        return self.algo_parameters if mmap_data is None else {**self.algo_parameters, 'mmap_data': mmap_data}
+
+    def _seed(self) -> int:
+        return int(self.rng.integers(low=0, high=2 ** 31 - 1))
+
+    def _plan(self, rows: np.ndarray = None) -> List[Mask]:
+        """Plans the amputation rounds of one run of the generator.
+        A single permutation of the flat indices of the cells is drawn and split into consecutive slices of
+        `ceil(n_obs * dim * miss_rate)` cells, each slice is then turned into a (bit-packed) amputation mask.
+        Therefore, the masks are pairwise disjoint and, altogether, they cover every cell exactly once.
+        If `rows` is given (i.e., a partial run), only the cells of those rows are planned, in slices of the same
+        size, thus a few rows take `ceil(len(rows) * dim / k)` rounds (usually one) rather than a whole run.
+
+        Returns
+        -------
+        List[Mask]
+            A list of `ceil(1 / miss_rate)` (approximately, or fewer for a partial run) bit-packed masks of shape
+            `(n_obs, dim)`, where `True` marks a cell to be amputated (and, later on, imputed) in the respective round.
+            Only one boolean mask is held in memory at a time, while it is being packed.
+        """
+        n_cells: int = self.n_obs * self.dim
+        k: int = max(1, min(int(math.ceil(n_cells * self.algo_parameters['miss_rate'])), n_cells))
+        cells: np.ndarray = self.rng.permutation(n_cells) if rows is None else self.rng.permutation(
+            (np.asarray(rows)[:, np.newaxis] * self.dim + np.arange(self.dim)).ravel())
+        masks: List[Mask] = []
+
+        for start in range(0, len(cells), k):
+            mask: np.ndarray = np.zeros(shape=n_cells, dtype=bool)
+
+            mask[cells[start:(start + k)]] = True
+            masks.append(Mask.pack(mask=mask.reshape(self.n_obs, self.dim)))
+        return masks
+
+    def _fit(self) -> BaseSGAIN:
+        """Trains, only once, the model that serves every amputation round in the train-once mode."""
+        if self.model is None:
+            algo_parameters: Dict[str, Any] = self._model_parameters()
+
+            self.model = self.algo(
+                data=None if 'mmap_data' in algo_parameters else self.data.astype(dtype=np.float32),
+                algo_parameters={**algo_parameters,
+                                 'ampu_rate': self.algo_parameters['miss_rate'], 'seed': self._seed()}).fit()
+        return self.model
+
+    def _values(self, plan: List[Tuple[Mask, int]], rows: np.ndarray = None) -> Iterator[np.ndarray]:
+        """Executes, in this process, the amputation rounds of one run and yields the imputed values of each round,
+        see `_amputate_and_impute()`.
+        """
+        masks: List[Mask] = [mask if rows is None else mask[rows] for mask, _ in plan]
+        mask: Mask
+        seed: int
+
+        if self.train_once:  # inference only, all the rounds are imputed by a single (batched) forward pass
+            yield from (imputed_data[mask.unpack()] for imputed_data, mask in zip(
+                self._fit().impute_many(ampu_masks=masks, rows=rows), masks))
+        else:
+            yield from _amputate_and_impute_rounds(
+                algo=self.algo, data=self.data, algo_parameters=self._model_parameters(), plan=plan, rows=rows)
+
+    def _execute(self,
+                 plan: List[Tuple[Mask, int]],
+                 values: Iterable[np.ndarray],
+                 rows: np.ndarray = None,
+                 n_samples: int = 100) -> np.ndarray:
+        """Writes back the imputed values of each amputation round of one run, in the order of its `plan`.
+        If `rows` is given, the run is a partial one, i.e., only those rows are generated.
+        The (bit-packed) mask of each round is unpacked chunk by chunk of rows while its values are written back.
+        """
+        synthetic_data: np.ndarray = np.array(self.data) if rows is None else self.data[rows, :]
+        chunk_rows: int = self.chunk_rows
+        mask: Mask
+        value: np.ndarray
 
         self.verbose = True
 
-        for row in range(self.n_obs):
-            for col in range(self.dim):
-                indices[key] = (row, col)
-                key += 1
         if self.verbose:
             print()
             print("purify.generation.tabulator.TabularDataGenerator :: _execute()")
-        while indices:
-            indices_sample: List[int] = random.sample(
-                population=list(indices.keys()),
-                k=min(int(math.ceil(self.n_obs * self.dim * self.algo_parameters['miss_rate'])), len(indices)))
-            # for each run there is the need of using a fresh copy of the original data
-            # (i.e., the synthetic data will always be generated from the original data)
-            # additionally, after the preprocessing stage, the original data is only composed by numeric data
-            # (i.e., each variable is either an `int` or a `float` data type) yet there is the need to ensure
-            # that it is only a `float` data type, otherwise there will be a data type mismatch
-            # when introducing missing values into an `int` variable
-            data: np.ndarray = self.data.copy().astype(dtype=float)
-            positions: List[int, int] = []
-
-            # remove each index in `indices_sample` from `indices` and
-            # perform the amputation of the `data` (i.e., of the numpy ndarray)
-            for index in indices_sample:
-                row, col = indices.pop(index)   # remove the index
-                data[row, col] = np.NaN         # ampute the cell mapped by the index
-                positions.append((row, col))
-            data = self.algo(data=data, algo_parameters=self.algo_parameters).execute()
-            for row, col in positions:
-                synthetic_data[row, col] = data[row, col]
+        for (mask, _), value in zip(plan, values):
+            mask = mask if rows is None else mask[rows]
+            offset: int = 0  # the values are in the (row-major) order of the cells of the mask
+
+            for start in range(0, len(mask), chunk_rows):
+                cells: np.ndarray = mask.unpack(rows=slice(start, start + chunk_rows))
+                n_cells: int = int(np.count_nonzero(cells))
+
+                synthetic_data[start:(start + chunk_rows)][cells] = value[offset:(offset + n_cells)]
+                offset += n_cells
             if self.verbose:
                 print()
                 print(f"first {min(5, n_samples)} row(s) of synthetic data:")
@@ -243,17 +497,219 @@ class TabularDataGenerator:
 
         return synthetic_data
 
-    def sampler(self, n_samples: int = 100) -> np.ndarray:
-        synthetic_data_list: List[np.ndarray] = [
-            self._execute(n_samples=n_samples) for _ in range(n_samples // self.n_obs)]
+    def _plans(self, n_runs: int, rows: np.ndarray = None) \
+            -> Iterator[Tuple[List[Tuple[Mask, int]], np.ndarray]]:
+        """Yields, one at a time, the plans of `n_runs` runs, i.e., the amputation masks of each run along with
+        the seeds of its rounds, followed by the plan of a partial run if `rows` is given (see `_execute()`).
+        The plan of a partial run only amputes the cells of the given `rows` (see `_plan()`), thus its cost scales
+        with the number of rows rather than with the whole data (each of its rounds still trains on the whole data).
+        """
+        for _ in range(n_runs):
+            yield [(mask, self._seed()) for mask in self._plan()], None
+        if rows is not None:
+            yield [(mask, self._seed()) for mask in self._plan(rows=rows)], rows
+
+    def _worker_parameters(self) -> Dict[str, Any]:
+        """Returns the algorithm parameters of the worker processes of the pool (see `_runs()`), i.e., the ones of
+        the models (see `_model_parameters()`), thus the workers attach to the mapped data (if any). The workers share
+        the cores, thus unless told otherwise (i.e., a thread count is either absent or zero, which is the default of
+        the engine) each one gets its share of these rather than (intra-op) pools of one thread per core,
+        which would oversubscribe them `n_jobs`-fold.
+        """
+        intra_op_threads: int = self.algo_parameters['intra_op_threads'] if 'intra_op_threads' in self.algo_parameters \
+            else 0
+        inter_op_threads: int = self.algo_parameters['inter_op_threads'] if 'inter_op_threads' in self.algo_parameters \
+            else 0
+
+        return {**self._model_parameters(),
+                'intra_op_threads': intra_op_threads if intra_op_threads > 0 else max(1, os.cpu_count() // self.n_jobs),
+                'inter_op_threads': inter_op_threads if inter_op_threads > 0 else 1}
+
+    def _runs(self, n_runs: int, rows: np.ndarray = None, n_samples: int = 100) -> Iterator[np.ndarray]:
+        """Yields, in order, the synthetic data of `n_runs` runs of the generator, followed by the synthetic data of
+        the given `rows` (if any), which is generated by a partial run.
+        The runs, as well as the amputation rounds of each run, are independent from each other, therefore,
+        if `n_jobs > 1` then the rounds of the runs are executed by a pool of worker processes,
+        each one with its own TensorFlow session (except in the train-once mode, which is served by inference only).
+        Every round gets its own seed when planned, and the rounds are written back in the order of the plans,
+        thus the synthetic data does not depend on the scheduling of the pool. In the warm-start (and the ensemble)
+        mode the rounds of a run are trained together, hence each run (rather than each round) is a task of the pool.
+        Either way, the runs are planned lazily and at most `n_jobs` runs are in flight, which bounds the memory.
+        """
+        plan: List[Tuple[Mask, int]]
+        rows_run: np.ndarray
+        futures_run: List[Future]
+
+        if self.n_jobs > 1 and not self.train_once:
+            worker_parameters: Dict[str, Any] = self._worker_parameters()
+
+            # `spawn` since TensorFlow does NOT cope with forked processes
+            with ProcessPoolExecutor(max_workers=self.n_jobs,
+                                     mp_context=multiprocessing.get_context(method='spawn'),
+                                     initializer=_init_worker,
+                                     initargs=(self.algo, None if 'mmap_data' in worker_parameters else self.data,
+                                               worker_parameters)) as executor:
+                in_flight: Deque[Tuple[List[Tuple[Mask, int]], np.ndarray, List[Future]]] = deque()
+
+                for plan, rows_run in self._plans(n_runs=n_runs, rows=rows):
+                    in_flight.append((plan, rows_run, [executor.submit(_execute_rounds, plan, rows_run)]
+                                      if self.warm_start or self.ensemble else
+                                      [executor.submit(_execute_rounds, [(mask, seed)], rows_run)
+                                       for mask, seed in plan]))
+                    if len(in_flight) > self.n_jobs:
+                        plan, rows_run, futures_run = in_flight.popleft()
+                        yield self._execute(plan=plan, values=(value for future in futures_run
+                                                               for value in future.result()),
+                                            rows=rows_run, n_samples=n_samples)
+                while in_flight:
+                    plan, rows_run, futures_run = in_flight.popleft()
+                    yield self._execute(plan=plan, values=(value for future in futures_run
+                                                           for value in future.result()),
+                                        rows=rows_run, n_samples=n_samples)
+        else:
+            for plan, rows_run in self._plans(n_runs=n_runs, rows=rows):
+                yield self._execute(
+                    plan=plan, values=self._values(plan=plan, rows=rows_run), rows=rows_run, n_samples=n_samples)
+
+    def iter_samples(self, n_samples: int = 100, chunk_rows: int = None) -> Iterator[np.ndarray]:
+        """Generates synthetic data as a stream of chunks, i.e., each run of the generator is sliced into chunks
+        as soon as it is produced, thus the memory footprint does not depend on `n_samples`.
+        The `n_samples % n_obs` remaining rows (if any) are drawn at random and generated by a partial run,
+        whose imputation and write-back are restricted to those rows.
+
+        Parameters
+        ----------
+        n_samples : int, optional
+            The number of synthetic observations (i.e., rows) to generate.
+        chunk_rows : int, optional
+            The maximum number of rows of each chunk, by default the number of observations of the data.
+            One should be aware that a chunk never spans two runs, hence a few chunks might be smaller.
+
+        Yields
+        ------
+        np.ndarray
+            The next chunk of synthetic data.
+        """
+        chunk_rows = self.n_obs if chunk_rows is None else chunk_rows
+        random_indices: np.ndarray = self.rng.choice(
+            a=self.n_obs, size=(n_samples % self.n_obs), replace=False) if n_samples % self.n_obs > 0 else None
         synthetic_data: np.ndarray
 
-        if n_samples % self.n_obs > 0:
-            random_indices: np.ndarray = np.random.choice(a=self.n_obs, size=(n_samples % self.n_obs), replace=False)
+        for synthetic_data in self._runs(n_runs=(n_samples // self.n_obs), rows=random_indices, n_samples=n_samples):
+            for start in range(0, synthetic_data.shape[0], chunk_rows):
+                yield synthetic_data[start:(start + chunk_rows), :]
+
+    def sample_to_file(self,
+                       path: str,
+                       n_samples: int = 100,
+                       chunk_rows: int = None,
+                       decoder: Callable[[np.ndarray], pd.DataFrame] = None) -> None:
+        """Generates synthetic data straight into a CSV file, chunk by chunk (see `iter_samples()`),
+        thus nothing but the current chunk is held in memory.
+
+        Parameters
+        ----------
+        path : str
+            The path of the CSV file, which is overwritten if it already exists.
+        n_samples : int, optional
+            The number of synthetic observations (i.e., rows) to generate.
+        chunk_rows : int, optional
+            The maximum number of rows of each chunk, by default the number of observations of the data.
+        decoder : Callable[[np.ndarray], pd.DataFrame], optional
+            Decodes each chunk into a pandas DataFrame (e.g., inverts the encoding of the discrete variables),
+            by default the chunk is written as it is.
+        """
+        header: bool = True
+        chunk: np.ndarray
+
+        for chunk in self.iter_samples(n_samples=n_samples, chunk_rows=chunk_rows):
+            (pd.DataFrame(data=chunk) if decoder is None else decoder(chunk)).to_csv(
+                path_or_buf=path, mode=('w' if header else 'a'), header=header, index=False)
+            header = False
+
+    def save(self, path: str, encoder_state: Dict[str, Any] = None) -> None:
+        """Saves the generator into a compressed `.npz` file, i.e., its data, its algorithm parameters (but the settings
+        of the host, see `HOST_PARAMETERS`), the state of the encoders of the data and, in the train-once mode,
+        the trained model (see `BaseSGAIN.state()`).
+        Hence, a generator that is loaded in the train-once mode is able to sample without any training. One should
+        be aware that only the train-once mode has a model to persist, in any other mode a model is trained (and then
+        freed) per amputation round, thus a loaded generator trains its rounds anew.
+
+        Parameters
+        ----------
+        path : str
+            The path of the file.
+        encoder_state : Dict[str, Any], optional
+            The (JSON serializable) state of the encoders of the data (e.g., the classes of each label encoder),
+            by default the `encoder_state` of the generator.
+        """
+        encoder_state = self.encoder_state if encoder_state is None else encoder_state
+        state: Dict[str, np.ndarray] = {
+            'format_version': np.array(TabularDataGenerator.FORMAT_VERSION),
+            'algo': np.array(self.algo_name),
+            'algo_parameters': np.array(json.dumps(obj={name: value for name, value in self.algo_parameters.items()
+                                                        if name not in TabularDataGenerator.HOST_PARAMETERS},
+                                                   default=lambda value: value.item())),
+            'encoder_state': np.array(json.dumps(obj=encoder_state, default=lambda value: value.item())),
+            # numeric data only, hence the file is loaded without pickle
+            'data': self.data if self.data.dtype.kind in 'biuf' else self.data.astype(dtype=float)
+        }
+
+        if self.model is not None:
+            state.update({f"model/{name}": value for name, value in self.model.state().items()})
+        np.savez_compressed(file=path, **state)
 
-            # slice from the output of this final run using random indices of it
-            synthetic_data_list.append(self._execute()[random_indices, :])
-        synthetic_data = np.concatenate(synthetic_data_list, axis=0)
+    @classmethod
+    def load(cls, path: str, algo_parameters: Dict[str, Any] = None) -> 'TabularDataGenerator':
+        """Loads a generator that was saved by `save()`.
+
+        Parameters
+        ----------
+        path : str
+            The path of the file.
+        algo_parameters : Dict[str, Any], optional
+            The algorithm parameters that override the saved ones, e.g., the settings of the host (see
+            `HOST_PARAMETERS`), which are NOT saved.
+
+        Returns
+        -------
+        TabularDataGenerator
+            The loaded generator, along with its trained model (if any) and its `encoder_state`.
+        """
+        state: Dict[str, np.ndarray]
+        generator: TabularDataGenerator
+
+        with np.load(file=path, allow_pickle=False) as archive:
+            state = dict(archive)
+        if int(state['format_version']) != TabularDataGenerator.FORMAT_VERSION:
+            raise ValueError(f"Expecting the format version {TabularDataGenerator.FORMAT_VERSION} "
+                             f"but got: {int(state['format_version'])}.")
+        generator = cls(data=state['data'],
+                        algo=str(state['algo']),
+                        algo_parameters={**json.loads(s=str(state['algo_parameters'])),
+                                         **(algo_parameters if algo_parameters is not None else {})})
+        generator.encoder_state = json.loads(s=str(state['encoder_state']))
+        if 'model/format_version' in state:
+            model_parameters: Dict[str, Any] = generator._model_parameters()
+
+            # the model is restored with the settings of this host (e.g., it attaches to the mapped data, if any)
+            generator.model = generator.algo.from_state(
+                state={name[len('model/'):]: value for name, value in state.items() if name.startswith('model/')},
+                data=None if 'mmap_data' in model_parameters else generator.data.astype(dtype=np.float32),
+                algo_parameters={name: value for name, value in model_parameters.items()
+                                 if name in BaseSGAIN.HOST_PARAMETERS})
+        return generator
+
+    def sampler(self, n_samples: int = 100) -> np.ndarray:
+        # the synthetic data is written into a preallocated array, chunk by chunk, rather than concatenating
+        # the runs, which would hold (at least) twice the synthetic data in memory
+        synthetic_data: np.ndarray = np.empty(shape=(n_samples, self.dim), dtype=self.data.dtype)
+        start: int = 0
+        chunk: np.ndarray
+
+        for chunk in self.iter_samples(n_samples=n_samples):
+            synthetic_data[start:(start + chunk.shape[0]), :] = chunk
+            start += chunk.shape[0]
         if self.verbose:
             print()
             print("purify.generation.tabulator.TabularDataGenerator :: sampler()")
@@ -263,4 +719,3 @@ class TabularDataGenerator:
             print("...")
             print(f"shape: {synthetic_data.shape}")
         return synthetic_data
-
@@ -62,9 +62,7 @@
 # September 2021
 ########################################################################################################################
 
-from purify.imputation.gain import SGAIN
-from purify.imputation.gain import WSGAIN_CP
-from purify.imputation.gain import WSGAIN_GP
+from typing import Any
 
 __all__ = (
     'SGAIN',
@@ -72,3 +70,13 @@ __all__ = (
     'WSGAIN_GP'
 )
 
+
+def __getattr__(name: str) -> Any:
+    # the (session engine) algorithms are imported lazily, i.e., TensorFlow is only imported when they are used,
+    # thus the other engines (e.g., `purify.imputation.gain_torch`) can be used without importing TensorFlow
+    if name in __all__:
+        from purify.imputation import gain
+
+        return getattr(gain, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
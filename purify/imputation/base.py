@@ -0,0 +1,873 @@
+########################################################################################################################
+# Research Centers
+# ----------------
+# Medical Informatics Group
+# BIH - Berlin Institute of Health
+# Charité - Universitätsmedizin Berlin
+# https://www.bihealth.org/en/research/research-groups/fabian-prasser/
+#
+# Centro ALGORITMI - School of Engineering – University of Minho
+# Braga - Portugal
+# http://algoritmi.uminho.pt/
+#
+#
+# Description
+# -----------
+# This module holds the backbone of the SGAIN family that does NOT depend on any deep learning framework,
+# i.e., the algorithm parameters, the scaling of the data, the imputation, the persistence and the logging.
+# The engines, i.e., TensorFlow 1 (compat) sessions (see `purify.imputation.gain`), TensorFlow 2 (see
+# `purify.imputation.gain_tf2`) and PyTorch (see `purify.imputation.gain_torch`), only build and train the networks,
+# thus importing this module does NOT import any of those frameworks.
+#
+#
+# Moto
+# ----
+# "We think too much and feel too little. More than machinery we need humanity."
+#                         -- Excerpt of the final speech from The Great Dictator
+#
+#
+# Authors
+# -------
+# diogo telmo neves -- {dneves@di.uminho.pt, diogo-telmo.neves@charite.de, tada.science@gmail.com}
+#
+#
+# Copyright
+# ---------
+# Copyright (c) 2021 diogo telmo neves.
+# All rights reserved.
+#
+#
+# Conditions
+# ----------
+# This code is free/open source code but the following conditions must be met:
+#   * Redistributions of source code must retain the above copyright notice, this list of conditions and
+#     the following disclaimer in the documentation and/or other materials provided with the distribution.
+#   * Redistributions in binary form must reproduce the above copyright notice, this list of conditions and
+#     the following disclaimer in the documentation and/or other materials provided with the distribution.
+#
+#
+# DISCLAIMER
+# ----------
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND
+# FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR
+# TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#
+# Date
+# ----
+# October 2026
+########################################################################################################################
+
+import abc
+
+import numpy as np
+
+from sklearn.preprocessing import MinMaxScaler
+
+from purify.imputation import runtime
+from purify.imputation.mask import Mask
+
+import json
+import logging
+import os
+import shutil
+import tempfile
+
+from tqdm import tqdm
+
+from typing import Any, Callable, Dict, List, Set, Tuple, Union
+
+
+class BaseSGAIN:
+    """This class is an abstract backbone skeleton that specifies what the implementations of the SGAIN family [1]
+    share regardless of their engine, i.e., the algorithm parameters, the scaling of the data, the imputation,
+    the persistence and the logging, whereas each engine builds and trains the networks.
+
+    References
+    ----------
+    [1] Neves, Diogo Telmo, Marcel Ganesh Naik, and Alberto Proença.
+        "SGAIN, WSGAIN-CP and WSGAIN-GP: Novel GAN Methods for Missing Data Imputation."
+        International Conference on Computational Science (ICCS). Springer, Cham, 2021.
+    """
+
+    FORMAT_VERSION: int = 1
+    """The version of the format of the files written by `save()`."""
+
+    WEIGHTS: Tuple[str, ...] = ('G_W1', 'G_b1', 'G_W2', 'G_b2', 'D_W1', 'D_b1', 'D_W2', 'D_b2')
+    """The names of the weights of the generator and of the discriminator (or critic)."""
+
+    SCALER_ATTRIBUTES: Tuple[str, ...] = ('min_', 'scale_', 'data_min_', 'data_max_', 'data_range_', 'n_samples_seen_')
+    """The fitted attributes of the `MinMaxScaler`."""
+
+    LOSSES: Tuple[str, ...] = ('D_loss', 'G_loss', 'MSE_loss', 'CORR_loss')
+    """The names of the losses that are logged and passed to the metrics callback (see `fit()`)."""
+
+    HOST_PARAMETERS: Tuple[str, ...] = ('intra_op_threads', 'inter_op_threads', 'cpu_affinity', 'device', 'mmap_dir',
+                                        'mmap_data')
+    """The algorithm parameters that are settings of the host rather than of the model, which `state()` leaves out."""
+
+    def __init__(self, data: np.ndarray, algo_parameters: Dict[str, Any] = {}):
+        self.algo_parameters: Dict[str, Any] = algo_parameters
+        self.scaler: MinMaxScaler = MinMaxScaler(feature_range=(-1.00, +1.00))
+        # if given, the model attaches to the data that `map_data()` mapped into this directory (rather than to the
+        # given data, which may be None), thus several models (e.g., of several processes) share a single copy of it
+        self.mmap_data: str = algo_parameters['mmap_data'] if 'mmap_data' in algo_parameters else None
+        if data is None and self.mmap_data is None:
+            raise ValueError("Expecting either the data or the directory it was mapped into (i.e., `mmap_data`) "
+                             "but got: None.")
+        if self.mmap_data is not None:
+            data = np.load(file=os.path.join(self.mmap_data, 'data_miss.npy'), mmap_mode='r')
+        self.n_obs: int = data.shape[0]
+        self.m_dim: int = data.shape[1]
+        # handling algorithm parameters, ensure that if one is absent then its default value is used
+        self.batch_size: int = min(algo_parameters['batch_size'], self.n_obs) if 'batch_size' in algo_parameters \
+            else int(np.ceil(np.sqrt(self.n_obs)))
+        self.loss: str = algo_parameters['loss'] if 'loss' in algo_parameters else 'both'
+        self.alpha: float = algo_parameters['alpha'] if 'alpha' in algo_parameters else 100
+        self.optimizer: str = algo_parameters['optimizer'] if 'optimizer' in algo_parameters else 'GDA'
+        self.learn_rate: float = algo_parameters['learn_rate'] if 'learn_rate' in algo_parameters else 0.001
+        self.beta_1: float = algo_parameters['beta_1'] if 'beta_1' in algo_parameters else 0.900
+        self.beta_2: float = algo_parameters['beta_2'] if 'beta_2' in algo_parameters else 0.999
+        self.decay: float = algo_parameters['decay'] if 'decay' in algo_parameters else 0.900
+        self.momentum: float = algo_parameters['momentum'] if 'momentum' in algo_parameters else 0.000
+        self.epsilon: float = algo_parameters['epsilon'] if 'epsilon' in algo_parameters else 1e-8
+        self.n_iterations: int = algo_parameters['n_iterations'] if 'n_iterations' in algo_parameters else 1000
+        self.verbose: bool = algo_parameters['verbose'] == 'True' if 'verbose' in algo_parameters else False
+        # rate at which the observed values of each mini-batch are (re-)amputated at random while training,
+        # which allows a single trained model to impute several amputations of the data (e.g., see `tabulator`)
+        self.ampu_rate: float = algo_parameters['ampu_rate'] if 'ampu_rate' in algo_parameters else 0.00
+        # seeds both the NumPy and the random number generators of the engine, if given
+        self.seed: int = algo_parameters['seed'] if 'seed' in algo_parameters else None
+        # the data type of the matrix multiplications of the networks, i.e., either 'float32' or 'bfloat16', in which
+        # case the operands are rounded to bfloat16 and the products are accumulated back into float32
+        self.matmul_dtype: str = algo_parameters['matmul_dtype'] if 'matmul_dtype' in algo_parameters else 'float32'
+        if self.matmul_dtype not in ('float32', 'bfloat16'):
+            raise ValueError(f"Expecting the data type of the matrix multiplications to be either 'float32' or "
+                             f"'bfloat16' but got: {self.matmul_dtype}.")
+        # the threading of the engine, i.e., the number of threads of its intra-op and inter-op pools (zero means
+        # the default of the engine, which is one thread per core), thus several trainings can run side by side on
+        # the same machine without oversubscribing its cores (see also `pin()`)
+        self.intra_op_threads: int = algo_parameters['intra_op_threads'] if 'intra_op_threads' in algo_parameters \
+            else 0
+        self.inter_op_threads: int = algo_parameters['inter_op_threads'] if 'inter_op_threads' in algo_parameters \
+            else 0
+        # the number of rows that are imputed at once (see `impute_many()`), which bounds the memory of the imputation
+        self.chunk_rows: int = algo_parameters['chunk_rows'] if 'chunk_rows' in algo_parameters else 2 ** 16
+        # if given, the scaled data and its mask are kept in memory-mapped `.npy` files (see `memory_map()`) within
+        # this directory rather than in memory, and the mini-batches are gathered from those (see `gather()`), which
+        # is the directory of the shared data by default, if any (see `mmap_data`)
+        self.mmap_dir: str = algo_parameters['mmap_dir'] if 'mmap_dir' in algo_parameters else \
+            None if self.mmap_data is None else os.path.dirname(os.path.abspath(self.mmap_data))
+        # the directory of the files that are owned by the model (i.e., removed once closed), if any
+        self.mmap_path: str = None
+        # early stopping, i.e., the rate at which the observed values are held out of the training, the reconstruction
+        # error on these is checked every `check_every` iterations (by default, 1% of them) and the training stops once
+        # it does NOT improve by more than `min_delta` for `patience` consecutive checks (see `stop_early()`)
+        self.holdout_rate: float = algo_parameters['holdout_rate'] if 'holdout_rate' in algo_parameters else 0.00
+        self.stopping_loss: str = algo_parameters['stopping_loss'] if 'stopping_loss' in algo_parameters else 'mse'
+        # the fraction of each mini-batch that is drawn from the new rows (i.e., rows `recent_row` onwards) of
+        # a partial fit (see `partial_fit()`), otherwise `recent_row` is zero, thus every row is drawn alike
+        self.recent_rate: float = algo_parameters['recent_rate'] if 'recent_rate' in algo_parameters else 0.50
+        if not 0.00 <= self.recent_rate <= 1.00:
+            raise ValueError(f"Expecting the rate of the new rows within the interval [0.00, 1.00] "
+                             f"but got: {self.recent_rate}.")
+        self.recent_batch_size: int = int(round(self.recent_rate * self.batch_size))
+        self.recent_row: int = 0
+        self.patience: int = algo_parameters['patience'] if 'patience' in algo_parameters else 10
+        self.min_delta: float = algo_parameters['min_delta'] if 'min_delta' in algo_parameters else 1e-4
+        self.check_every: int = algo_parameters['check_every'] if 'check_every' in algo_parameters else None
+        # self.continuous_vars: List[int] = algo_parameters['continuous_vars'] if 'continuous_vars' in algo_parameters \
+        #     else self._continuous_vars(data=data)
+
+        # the whole data path is float32 (i.e., the scaled data, its mask, the noise and the imputed data), which is
+        # the precision of the networks, thus there is neither a float64 copy nor a cast per mini-batch
+        if self.mmap_data is not None:
+            self.data_miss, self.data_mask = self.attach(path=self.mmap_data)
+        elif self.mmap_dir is None:
+            self.data_miss: np.ndarray = self.scaler.fit_transform(X=np.asarray(data, dtype=np.float32))
+            # the mask is bit-packed, it is only expanded into a float32 one for the rows at hand (see `Mask`)
+            self.data_mask: Mask = Mask.observed(data=data, chunk_rows=self.chunk_rows)
+            # replace missing values by zero, later on these will be imputed see `impute()` method
+            self.data_miss = np.nan_to_num(x=self.data_miss, nan=0.00)
+        else:
+            self.data_miss, self.data_mask = self.memory_map(data=data)
+        self.holdout_mask: Mask = self._holdout()
+        self.build()
+
+    def __enter__(self) -> 'BaseSGAIN':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Releases the resources held by the engine, if any, as well as the memory-mapped files of the data."""
+        if self.mmap_path is not None:
+            shutil.rmtree(path=self.mmap_path, ignore_errors=True)
+            self.mmap_path = None
+
+    @staticmethod
+    def map_data(data: np.ndarray, path: str, scaler: MinMaxScaler = None, chunk_rows: int = 2 ** 16) -> MinMaxScaler:
+        """Scales the data and writes it, along with its (bit-packed) mask and the fitted attributes of the scaler,
+        into memory-mapped `.npy` files within the given directory, chunk by chunk, thus neither the data nor its
+        scaled copy has to fit into memory (e.g., `data` can be memory-mapped as well). Any number of models attach
+        to these files (see `mmap_data`), i.e., they share a single copy of the data through the page cache.
+
+        Parameters
+        ----------
+        data : np.ndarray
+            The data, whose missing values are NaNs, an array of shape `(n_obs, m_dim)`.
+        path : str
+            The directory of the files, which is created if needed.
+        scaler : MinMaxScaler, optional
+            The fitted scaler of the data, by default a new one is fitted on it.
+        chunk_rows : int, optional
+            The number of rows that are scaled at once.
+
+        Returns
+        -------
+        MinMaxScaler
+            The (fitted) scaler of the data.
+        """
+        n_obs: int = data.shape[0]
+
+        os.makedirs(name=path, exist_ok=True)
+        if scaler is None:
+            scaler = MinMaxScaler(feature_range=(-1.00, +1.00))
+            for start in range(0, n_obs, chunk_rows):
+                scaler.partial_fit(X=np.asarray(data[start:(start + chunk_rows)], dtype=np.float32))
+        data_miss: np.ndarray = np.lib.format.open_memmap(
+            filename=os.path.join(path, 'data_miss.npy'), mode='w+', dtype=np.float32, shape=data.shape)
+        data_mask: np.ndarray = np.lib.format.open_memmap(
+            filename=os.path.join(path, 'data_mask.npy'), mode='w+', dtype=np.uint8,
+            shape=(n_obs, (data.shape[1] + 7) // 8))
+
+        for start in range(0, n_obs, chunk_rows):
+            chunk: np.ndarray = np.asarray(data[start:(start + chunk_rows)], dtype=np.float32)
+
+            data_miss[start:(start + chunk_rows)] = np.nan_to_num(x=scaler.transform(X=chunk), nan=0.00)
+            data_mask[start:(start + chunk_rows)] = np.packbits(~np.isnan(chunk), axis=1)
+        data_miss.flush()
+        data_mask.flush()
+        np.savez(os.path.join(path, 'scaler.npz'),
+                 **{name: np.asarray(getattr(scaler, name)) for name in BaseSGAIN.SCALER_ATTRIBUTES})
+        return scaler
+
+    def attach(self, path: str) -> Tuple[np.ndarray, Mask]:
+        """Attaches to the data that `map_data()` mapped into the given directory, i.e., its scaled data and its mask
+        are mapped read-only and the scaler is set to the one of the data.
+
+        Returns
+        -------
+        Tuple[np.ndarray, Mask]
+            The (read-only) memory-mapped scaled data, whose missing values are zeros, and its (bit-packed) mask.
+        """
+        with np.load(file=os.path.join(path, 'scaler.npz')) as attributes:
+            for name in BaseSGAIN.SCALER_ATTRIBUTES:
+                setattr(self.scaler, name, attributes[name])
+        return (np.load(file=os.path.join(path, 'data_miss.npy'), mmap_mode='r'),
+                Mask(bits=np.load(file=os.path.join(path, 'data_mask.npy'), mmap_mode='r'), m_dim=self.m_dim))
+
+    def memory_map(self, data: np.ndarray, fit: bool = True) -> Tuple[np.ndarray, Mask]:
+        """Scales the data (fitting the scaler beforehand, if `fit`) and writes it, along with its mask, into
+        memory-mapped `.npy` files of a new directory within `mmap_dir` (see `map_data()`), which the model owns.
+
+        Returns
+        -------
+        Tuple[np.ndarray, Mask]
+            The (read-only) memory-mapped scaled data, whose missing values are zeros, and its (bit-packed) mask.
+        """
+        os.makedirs(name=self.mmap_dir, exist_ok=True)
+        mmap_path: str = tempfile.mkdtemp(prefix='sgain-', dir=self.mmap_dir)
+
+        BaseSGAIN.map_data(data=data, path=mmap_path, scaler=None if fit else self.scaler, chunk_rows=self.chunk_rows)
+        # the files of a previous mapping (if any) are removed, yet their mappings stay valid while referenced
+        if self.mmap_path is not None:
+            shutil.rmtree(path=self.mmap_path, ignore_errors=True)
+        self.mmap_path = mmap_path
+        return self.attach(path=mmap_path)
+
+    def rescale(self, min_: np.ndarray, scale_: np.ndarray) -> None:
+        """Re-scales the (scaled) data in place, chunk by chunk (see `chunk_rows`), i.e., the scaling given by `min_`
+        and `scale_` (see `MinMaxScaler`) is inverted and the one of the scaler is done, the missing values stay zeros.
+        The memory-mapped data owned by the model (if any) is re-scaled within its files, thus every mapping of these
+        sees it, whereas the shared one (see `mmap_data`) is re-scaled into a private copy, thus other models do not.
+        """
+        source: np.ndarray = self.data_miss
+        data_miss: np.ndarray
+
+        if self.mmap_dir is None:
+            data_miss = self.data_miss
+        elif self.mmap_path is None:
+            self.mmap_path = tempfile.mkdtemp(prefix='sgain-', dir=self.mmap_dir)
+            data_miss = np.lib.format.open_memmap(filename=os.path.join(self.mmap_path, 'data_miss.npy'), mode='w+',
+                                                  dtype=np.float32, shape=self.data_miss.shape)
+        else:
+            data_miss = np.load(file=os.path.join(self.mmap_path, 'data_miss.npy'), mmap_mode='r+')
+        for start in range(0, self.n_obs, self.chunk_rows):
+            stop: int = min(start + self.chunk_rows, self.n_obs)
+
+            data_miss[start:stop] = self.data_mask.unpack(rows=slice(start, stop)) * (
+                (source[start:stop] - min_) / scale_ * self.scaler.scale_ + self.scaler.min_)
+        if self.mmap_dir is not None:
+            data_miss.flush()
+            del data_miss
+            self.data_miss = np.load(file=os.path.join(self.mmap_path, 'data_miss.npy'), mmap_mode='r')
+
+    def amputate(self, ampu_mask: Union[np.ndarray, Mask]) -> 'BaseSGAIN':
+        """Hides the observed values marked by the mask as if they were missing ones, i.e., the model is trained on
+        (and imputes) an amputation of its data without a copy of it (e.g., of the shared data, see `mmap_data`),
+        only its (bit-packed) mask is copied. The held out values (if any) are drawn again among the observed ones.
+
+        Parameters
+        ----------
+        ampu_mask : Union[np.ndarray, Mask]
+            The mask of the values to hide, either a boolean array of shape `(n_obs, m_dim)` or a (bit-packed) `Mask`.
+
+        Returns
+        -------
+        BaseSGAIN
+            The model itself.
+        """
+        ampu_mask = ampu_mask if isinstance(ampu_mask, Mask) else Mask.pack(mask=ampu_mask)
+        if ampu_mask.shape != (self.n_obs, self.m_dim):
+            raise ValueError(f"Expecting a mask of shape {(self.n_obs, self.m_dim)} but got: {ampu_mask.shape}.")
+        self.data_mask = Mask(bits=self.data_mask.bits & ~ampu_mask.bits, m_dim=self.m_dim)
+        self.holdout_mask = self._holdout()
+        if hasattr(self, 'holdout_inputs'):
+            del self.holdout_inputs
+        return self
+
+    @staticmethod
+    def pin(cpu_affinity: List[int] = None) -> None:
+        """Pins the (whole) process to the given cores, if any, which is only supported on Linux.
+        A model never pins the process it is created in, it is up to the owner of the process (e.g., the initializer
+        of a pool worker) to pin it once, before the engine creates its thread pools, which then inherit the affinity.
+        """
+        if cpu_affinity is None:
+            return
+        if not hasattr(os, 'sched_setaffinity'):
+            logging.warning("CPU pinning is NOT supported on this platform, thus the `cpu_affinity` is ignored.")
+            return
+        os.sched_setaffinity(0, cpu_affinity)
+
+    @staticmethod
+    def _continuous_vars(data: np.ndarray) -> List[int]:
+        # maximal set for discrete variables
+        max_set: Set[Union[int, float]] = set([0, 1, np.NaN])
+
+        # if the result of the difference between the sets is NOT the empty set
+        # then the variable (i.e., column/feature) is a continuous one
+        return [var for var in range(data.shape[1])
+                if set([value for value in np.unique(ar=data[:, var]) if str(value) != 'nan']) - max_set]
+
+    def _holdout(self) -> Mask:
+        """Draws the (bit-packed) mask of the observed values that are held out of the training, if any.
+        It is drawn chunk by chunk, which draws the same values as a single draw does.
+        """
+        if self.holdout_rate <= 0:
+            return None
+        if self.stopping_loss not in ('mse', 'corr'):
+            raise ValueError(f"Expecting the stopping loss to be either 'mse' or 'corr' "
+                             f"but got: {self.stopping_loss}.")
+        rng: np.random.Generator = np.random.default_rng(seed=self.seed)
+        bits: np.ndarray = np.empty(shape=self.data_mask.bits.shape, dtype=np.uint8)
+
+        for start in range(0, self.n_obs, self.chunk_rows):
+            stop: int = min(start + self.chunk_rows, self.n_obs)
+            bits[start:stop] = np.packbits(self.data_mask.unpack(rows=slice(start, stop)) & (
+                rng.uniform(size=(stop - start, self.m_dim)) < self.holdout_rate), axis=1)
+        if not bits.any():
+            # there would be nothing to check (i.e., the losses would be NaNs), thus there is no early stopping
+            info: str = f"no value is held out at the holdout rate: {self.holdout_rate}; early stopping is disabled"
+            if self.verbose:
+                tqdm.write(info)
+            logging.info(info)
+            return None
+        return Mask(bits=bits, m_dim=self.m_dim)
+
+    def resident_data(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns the training data that an engine loads into its own memory (see `training_data()`), which is none
+        (i.e., empty arrays) if the data is memory-mapped, since the mini-batches are then gathered from the map.
+        """
+        if self.mmap_dir is not None:
+            return np.zeros(shape=(0, self.m_dim), dtype=np.float32), np.zeros(shape=(0, self.m_dim), dtype=bool)
+        return self.training_data()
+
+    def gather(self, indices: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Gathers the rows of a mini-batch from the training data (see `training_data()`), e.g., from memory-mapped
+        files, the indices are sorted to read the rows in the order of the files (a mini-batch has no order).
+        The mask is expanded into a float32 one for the rows of the mini-batch only.
+        """
+        indices = np.sort(indices)
+        data_mask: np.ndarray = self.data_mask.unpack(rows=indices)
+        if self.holdout_mask is not None:
+            data_mask &= ~self.holdout_mask.unpack(rows=indices)
+        data_mask = data_mask.astype(dtype=np.float32)
+        return data_mask * self.data_miss[indices, :], data_mask
+
+    def training_data(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns the (scaled) data and its (boolean) mask that the networks are trained on, i.e., the held out
+        values (see `holdout_rate`) are hidden as if they were missing values.
+        """
+        data_mask: np.ndarray = self.data_mask.unpack()
+
+        if self.holdout_mask is not None:
+            data_mask &= ~self.holdout_mask.unpack()
+        # the data is masked even if nothing is held out, since the values hidden by `amputate()` are still there
+        return data_mask * self.data_miss, data_mask
+
+    @staticmethod
+    def sample_z(n_rows: int, m_cols: int, feature_range: Tuple[float, float] = (-0.01, +0.01)) -> np.ndarray:
+        return np.random.uniform(
+            low=feature_range[0], high=feature_range[1], size=[n_rows, m_cols]).astype(dtype=np.float32)
+
+    @abc.abstractmethod
+    def build(self) -> None:
+        """Builds the networks of the model (and seeds the random number generators, if a seed is given)."""
+        pass
+
+    def impute(self, sess: Any = None, ampu_mask: Union[np.ndarray, Mask] = None) -> np.ndarray:
+        """Imputes the missing values of the data using the trained generator (see `transform()` for new rows).
+
+        Parameters
+        ----------
+        sess : Any, optional
+            The session that holds the trained model, by default the one opened by `fit()` (session engine only).
+        ampu_mask : Union[np.ndarray, Mask], optional
+            A boolean (or bit-packed) mask of shape `(n_obs, m_dim)` that marks the (observed) values to be amputated
+            before the imputation, which is how a single trained model serves several amputations of the data.
+
+        Returns
+        -------
+        np.ndarray
+            The imputed data.
+        """
+        return self.impute_many(ampu_masks=[ampu_mask], sess=sess)[0]
+
+    def impute_many(self,
+                    ampu_masks: List[Union[np.ndarray, Mask]],
+                    sess: Any = None,
+                    rows: np.ndarray = None) -> np.ndarray:
+        """Imputes several amputations of the data at once, i.e., for each chunk of rows the K given masks are stacked
+        into a single batch, which is imputed by one forward pass of the trained generator.
+
+        Parameters
+        ----------
+        ampu_masks : List[Union[np.ndarray, Mask]]
+            K boolean (or bit-packed) masks of shape `(n_obs, m_dim)`, each one marks the (observed) values to be
+            amputated before the respective imputation, a `None` mask means that only the missing values are imputed.
+        sess : Any, optional
+            The session that holds the trained model, by default the one opened by `fit()` (session engine only).
+        rows : np.ndarray, optional
+            The indices of the rows to impute, by default all of them. If given, the masks have `len(rows)` rows.
+            Either way, the rows are imputed in chunks of (at most) `chunk_rows` rows.
+
+        Returns
+        -------
+        np.ndarray
+            The K imputations of the data (or of its `rows`), an array of shape `(K, n_rows, m_dim)`,
+            where `n_rows` is either `n_obs` or `len(rows)`.
+        """
+        n_rows: int = self.n_obs if rows is None else len(rows)
+        # the output is preallocated and every chunk of rows is written into it, thus the peak of memory is
+        # O(K * chunk_rows * m_dim) on top of the data and the output
+        imputed_data: np.ndarray = np.empty(shape=(len(ampu_masks), n_rows, self.m_dim), dtype=np.float32)
+
+        for start in range(0, n_rows, self.chunk_rows):
+            stop: int = min(start + self.chunk_rows, n_rows)
+            index: Union[slice, np.ndarray] = slice(start, stop) if rows is None else rows[start:stop]
+            data_miss: np.ndarray = self.data_miss[index, :]
+            observed: np.ndarray = self.data_mask.unpack(rows=index)
+            # the masks are only expanded into float32 ones for the rows of the chunk
+            data_mask: np.ndarray = np.stack([observed if ampu_mask is None else
+                                              observed & ~Mask.as_bool(mask=ampu_mask, rows=slice(start, stop))
+                                              for ampu_mask in ampu_masks], axis=0).astype(dtype=np.float32)
+            Z_all: np.ndarray = data_mask * data_miss + (1 - data_mask) * BaseSGAIN.sample_z(
+                n_rows=(len(ampu_masks) * (stop - start)), m_cols=self.m_dim).reshape(data_mask.shape)
+            chunk: np.ndarray = imputed_data[:, start:stop, :]
+
+            np.multiply(data_mask, data_miss, out=chunk)
+            chunk += (1 - data_mask) * self.generate(
+                data_mask=data_mask.reshape(-1, self.m_dim), Z=Z_all.reshape(-1, self.m_dim), sess=sess).reshape(
+                data_mask.shape)
+            # the inverse of the scaling (see `MinMaxScaler.inverse_transform()`), in place
+            chunk -= self.scaler.min_
+            chunk /= self.scaler.scale_
+        # imputed_data = rounding(imputed_data=imputed_data, data_x=self.data)
+        ################################################################################################################
+        # TODO: VERIFY THE IMPUTED DATA OF GAIN
+        ################################################################################################################
+        return imputed_data
+
+    def transform(self, new_data: np.ndarray, sess: Any = None) -> np.ndarray:
+        """Imputes the missing values of new (i.e., unseen) rows using the trained generator, i.e., without any
+        training, the rows are scaled by the fitted scaler and imputed by a single forward pass per chunk of
+        (at most) `chunk_rows` rows.
+
+        Parameters
+        ----------
+        new_data : np.ndarray
+            The new rows, whose missing values are NaNs, an array of shape `(n_rows, m_dim)`.
+        sess : Any, optional
+            The session that holds the trained model, by default the one opened by `fit()` (session engine only).
+
+        Returns
+        -------
+        np.ndarray
+            The imputed rows, a float32 array of shape `(n_rows, m_dim)`.
+        """
+        new_data = np.asarray(new_data, dtype=np.float32)
+        if new_data.ndim != 2 or new_data.shape[1] != self.m_dim:
+            raise ValueError(f"Expecting new rows of {self.m_dim} columns (i.e., the ones of the data the model was "
+                             f"trained on) but got an array of shape: {new_data.shape}.")
+        n_rows: int = new_data.shape[0]
+        imputed_data: np.ndarray = np.empty(shape=new_data.shape, dtype=np.float32)
+
+        for start in range(0, n_rows, self.chunk_rows):
+            stop: int = min(start + self.chunk_rows, n_rows)
+            data_mask: np.ndarray = (~np.isnan(new_data[start:stop])).astype(dtype=np.float32)
+            data_miss: np.ndarray = np.nan_to_num(x=self.scaler.transform(X=new_data[start:stop]), nan=0.00)
+            Z: np.ndarray = data_mask * data_miss + (1 - data_mask) * BaseSGAIN.sample_z(
+                n_rows=(stop - start), m_cols=self.m_dim)
+            chunk: np.ndarray = imputed_data[start:stop, :]
+
+            np.multiply(data_mask, data_miss, out=chunk)
+            chunk += (1 - data_mask) * self.generate(data_mask=data_mask, Z=Z, sess=sess)
+            # the inverse of the scaling (see `MinMaxScaler.inverse_transform()`), in place
+            chunk -= self.scaler.min_
+            chunk /= self.scaler.scale_
+        return imputed_data
+
+    @abc.abstractmethod
+    def generate(self, data_mask: np.ndarray, Z: np.ndarray, sess: Any = None) -> np.ndarray:
+        """Runs the (trained) generator, i.e., one forward pass over the given mask and noise."""
+        pass
+
+    def execute(self) -> np.ndarray:
+        """Trains the model (see `fit()`) and imputes the missing values of the data (see `impute()`)."""
+        return self.fit().impute()
+
+    @abc.abstractmethod
+    def get_weights(self) -> Dict[str, np.ndarray]:
+        """Returns the `WEIGHTS` of the model."""
+        pass
+
+    @abc.abstractmethod
+    def set_weights(self, weights: Dict[str, np.ndarray]) -> None:
+        pass
+
+    @abc.abstractmethod
+    def get_slots(self) -> Dict[str, np.ndarray]:
+        """Returns the state of the optimizers of the model (e.g., the moments of Adam), by name."""
+        pass
+
+    @abc.abstractmethod
+    def set_slots(self, slots: Dict[str, np.ndarray]) -> None:
+        pass
+
+    def append(self, new_rows: np.ndarray) -> None:
+        """Appends new rows to the data, chunk by chunk (see `chunk_rows`), i.e., the ranges of the scaler are
+        extended to cover the new rows (see `MinMaxScaler.partial_fit()`), the (scaled) data is re-scaled to the
+        extended ranges and the new rows are scaled and appended, either in memory or into new memory-mapped files
+        (see `mmap_dir`). The held out values (if any) are drawn again, which, given a `seed`, draws the same ones
+        for the previous rows.
+
+        Parameters
+        ----------
+        new_rows : np.ndarray
+            The new rows, whose missing values are NaNs, an array of shape `(n_rows, m_dim)`.
+        """
+        new_rows = np.asarray(new_rows, dtype=np.float32)
+        if new_rows.ndim != 2 or new_rows.shape[0] == 0 or new_rows.shape[1] != self.m_dim:
+            raise ValueError(f"Expecting new rows of {self.m_dim} columns (i.e., the ones of the data the model was "
+                             f"trained on) but got an array of shape: {new_rows.shape}.")
+        n_obs: int = self.n_obs + new_rows.shape[0]
+        shape: Tuple[int, int] = (n_obs, self.m_dim)
+        min_: np.ndarray = self.scaler.min_.copy()
+        scale_: np.ndarray = self.scaler.scale_.copy()
+        mmap_path: str = None
+        data_miss: np.ndarray
+        bits: np.ndarray
+
+        for start in range(0, new_rows.shape[0], self.chunk_rows):
+            self.scaler.partial_fit(X=new_rows[start:(start + self.chunk_rows)])
+        if self.mmap_dir is None:
+            data_miss = np.empty(shape=shape, dtype=np.float32)
+            bits = np.empty(shape=(n_obs, self.data_mask.bits.shape[1]), dtype=np.uint8)
+        else:
+            mmap_path = tempfile.mkdtemp(prefix='sgain-', dir=self.mmap_dir)
+            data_miss = np.lib.format.open_memmap(
+                filename=os.path.join(mmap_path, 'data_miss.npy'), mode='w+', dtype=np.float32, shape=shape)
+            bits = np.lib.format.open_memmap(filename=os.path.join(mmap_path, 'data_mask.npy'), mode='w+',
+                                             dtype=np.uint8, shape=(n_obs, self.data_mask.bits.shape[1]))
+        for start in range(0, self.n_obs, self.chunk_rows):
+            stop: int = min(start + self.chunk_rows, self.n_obs)
+
+            # the scaling is inverted with the previous ranges and re-done with the extended ones (see `rescale()`)
+            data_miss[start:stop] = self.data_mask.unpack(rows=slice(start, stop)) * (
+                (self.data_miss[start:stop] - min_) / scale_ * self.scaler.scale_ + self.scaler.min_)
+            bits[start:stop] = self.data_mask.bits[start:stop]
+        for start in range(0, new_rows.shape[0], self.chunk_rows):
+            chunk: np.ndarray = new_rows[start:(start + self.chunk_rows)]
+
+            data_miss[(self.n_obs + start):(self.n_obs + start + chunk.shape[0])] = np.nan_to_num(
+                x=self.scaler.transform(X=chunk), nan=0.00)
+            bits[(self.n_obs + start):(self.n_obs + start + chunk.shape[0])] = np.packbits(~np.isnan(chunk), axis=1)
+        if mmap_path is not None:
+            data_miss.flush()
+            bits.flush()
+            del data_miss, bits
+            # the files of the previous mapping (if owned) are removed, yet their mappings stay valid while referenced
+            if self.mmap_path is not None:
+                shutil.rmtree(path=self.mmap_path, ignore_errors=True)
+            self.mmap_path = mmap_path
+            data_miss = np.load(file=os.path.join(mmap_path, 'data_miss.npy'), mmap_mode='r')
+            bits = np.load(file=os.path.join(mmap_path, 'data_mask.npy'), mmap_mode='r')
+        self.data_miss, self.data_mask, self.n_obs = data_miss, Mask(bits=bits, m_dim=self.m_dim), n_obs
+        self.holdout_mask = self._holdout()
+        if hasattr(self, 'holdout_inputs'):
+            del self.holdout_inputs
+
+    def partial_fit(self,
+                    new_rows: np.ndarray,
+                    n_iterations: int = None,
+                    callback: Callable[[int, Dict[str, float]], None] = None,
+                    callback_every: int = 1) -> 'BaseSGAIN':
+        """Resumes the training of the (trained) model on its data along with new rows (see `append()`), i.e.,
+        from its weights and the state of its optimizers (see `warm_state()`), for a few iterations whose
+        mini-batches are biased toward the new rows (see `recent_rate`), thus the cost of the increment scales with
+        the new rows rather than with the whole data.
+
+        Parameters
+        ----------
+        new_rows : np.ndarray
+            The new rows, whose missing values are NaNs, an array of shape `(n_rows, m_dim)`.
+        n_iterations : int, optional
+            The number of iterations (in the unit of `n_iterations` of the model), by default `n_iterations` times
+            the fraction of the rows that are new (but, at least, one).
+        callback : Callable[[int, Dict[str, float]], None]
+            A metrics callback, see `fit()`.
+        callback_every : int
+            The number of iterations between calls to the metrics callback.
+        """
+        state: Dict[str, Dict[str, np.ndarray]] = self.warm_state()
+        n_iterations_fit: int = self.n_iterations
+
+        self.append(new_rows=new_rows)
+        n_iterations = n_iterations if n_iterations is not None else \
+            max(1, int(np.ceil(self.n_iterations * len(new_rows) / self.n_obs)))
+        self.n_iterations, self.recent_row = n_iterations, self.n_obs - len(new_rows)
+        try:
+            self.warm_start(state=state).fit(callback=callback, callback_every=callback_every)
+        finally:
+            self.n_iterations, self.recent_row = n_iterations_fit, 0
+        return self
+
+    def warm_state(self) -> Dict[str, Dict[str, np.ndarray]]:
+        """Returns what a model of the same algorithm and engine needs to resume the training of this one,
+        i.e., the weights (see `get_weights()`) and the state of the optimizers (see `get_slots()`).
+        """
+        return {'weights': self.get_weights(), 'slots': self.get_slots()}
+
+    def warm_start(self, state: Dict[str, Dict[str, np.ndarray]]) -> 'BaseSGAIN':
+        """Starts the training (see `fit()`) from the `warm_state()` of another model rather than from scratch."""
+        self.set_weights(weights=state['weights'])
+        self.set_slots(slots=state['slots'])
+        return self
+
+    def persisted_parameters(self) -> Dict[str, Any]:
+        """Returns the algorithm parameters that `state()` persists, i.e., all but the settings of the host (see
+        `HOST_PARAMETERS`), which are up to the host that restores the model (see `from_state()`).
+        """
+        return {name: value for name, value in self.algo_parameters.items() if name not in BaseSGAIN.HOST_PARAMETERS}
+
+    def state(self) -> Dict[str, np.ndarray]:
+        """Returns the state of the trained model, i.e., the weights of the generator and of the discriminator
+        (or critic), the fitted attributes of the `MinMaxScaler`, and the algorithm parameters (see
+        `persisted_parameters()`), as flat arrays.
+        """
+        return {
+            'format_version': np.array(BaseSGAIN.FORMAT_VERSION),
+            'algo': np.array(type(self).__name__),
+            'algo_parameters': np.array(json.dumps(obj=self.persisted_parameters(),
+                                                   default=lambda value: value.item())),
+            **{f"scaler/{name}": np.asarray(getattr(self.scaler, name)) for name in BaseSGAIN.SCALER_ATTRIBUTES},
+            **{f"weights/{name}": value for name, value in self.get_weights().items()}
+        }
+
+    @classmethod
+    def from_state(cls,
+                   state: Dict[str, np.ndarray],
+                   data: np.ndarray,
+                   algo_parameters: Dict[str, Any] = None) -> 'BaseSGAIN':
+        """Restores a trained model from its `state()`, no training is performed.
+
+        Parameters
+        ----------
+        state : Dict[str, np.ndarray]
+            The state of a trained model (see `state()`).
+        data : np.ndarray
+            The data whose missing values will be imputed by the restored model, which may be None if it is mapped
+            already (see `mmap_data`).
+        algo_parameters : Dict[str, Any], optional
+            The algorithm parameters that override the persisted ones, e.g., the settings of the host (see
+            `HOST_PARAMETERS`), which are NOT persisted.
+
+        Returns
+        -------
+        BaseSGAIN
+            The restored model, which is ready to impute.
+        """
+        model: BaseSGAIN
+
+        if int(state['format_version']) != BaseSGAIN.FORMAT_VERSION:
+            raise ValueError(f"Expecting the format version {BaseSGAIN.FORMAT_VERSION} "
+                             f"but got: {int(state['format_version'])}.")
+        if str(state['algo']) != cls.__name__:
+            raise ValueError(f"Expecting the state of a {cls.__name__} model but got: {state['algo']}.")
+        model = cls(data=data, algo_parameters={**json.loads(s=str(state['algo_parameters'])),
+                                                **(algo_parameters if algo_parameters is not None else {})})
+        min_: np.ndarray = model.scaler.min_.copy()
+        scale_: np.ndarray = model.scaler.scale_.copy()
+
+        for name in BaseSGAIN.SCALER_ATTRIBUTES:
+            setattr(model.scaler, name, state[f"scaler/{name}"])
+        if np.array_equal(model.scaler.min_, min_) and np.array_equal(model.scaler.scale_, scale_):
+            pass  # the data is already scaled as the model was trained on (e.g., the shared data, see `mmap_data`)
+        elif model.mmap_dir is None:
+            model.data_miss = np.nan_to_num(x=model.scaler.transform(X=np.asarray(data, dtype=np.float32)), nan=0.00)
+        else:
+            # the data that the model mapped is re-scaled in place, rather than mapped once again
+            model.rescale(min_=min_, scale_=scale_)
+        model.set_weights(weights={name: state[f"weights/{name}"] for name in BaseSGAIN.WEIGHTS})
+        return model
+
+    def export(self, path: str) -> None:
+        """Exports the trained generator (and the scaler) for the NumPy runtime, see `purify.imputation.runtime`."""
+        runtime.export(state=self.state(), path=path)
+
+    def save(self, path: str) -> None:
+        """Saves the trained model (see `state()`) into a compressed `.npz` file."""
+        np.savez_compressed(file=path, **self.state())
+
+    @classmethod
+    def load(cls, path: str, data: np.ndarray, algo_parameters: Dict[str, Any] = None) -> 'BaseSGAIN':
+        """Loads a trained model that was saved by `save()`, see `from_state()`."""
+        with np.load(file=path, allow_pickle=False) as archive:
+            return cls.from_state(state=dict(archive), data=data, algo_parameters=algo_parameters)
+
+    def losses_due(self, iteration: int, callback: Callable[[int, Dict[str, float]], None] = None,
+                   callback_every: int = 1) -> bool:
+        """Whether the losses have to be fetched at the given iteration, i.e., whether these are either logged
+        (if verbose) or asked for by the metrics callback, otherwise the training steps fetch nothing.
+        """
+        return self.logging_due(iteration=iteration) or (callback is not None and iteration % callback_every == 0)
+
+    def logging_due(self, iteration: int) -> bool:
+        return self.verbose and (iteration % (self.n_iterations / 10) == 0 or iteration == self.n_iterations - 1)
+
+    def report(self, iteration: int, losses: Dict[str, float], callback: Callable[[int, Dict[str, float]], None] = None,
+               callback_every: int = 1) -> None:
+        """Logs the losses (if verbose) and passes these to the metrics callback, when due (see `losses_due()`)."""
+        if self.logging_due(iteration=iteration):
+            # NOTICE THE USE OF `CORR_loss`
+            info: str = f"iteration: {iteration}; " \
+                        f"D_loss: {losses['D_loss']:.4}; G_loss: {losses['G_loss']:.4}; " \
+                        f"MSE_loss: {losses['MSE_loss']:.4}; CORR_loss: {losses['CORR_loss']:.4}"
+
+            tqdm.write(info)
+            logging.info(info)
+        if callback is not None and iteration % callback_every == 0:
+            callback(iteration, losses)
+
+    def holdout_losses(self) -> Dict[str, float]:
+        """Returns the reconstruction error of the held out values, i.e., the `MSE_loss` and the `CORR_loss` of
+        the values the generator imputes for these. The rows and the noise are drawn once, thus every check is
+        evaluated on the same inputs.
+        """
+        if not hasattr(self, 'holdout_inputs'):
+            # a row holds out a value if any of its bytes is NOT zero (the padding bits are zeros)
+            rows: np.ndarray = np.flatnonzero(self.holdout_mask.bits.any(axis=1))
+            data_mask: np.ndarray = (self.data_mask.unpack(rows=rows) &
+                                     ~self.holdout_mask.unpack(rows=rows)).astype(dtype=np.float32)
+            data_miss: np.ndarray = data_mask * self.data_miss[rows, :]
+            rng: np.random.Generator = np.random.default_rng(seed=self.seed)
+            Z: np.ndarray = data_mask * data_miss + (1 - data_mask) * (
+                0.02 * rng.random(size=data_mask.shape, dtype=np.float32) - 0.01)
+            self.holdout_inputs: Tuple[np.ndarray, np.ndarray, np.ndarray] = (rows, data_mask, Z)
+        rows, data_mask, Z = self.holdout_inputs
+        holdout_mask: np.ndarray = self.holdout_mask.unpack(rows=rows)
+        x: np.ndarray = self.data_miss[rows, :][holdout_mask]
+        y: np.ndarray = self.generate(data_mask=data_mask, Z=Z)[holdout_mask]
+        x_delta: np.ndarray = x - x.mean()
+        y_delta: np.ndarray = y - y.mean()
+        # the same (population) correlation as the one of the networks, zero if either one is constant
+        std: float = x_delta.std() * y_delta.std()
+
+        return {'MSE_loss': float(np.mean((x - y) ** 2)),
+                'CORR_loss': float(np.mean(x_delta * y_delta) / std) if std > 0 else 0.00}
+
+    def stop_early(self, iteration: int) -> bool:
+        """Whether the training has to stop at the given iteration, i.e., whether the reconstruction error of
+        the held out values did NOT improve by more than `min_delta` for `patience` consecutive checks, in which case
+        the weights of the best check are restored. The last iteration is always checked and, unless it is the best
+        check, the weights of the best check are restored as well, thus the training ends with the best weights on
+        every path. It is always `False` if no value is held out (see `holdout_rate`).
+        """
+        if self.holdout_mask is None:
+            return False
+        check_every: int = self.check_every if self.check_every is not None else max(1, self.n_iterations // 100)
+        last: bool = iteration == self.n_iterations - 1
+        if iteration % check_every != 0 and not last:
+            return False
+        if iteration == 0:
+            self.best_loss: float = np.inf
+            self.best_weights: Dict[str, np.ndarray] = None
+            self.n_checks: int = 0  # the number of consecutive checks without improvement
+        losses: Dict[str, float] = self.holdout_losses()
+        loss: float = losses['MSE_loss'] if self.stopping_loss == 'mse' else 1 - losses['CORR_loss']
+
+        # a non-finite loss (e.g., a diverged training) is NOT an improvement
+        improved: bool = bool(np.isfinite(loss)) and loss < self.best_loss - self.min_delta
+
+        if improved:
+            self.best_loss, self.best_weights, self.n_checks = loss, self.get_weights(), 0
+        else:
+            self.n_checks += 1
+        if last:
+            # the training ends anyway, thus the weights of the best check are restored (unless these are the last ones)
+            if not improved and self.best_weights is not None:
+                self.set_weights(weights=self.best_weights)
+            return True
+        if improved or self.n_checks < self.patience:
+            return False
+        # if no check was ever finite there are no best weights, the training stops with its last ones
+        if self.best_weights is not None:
+            self.set_weights(weights=self.best_weights)
+        info: str = f"early stopping at iteration: {iteration}; " \
+                    f"holdout MSE_loss: {losses['MSE_loss']:.4}; holdout CORR_loss: {losses['CORR_loss']:.4}; " \
+                    f"best {self.stopping_loss} loss: {self.best_loss:.4}"
+        if self.verbose:
+            tqdm.write(info)
+        logging.info(info)
+        return True
+
+    @abc.abstractmethod
+    def fit(self, callback: Callable[[int, Dict[str, float]], None] = None, callback_every: int = 1) -> 'BaseSGAIN':
+        """Trains the model.
+
+        Parameters
+        ----------
+        callback : Callable[[int, Dict[str, float]], None]
+            A metrics callback, which is called with the iteration and the `LOSSES` every `callback_every` iterations.
+        callback_every : int
+            The number of iterations between calls to the metrics callback.
+        """
+        return self
@@ -0,0 +1,339 @@
+########################################################################################################################
+# Research Centers
+# ----------------
+# Medical Informatics Group
+# BIH - Berlin Institute of Health
+# Charité - Universitätsmedizin Berlin
+# https://www.bihealth.org/en/research/research-groups/fabian-prasser/
+#
+# Centro ALGORITMI - School of Engineering – University of Minho
+# Braga - Portugal
+# http://algoritmi.uminho.pt/
+#
+#
+# Description
+# -----------
+# This module implements an ensemble of K independent SGAIN replicas that are trained as a single model on the
+# TensorFlow 2 engine (see `purify.imputation.gain_tf2`), i.e., the weights of the replicas are stacked into tensors
+# of K slices and every layer is a batched matrix multiplication, thus one compiled (XLA) step trains all of them.
+# Since the networks of SGAIN are tiny (i.e., their weights are `m_dim x m_dim`), a single training underuses a CPU,
+# whereas the ensemble amortizes the dispatch of each step (and fills the matrix units) over the K replicas.
+# Each replica is initialized (and samples its mini-batches) independently, and it may train on its own amputation of
+# the data, e.g., the amputation rounds of a run of `purify.generation.tabulator.TabularDataGenerator`.
+#
+#
+# Moto
+# ----
+# "We think too much and feel too little. More than machinery we need humanity."
+#                         -- Excerpt of the final speech from The Great Dictator
+#
+#
+# Authors
+# -------
+# diogo telmo neves -- {dneves@di.uminho.pt, diogo-telmo.neves@charite.de, tada.science@gmail.com}
+#
+#
+# Copyright
+# ---------
+# Copyright (c) 2021 diogo telmo neves.
+# All rights reserved.
+#
+#
+# Conditions
+# ----------
+# This code is free/open source code but the following conditions must be met:
+#   * Redistributions of source code must retain the above copyright notice, this list of conditions and
+#     the following disclaimer in the documentation and/or other materials provided with the distribution.
+#   * Redistributions in binary form must reproduce the above copyright notice, this list of conditions and
+#     the following disclaimer in the documentation and/or other materials provided with the distribution.
+#
+#
+# DISCLAIMER
+# ----------
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND
+# FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR
+# TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#
+# Date
+# ----
+# October 2026
+########################################################################################################################
+
+import numpy as np
+
+import tensorflow as tf
+
+from purify.imputation import gain_tf2, runtime
+from purify.imputation.base import BaseSGAIN
+from purify.imputation.mask import Mask
+
+from typing import Any, Dict, List, Tuple, Union
+
+
+class SGAINEnsemble(gain_tf2.SGAIN):
+    """This class implements an ensemble of K independent Slim GAIN (SGAIN) replicas [1], which are trained by
+    a single batched step. The parameters are the ones of :class:`purify.imputation.gain.SGAIN` and are shared by
+    the replicas, along with `n_replicas` (i.e., K, by default 4) if no amputation masks are given.
+
+    References
+    ----------
+    [1] Neves, Diogo Telmo, Marcel Ganesh Naik, and Alberto Proença.
+        "SGAIN, WSGAIN-CP and WSGAIN-GP: Novel GAN Methods for Missing Data Imputation."
+        International Conference on Computational Science (ICCS). Springer, Cham, 2021.
+    """
+
+    def __init__(self,
+                 data: np.ndarray,
+                 algo_parameters: Dict[str, Any] = {},
+                 ampu_masks: List[Union[np.ndarray, Mask]] = None):
+        """
+        Parameters
+        ----------
+        data : np.ndarray
+            The data, whose missing values are NaNs.
+        algo_parameters : Dict[str, Any], optional
+            The algorithm parameters, which are shared by the replicas.
+        ampu_masks : List[Union[np.ndarray, Mask]], optional
+            K boolean (or bit-packed) masks of shape `(n_obs, m_dim)`, the k-th one marks the (observed) values that
+            are amputated from the data the k-th replica is trained on (and later on imputes), by default none is
+            amputated.
+        """
+        self.n_replicas: int = len(ampu_masks) if ampu_masks is not None else \
+            algo_parameters['n_replicas'] if 'n_replicas' in algo_parameters else 4
+        self.ampu_masks: List[Union[np.ndarray, Mask]] = ampu_masks if ampu_masks is not None else \
+            [None] * self.n_replicas
+        if algo_parameters.get('mmap_dir') is not None or algo_parameters.get('mmap_data') is not None:
+            raise ValueError(f"Expecting the data of an ensemble in memory but got it memory-mapped in: "
+                             f"{algo_parameters.get('mmap_dir') or algo_parameters['mmap_data']}.")
+        super().__init__(data=data, algo_parameters=algo_parameters)
+        if self.holdout_mask is not None:
+            raise ValueError(f"Expecting no held out values (i.e., early stopping) on an ensemble "
+                             f"but got: {self.holdout_rate}.")
+
+    def build(self) -> None:
+        """Builds the stacked variables of the replicas, i.e., each weight has a leading axis of K slices (a bias
+        is a `(K, 1, m_dim)` tensor, which broadcasts over the rows of a mini-batch), and the compiled training step.
+        """
+        self.configure_threading()
+        self.rng: tf.random.Generator = tf.random.Generator.from_seed(seed=self.seed) if self.seed is not None \
+            else tf.random.Generator.from_non_deterministic_state()
+        if self.seed is not None:
+            np.random.seed(seed=self.seed)
+        # the (scaled) data is shared by the replicas, whereas each one has its own (boolean) mask, they are loaded
+        # by `fit()`
+        self.data_var: tf.Variable = tf.Variable(
+            initial_value=tf.zeros(shape=[self.n_obs, self.m_dim]), trainable=False)
+        self.mask_var: tf.Variable = tf.Variable(
+            initial_value=tf.zeros(shape=[self.n_replicas, self.n_obs, self.m_dim], dtype=tf.bool), trainable=False)
+
+        self.G_W1: tf.Variable = tf.Variable(
+            initial_value=self.uniform(shape=[self.n_replicas, 2 * self.m_dim, self.m_dim]))
+        self.G_b1: tf.Variable = tf.Variable(initial_value=tf.zeros(shape=[self.n_replicas, 1, self.m_dim]))
+
+        self.G_W2: tf.Variable = tf.Variable(
+            initial_value=self.uniform(shape=[self.n_replicas, self.m_dim, self.m_dim]))
+        self.G_b2: tf.Variable = tf.Variable(initial_value=tf.zeros(shape=[self.n_replicas, 1, self.m_dim]))
+
+        self.theta_G: List[tf.Variable] = [self.G_W1, self.G_W2, self.G_b1, self.G_b2]
+
+        self.D_W1: tf.Variable = tf.Variable(
+            initial_value=self.uniform(shape=[self.n_replicas, self.m_dim, self.m_dim]))
+        self.D_b1: tf.Variable = tf.Variable(initial_value=tf.zeros(shape=[self.n_replicas, 1, self.m_dim]))
+
+        self.D_W2: tf.Variable = tf.Variable(
+            initial_value=self.uniform(shape=[self.n_replicas, self.m_dim, self.m_dim]))
+        self.D_b2: tf.Variable = tf.Variable(initial_value=tf.zeros(shape=[self.n_replicas, 1, self.m_dim]))
+
+        self.theta_D: List[tf.Variable] = [self.D_W1, self.D_W2, self.D_b1, self.D_b2]
+
+        # the update rules are element-wise, thus they update the stacked variables as K independent ones
+        self.G_optimizer: gain_tf2.Optimizer = gain_tf2.Optimizer(model=self, var_list=self.theta_G)
+        self.D_optimizer: gain_tf2.Optimizer = gain_tf2.Optimizer(model=self, var_list=self.theta_D)
+        self.train_step = tf.function(func=self.fused_step, jit_compile=True)
+
+    def masks(self,
+              data_mask: np.ndarray,
+              ampu_masks: List[Union[np.ndarray, Mask]],
+              rows: Union[slice, np.ndarray] = None) -> np.ndarray:
+        """Stacks the (boolean) masks of the replicas, i.e., the given boolean mask without the values amputated by
+        each replica, where the given mask is the one of the `rows` (by default, all of them) of the amputation masks.
+        """
+        return np.stack([data_mask if ampu_mask is None else data_mask & ~Mask.as_bool(mask=ampu_mask, rows=rows)
+                         for ampu_mask in ampu_masks], axis=0)
+
+    def load_data(self) -> None:
+        self.data_var.assign(value=self.data_miss)
+        self.mask_var.assign(value=self.masks(data_mask=self.data_mask.unpack(), ampu_masks=self.ampu_masks))
+
+    def input_pipeline(self) -> Tuple[tf.Tensor, tf.Tensor, tf.Tensor]:
+        """Samples a mini-batch per replica, i.e., `(K, batch_size, m_dim)` Tensors of the data, the mask and
+        the noise (see :meth:`purify.imputation.gain_tf2.SGAIN.input_pipeline`).
+        """
+        shape: List[int] = [self.n_replicas, self.batch_size, self.m_dim]
+        indices_mb: tf.Tensor = self.rng.uniform(
+            shape=[self.n_replicas, self.batch_size], minval=0, maxval=self.n_obs, dtype=tf.int32)
+        # the boolean masks are only expanded into float32 ones for the rows of the mini-batches
+        M_mb: tf.Tensor = tf.cast(
+            x=tf.gather(params=self.mask_var, indices=indices_mb, batch_dims=1), dtype=tf.float32)
+
+        if self.ampu_rate > 0:
+            M_mb = M_mb * tf.cast(x=(self.rng.uniform(shape=shape) >= self.ampu_rate), dtype=tf.float32)
+        # the data is shared, thus the values amputated by a replica are hidden from it by its mask
+        X_mb: tf.Tensor = M_mb * tf.gather(params=self.data_var, indices=indices_mb)
+        return X_mb, M_mb, M_mb * X_mb + (1 - M_mb) * self.uniform(shape=shape)
+
+    def generator(self, z: tf.Tensor, m: tf.Tensor) -> tf.Tensor:
+        G_h1: tf.Tensor = tf.nn.relu(
+            features=(self.matmul(a=tf.concat(values=[z, m], axis=2), b=self.G_W1) + self.G_b1))
+
+        return tf.nn.tanh(x=(self.matmul(a=G_h1, b=self.G_W2) + self.G_b2))  # returns `G_prob`, which is a Tensor
+
+    def discriminator(self, x: tf.Tensor) -> tf.Tensor:
+        D_h1: tf.Tensor = tf.nn.relu(features=(self.matmul(a=x, b=self.D_W1) + self.D_b1))
+
+        # the second layer of the generator, as in `purify.imputation.gain.SGAIN.discriminator`
+        return tf.nn.tanh(x=(self.matmul(a=D_h1, b=self.G_W2) + self.G_b2))  # returns `D_prob`, which is a Tensor
+
+    def correlation(self, x: tf.Tensor, y: tf.Tensor) -> tf.Tensor:
+        """Returns the correlation of each replica, i.e., a Tensor of K values."""
+        x_delta: tf.Tensor = x - tf.math.reduce_mean(input_tensor=x, axis=[1, 2], keepdims=True)
+        y_delta: tf.Tensor = y - tf.math.reduce_mean(input_tensor=y, axis=[1, 2], keepdims=True)
+
+        return tf.math.reduce_mean(input_tensor=(x_delta * y_delta), axis=[1, 2]) / \
+            (tf.math.reduce_std(input_tensor=x_delta, axis=[1, 2]) *
+             tf.math.reduce_std(input_tensor=y_delta, axis=[1, 2]))
+
+    def discriminator_loss(self, X: tf.Tensor, M: tf.Tensor, G_sample: tf.Tensor) -> tf.Tensor:
+        """Returns the loss of the discriminator of each replica, i.e., a Tensor of K values. Since the replicas are
+        independent, the gradients of their sum are the gradients of each replica (see `fused_step()`).
+        """
+        return tf.reduce_mean(input_tensor=(M * self.discriminator(x=X)), axis=[1, 2]) - \
+            tf.reduce_mean(input_tensor=((1 - M) * self.discriminator(x=G_sample)), axis=[1, 2])
+
+    def generator_losses(self, X: tf.Tensor, M: tf.Tensor, Z: tf.Tensor) -> Tuple[tf.Tensor, tf.Tensor, tf.Tensor]:
+        """Returns the loss of the generator, the MSE loss and the CORR loss of each replica."""
+        G_sample: tf.Tensor = self.generator(z=Z, m=M)
+        D_fake: tf.Tensor = tf.reduce_mean(input_tensor=((1 - M) * self.discriminator(x=G_sample)), axis=[1, 2])
+        CORR_loss: tf.Tensor = self.correlation(x=X, y=G_sample)
+        MSE_loss: tf.Tensor = tf.reduce_mean(input_tensor=(M * (X - G_sample)) ** 2, axis=[1, 2]) / \
+            tf.reduce_mean(input_tensor=M, axis=[1, 2])
+
+        if self.loss == 'mse':
+            return -D_fake + self.alpha * MSE_loss, MSE_loss, CORR_loss
+        elif self.loss == 'corr':
+            return -D_fake + self.alpha * (1 - CORR_loss), MSE_loss, CORR_loss
+        else:  # both
+            return -D_fake + self.alpha * (MSE_loss + (1 - CORR_loss)), MSE_loss, CORR_loss
+
+    def impute(self, sess: Any = None, ampu_mask: Union[np.ndarray, Mask] = None) -> np.ndarray:
+        """Imputes the missing values of the data by every replica and returns the mean of their imputations."""
+        return self.impute_many(ampu_masks=[ampu_mask] * self.n_replicas, sess=sess).mean(axis=0)
+
+    def impute_many(self,
+                    ampu_masks: List[Union[np.ndarray, Mask]] = None,
+                    sess: Any = None,
+                    rows: np.ndarray = None) -> np.ndarray:
+        """Imputes K amputations of the data, the k-th one by the k-th replica, i.e., for each chunk of (at most)
+        `chunk_rows` rows, a single (batched) forward pass (see :meth:`purify.imputation.base.BaseSGAIN.impute_many`).
+
+        Parameters
+        ----------
+        ampu_masks : List[Union[np.ndarray, Mask]], optional
+            K boolean (or bit-packed) masks of shape `(n_obs, m_dim)` (or `(len(rows), m_dim)`), by default the ones
+            the replicas are trained on, a `None` mask means that only the missing values are imputed.
+        sess : Any, optional
+            Ignored, as there is no session.
+        rows : np.ndarray, optional
+            The indices of the rows to impute, by default all of them.
+
+        Returns
+        -------
+        np.ndarray
+            The K imputations of the data (or of its `rows`), an array of shape `(K, n_rows, m_dim)`.
+        """
+        ampu_masks = self.ampu_masks if ampu_masks is None else ampu_masks
+        if len(ampu_masks) != self.n_replicas:
+            raise ValueError(f"Expecting {self.n_replicas} amputation masks (i.e., one per replica) "
+                             f"but got: {len(ampu_masks)}.")
+        n_rows: int = self.n_obs if rows is None else len(rows)
+        # the output is preallocated and every chunk of rows is written into it, thus the peak of memory is
+        # O(K * chunk_rows * m_dim) on top of the data and the output
+        imputed_data: np.ndarray = np.empty(shape=(self.n_replicas, n_rows, self.m_dim), dtype=np.float32)
+
+        for start in range(0, n_rows, self.chunk_rows):
+            stop: int = min(start + self.chunk_rows, n_rows)
+            index: Union[slice, np.ndarray] = slice(start, stop) if rows is None else rows[start:stop]
+            data_miss: np.ndarray = self.data_miss[index, :]
+            data_mask: np.ndarray = self.masks(data_mask=self.data_mask.unpack(rows=index), ampu_masks=ampu_masks,
+                                               rows=slice(start, stop)).astype(dtype=np.float32)
+            Z_all: np.ndarray = data_mask * data_miss + (1 - data_mask) * BaseSGAIN.sample_z(
+                n_rows=(self.n_replicas * (stop - start)), m_cols=self.m_dim).reshape(data_mask.shape)
+            chunk: np.ndarray = imputed_data[:, start:stop, :]
+
+            np.multiply(data_mask, data_miss, out=chunk)
+            chunk += (1 - data_mask) * self.generate(data_mask=data_mask, Z=Z_all)
+            # the inverse of the scaling (see `MinMaxScaler.inverse_transform()`), in place
+            chunk -= self.scaler.min_
+            chunk /= self.scaler.scale_
+        return imputed_data
+
+    def persisted_parameters(self) -> Dict[str, Any]:
+        """Returns the persisted algorithm parameters (see
+        :meth:`purify.imputation.base.BaseSGAIN.persisted_parameters`), which include `n_replicas`,
+        thus `from_state()` restores as many replicas.
+        """
+        return {**super().persisted_parameters(), 'n_replicas': self.n_replicas}
+
+    def state(self) -> Dict[str, np.ndarray]:
+        """Returns the state of the trained replicas (see :meth:`purify.imputation.base.BaseSGAIN.state`) along with
+        their amputation masks, bit-packed (see `Mask`), thus a restored ensemble imputes the same amputations.
+        """
+        ampu_masks: List[Mask] = [ampu_mask if ampu_mask is None or isinstance(ampu_mask, Mask) else
+                                  Mask.pack(mask=ampu_mask) for ampu_mask in self.ampu_masks]
+
+        return {**super().state(),
+                **{f"ampu_masks/{k}": np.asarray(ampu_mask.bits) for k, ampu_mask in enumerate(ampu_masks)
+                   if ampu_mask is not None}}
+
+    @classmethod
+    def from_state(cls,
+                   state: Dict[str, np.ndarray],
+                   data: np.ndarray,
+                   algo_parameters: Dict[str, Any] = None) -> 'SGAINEnsemble':
+        """Restores the trained replicas (see :meth:`purify.imputation.base.BaseSGAIN.from_state`) along with their
+        amputation masks (see `state()`), a replica whose mask is absent amputes nothing.
+        """
+        model: SGAINEnsemble = super().from_state(state=state, data=data, algo_parameters=algo_parameters)
+
+        model.ampu_masks = [Mask(bits=state[f"ampu_masks/{k}"], m_dim=model.m_dim) if f"ampu_masks/{k}" in state
+                            else None for k in range(model.n_replicas)]
+        return model
+
+    def append(self, new_rows: np.ndarray) -> None:
+        # the amputation masks of the replicas span the rows of the data, thus no row can be appended
+        raise ValueError(f"Expecting no new rows on an ensemble (i.e., its data is fixed) "
+                         f"but got an array of shape: {np.shape(new_rows)}.")
+
+    def generate(self, data_mask: np.ndarray, Z: np.ndarray, sess: Any = None) -> np.ndarray:
+        """Runs the (trained) generators of the replicas over `(K, n_rows, m_dim)` masks and noises, whereas
+        `(n_rows, m_dim)` ones (e.g., the new rows of `transform()`) are fed to every replica and the mean of their
+        outputs is returned.
+        """
+        if data_mask.ndim == 3:
+            return super().generate(data_mask=data_mask, Z=Z, sess=sess)
+        return super().generate(data_mask=np.broadcast_to(data_mask, shape=(self.n_replicas, *data_mask.shape)),
+                                Z=np.broadcast_to(Z, shape=(self.n_replicas, *Z.shape)), sess=sess).mean(axis=0)
+
+    def export(self, path: str, replica: int = 0) -> None:
+        """Exports the trained generator of a replica (and the scaler) for the NumPy runtime."""
+        # the biases of a replica are `(1, m_dim)` slices, whereas the runtime expects `(m_dim,)` ones
+        runtime.export(state={**self.state(), **{f"weights/{name}": value[replica, 0] if name[2] == 'b' else
+                                                 value[replica] for name, value in self.get_weights().items()}},
+                       path=path)
@@ -106,21 +106,14 @@ import tensorflow as tf
 from tensorflow.python.framework.ops import Operation, Tensor
 from tensorflow.python.ops.variables import RefVariable, VariableV1
 
-from sklearn.preprocessing import MinMaxScaler
-
-from GAIN.utils import sample_batch_index, rounding
-
-import logging
+from purify.imputation.base import BaseSGAIN
 
 from tqdm import tqdm
 
-from typing import Any, Dict, List, Set, Tuple, Union
-
+from typing import Any, Callable, Dict, List, Tuple
 
-tf.compat.v1.disable_v2_behavior()
 
-
-class SGAIN:
+class SGAIN(BaseSGAIN):
     """This class implements the Slim GAIN (SGAIN) algorithm [1].
 
     References
@@ -130,49 +123,80 @@ class SGAIN:
         International Conference on Computational Science (ICCS). Springer, Cham, 2021.
     """
 
+    FUSED_STEP: bool = True
+    """Whether the discriminator and the generator are trained by a single (fused) step op, see `train_step`."""
+
     def __init__(self, data: np.ndarray, algo_parameters: Dict[str, Any] = {}):
-        self.scaler: MinMaxScaler = MinMaxScaler(feature_range=(-1.00, +1.00))
-        self.data_miss: np.ndarray = self.scaler.fit_transform(X=data)
-        self.data_mask: np.ndarray = 1 - np.isnan(data)
-        self.n_obs: int = data.shape[0]
-        self.m_dim: int = data.shape[1]
-        # handling algorithm parameters, ensure that if one is absent then its default value is used
-        self.batch_size: int = min(algo_parameters['batch_size'], self.n_obs) if 'batch_size' in algo_parameters \
-            else int(np.ceil(np.sqrt(self.n_obs)))
-        self.loss: str = algo_parameters['loss'] if 'loss' in algo_parameters else 'both'
-        self.alpha: float = algo_parameters['alpha'] if 'alpha' in algo_parameters else 100
-        self.optimizer: str = algo_parameters['optimizer'] if 'optimizer' in algo_parameters else 'GDA'
-        self.learn_rate: float = algo_parameters['learn_rate'] if 'learn_rate' in algo_parameters else 0.001
-        self.beta_1: float = algo_parameters['beta_1'] if 'beta_1' in algo_parameters else 0.900
-        self.beta_2: float = algo_parameters['beta_2'] if 'beta_2' in algo_parameters else 0.999
-        self.decay: float = algo_parameters['decay'] if 'decay' in algo_parameters else 0.900
-        self.momentum: float = algo_parameters['momentum'] if 'momentum' in algo_parameters else 0.000
-        self.epsilon: float = algo_parameters['epsilon'] if 'epsilon' in algo_parameters else 1e-8
-        self.n_iterations: int = algo_parameters['n_iterations'] if 'n_iterations' in algo_parameters else 1000
-        self.verbose: bool = algo_parameters['verbose'] == 'True' if 'verbose' in algo_parameters else False
-        # self.continuous_vars: List[int] = algo_parameters['continuous_vars'] if 'continuous_vars' in algo_parameters \
-        #     else self._continuous_vars(data=data)
-
-        # replace missing values by zero, later on these will be imputed see `impute()` method
-        self.data_miss = np.nan_to_num(x=self.data_miss, nan=0.00)
-        # build the Generative Adversarial Network (GAN) architecture
-        self.gan_architecture()
-
-    @staticmethod
-    def _continuous_vars(data: np.ndarray) -> List[int]:
-        # maximal set for discrete variables
-        max_set: Set[Union[int, float]] = set([0, 1, np.NaN])
-
-        # if the result of the difference between the sets is NOT the empty set
-        # then the variable (i.e., column/feature) is a continuous one
-        return [var for var in range(data.shape[1])
-                if set([value for value in np.unique(ar=data[:, var]) if str(value) != 'nan']) - max_set]
+        # each model owns its graph (and its session), rather than growing the process-wide default graph,
+        # thus closing the model (see `close()`) and dropping it frees all of its TensorFlow resources
+        self.graph: tf.Graph = tf.Graph()
+        # the `warm_state()` of another model that the variables of the next session are loaded from once initialized,
+        # if any, it is applied only once, thus a later session (e.g., of a later `fit()`) starts from scratch
+        self.initial_state: Dict[str, Dict[str, np.ndarray]] = None
+        self.sess: tf.compat.v1.Session = None
+        super().__init__(data=data, algo_parameters=algo_parameters)
+
+    def build(self) -> None:
+        """Builds the model, i.e., its graph, which is run by sessions (see `open_session()`).
+        Since TensorFlow v2 behaviour is NOT disabled process-wide, the graph is entered explicitly.
+        """
+        with self.graph.as_default():
+            if self.seed is not None:
+                np.random.seed(seed=self.seed)
+                tf.compat.v1.set_random_seed(seed=self.seed)
+            # build the Generative Adversarial Network (GAN) architecture
+            self.gan_architecture()
+
+    def open_session(self) -> tf.compat.v1.Session:
+        """Opens a new session on the graph of the model (closing the previous one, if any) and
+        initializes the variables.
+        """
+        self.close()
+        self.sess = tf.compat.v1.Session(graph=self.graph, config=tf.compat.v1.ConfigProto(
+            intra_op_parallelism_threads=self.intra_op_threads, inter_op_parallelism_threads=self.inter_op_threads))
+        data_miss, data_mask = self.resident_data()
+        with self.graph.as_default():
+            self.sess.run(fetches=tf.compat.v1.global_variables_initializer(),
+                          feed_dict={self.data_init: data_miss, self.mask_init: data_mask,
+                                     self.rows_init: self.n_obs, self.recent_init: self.recent_row})
+        if self.initial_state is not None:
+            super().warm_start(state=self.initial_state)
+            self.initial_state = None
+        return self.sess
+
+    def close(self) -> None:
+        """Closes the session of the model, if any, which releases the resources (e.g., the variables) it holds."""
+        if self.sess is not None:
+            self.sess.close()
+            self.sess = None
+        super().close()
 
     def gan_architecture(self) -> None:
-        self.X: Tensor = tf.compat.v1.placeholder(dtype=tf.float32, shape=[None, self.m_dim])  # data Tensor
-        self.M: Tensor = tf.compat.v1.placeholder(dtype=tf.float32, shape=[None, self.m_dim])  # mask Tensor
+        # the (scaled) data and its mask live in the graph, they are loaded once per session (see `open_session()`),
+        # unless these are memory-mapped (see `input_pipeline()`), the mask is a boolean one (i.e., 1 byte per cell)
+        self.data_init: Tensor = tf.compat.v1.placeholder(dtype=tf.float32, shape=[None, self.m_dim])
+        self.mask_init: Tensor = tf.compat.v1.placeholder(dtype=tf.bool, shape=[None, self.m_dim])
+        self.data_var: VariableV1 = tf.compat.v1.Variable(
+            initial_value=self.data_init, trainable=False, validate_shape=False)
+        self.mask_var: VariableV1 = tf.compat.v1.Variable(
+            initial_value=self.mask_init, trainable=False, validate_shape=False)
+        # the number of rows and the first new row of a partial fit (see `input_pipeline()`), also loaded per session
+        self.rows_init: Tensor = tf.compat.v1.placeholder(dtype=tf.int32, shape=[])
+        self.recent_init: Tensor = tf.compat.v1.placeholder(dtype=tf.int32, shape=[])
+        self.rows_var: VariableV1 = tf.compat.v1.Variable(initial_value=self.rows_init, trainable=False)
+        self.recent_var: VariableV1 = tf.compat.v1.Variable(initial_value=self.recent_init, trainable=False)
+
+        X_mb: Tensor
+        M_mb: Tensor
+        Z_mb: Tensor
+
+        X_mb, M_mb, Z_mb = self.input_pipeline()
+        # by default each of the following Tensors is a mini-batch sampled in-graph, thus the training steps are run
+        # without feeding anything, yet they can be fed (e.g., to impute the data, see `impute_many()`)
+        self.X: Tensor = tf.compat.v1.placeholder_with_default(input=X_mb, shape=[None, self.m_dim])  # data Tensor
+        self.M: Tensor = tf.compat.v1.placeholder_with_default(input=M_mb, shape=[None, self.m_dim])  # mask Tensor
         # noise Tensor (data + noise in missing values)
-        self.Z: Tensor = tf.compat.v1.placeholder(dtype=tf.float32, shape=[None, self.m_dim])
+        self.Z: Tensor = tf.compat.v1.placeholder_with_default(input=Z_mb, shape=[None, self.m_dim])
 
         self.G_W1: VariableV1 = tf.compat.v1.Variable(
             initial_value=tf.random.uniform(shape=[2 * self.m_dim, self.m_dim], minval=-0.01, maxval=+0.01))
@@ -205,42 +229,54 @@ class SGAIN:
         self.MSE_loss: Tensor = tf.reduce_mean(
             input_tensor=(self.M * (self.X - self.G_sample)) ** 2) / tf.reduce_mean(input_tensor=self.M)
         ################################################################################################################
-        if self.loss == 'mse':
-            self.G_loss: Tensor = -tf.reduce_mean(input_tensor=((1 - self.M) * self.D_fake)) + \
-                                  self.alpha * self.MSE_loss
-        elif self.loss == 'corr':
-            self.G_loss: Tensor = -tf.reduce_mean(input_tensor=((1 - self.M) * self.D_fake)) + \
-                                  self.alpha * (1 - self.CORR_loss)
-        else:  # both
-            self.G_loss: Tensor = -tf.reduce_mean(input_tensor=((1 - self.M) * self.D_fake)) + \
-                                  self.alpha * (self.MSE_loss + (1 - self.CORR_loss))
+        self.G_loss: Tensor = self.generator_loss(D_fake=self.D_fake)
         ################################################################################################################
-        self.D_loss: Tensor = tf.reduce_mean(input_tensor=(self.M * self.D_real)) - \
-            tf.reduce_mean(input_tensor=((1 - self.M) * self.D_fake))
+        self.D_loss: Tensor = self.discriminator_loss()
 
         # the optimizer plays the minimax two-player game:
         #  - minimize the loss function of the generator
         #  - maximize the loss function of the discriminator, which is the same as
         #    minimize the loss function of the discriminator and multiply it by minus one
+        self.G_optimizer: tf.compat.v1.train.Optimizer = self.make_optimizer()
+        self.D_optimizer: tf.compat.v1.train.Optimizer = self.make_optimizer()
+        self.G_solver: Operation = self.G_optimizer.minimize(loss=self.G_loss, var_list=self.theta_G)
+        self.D_solver: Operation = self.D_optimizer.minimize(loss=-self.D_loss, var_list=self.theta_D)
+
+        if type(self).FUSED_STEP:
+            # the fused step trains the discriminator and then, on the same mini-batch and against the updated
+            # discriminator, trains the generator, i.e., one dispatch per iteration instead of two (see `fit()`);
+            # the generator shares its optimizer (and thus its slots) with `G_solver`
+            with tf.control_dependencies(control_inputs=[self.D_solver]):
+                self.G_loss_fused: Tensor = self.generator_loss(D_fake=self.discriminator(x=self.G_sample))
+            self.train_step: Operation = self.G_optimizer.minimize(loss=self.G_loss_fused, var_list=self.theta_G)
+            # the values of `LOSSES` as computed by the fused step
+            self.step_losses: List[Tensor] = [self.D_loss, self.G_loss_fused, self.MSE_loss, self.CORR_loss]
+
+    def discriminator_loss(self) -> Tensor:
+        """Builds the loss of the discriminator (or critic) on the mini-batch of the graph, which its (single) solver
+        maximizes (see `D_solver`), a critic whose loss is penalized (see `WSGAIN_GP`) overrides it.
+        """
+        return tf.reduce_mean(input_tensor=(self.M * self.D_real)) - \
+            tf.reduce_mean(input_tensor=((1 - self.M) * self.D_fake))
+
+    def make_optimizer(self) -> tf.compat.v1.train.Optimizer:
         if self.optimizer == 'GDA':
-            self.G_solver: Operation = tf.compat.v1.train.GradientDescentOptimizer(
-                learning_rate=self.learn_rate).minimize(loss=self.G_loss, var_list=self.theta_G)
-            self.D_solver: Operation = tf.compat.v1.train.GradientDescentOptimizer(
-                learning_rate=self.learn_rate).minimize(loss=-self.D_loss, var_list=self.theta_D)
+            return tf.compat.v1.train.GradientDescentOptimizer(learning_rate=self.learn_rate)
         elif self.optimizer == 'RMSProp':
-            self.G_solver: Operation = tf.compat.v1.train.RMSPropOptimizer(
-                learning_rate=self.learn_rate, decay=self.decay, momentum=self.momentum, epsilon=self.epsilon).minimize(
-                loss=self.G_loss, var_list=self.theta_G)
-            self.D_solver: Operation = tf.compat.v1.train.RMSPropOptimizer(
-                learning_rate=self.learn_rate, decay=self.decay, momentum=self.momentum, epsilon=self.epsilon).minimize(
-                loss=-self.D_loss, var_list=self.theta_D)
+            return tf.compat.v1.train.RMSPropOptimizer(
+                learning_rate=self.learn_rate, decay=self.decay, momentum=self.momentum, epsilon=self.epsilon)
         else:  # self.optimizer == 'Adam':
-            self.G_solver: Operation = tf.compat.v1.train.AdamOptimizer(
-                learning_rate=self.learn_rate, beta1=self.beta_1, beta2=self.beta_2, epsilon=self.epsilon).minimize(
-                loss=self.G_loss, var_list=self.theta_G)
-            self.D_solver: Operation = tf.compat.v1.train.AdamOptimizer(
-                learning_rate=self.learn_rate, beta1=self.beta_1, beta2=self.beta_2, epsilon=self.epsilon).minimize(
-                loss=-self.D_loss, var_list=self.theta_D)
+            return tf.compat.v1.train.AdamOptimizer(
+                learning_rate=self.learn_rate, beta1=self.beta_1, beta2=self.beta_2, epsilon=self.epsilon)
+
+    def generator_loss(self, D_fake: Tensor) -> Tensor:
+        if self.loss == 'mse':
+            return -tf.reduce_mean(input_tensor=((1 - self.M) * D_fake)) + self.alpha * self.MSE_loss
+        elif self.loss == 'corr':
+            return -tf.reduce_mean(input_tensor=((1 - self.M) * D_fake)) + self.alpha * (1 - self.CORR_loss)
+        else:  # both
+            return -tf.reduce_mean(input_tensor=((1 - self.M) * D_fake)) + \
+                   self.alpha * (self.MSE_loss + (1 - self.CORR_loss))
 
     ####################################################################################################################
     def correlation(self, x: tf.Tensor, y: tf.Tensor) -> tf.Tensor:
@@ -252,35 +288,102 @@ class SGAIN:
     ####################################################################################################################
 
     def generator(self, z: Tensor, m: Tensor) -> Tensor:
-        G_h1: Tensor = tf.nn.relu(features=(tf.matmul(a=tf.concat(values=[z, m], axis=1), b=self.G_W1) + self.G_b1))
+        G_h1: Tensor = tf.nn.relu(features=(self.matmul(a=tf.concat(values=[z, m], axis=1), b=self.G_W1) + self.G_b1))
 
-        return tf.nn.tanh(x=(tf.matmul(a=G_h1, b=self.G_W2) + self.G_b2))  # returns `G_prob`, which is a Tensor
+        return tf.nn.tanh(x=(self.matmul(a=G_h1, b=self.G_W2) + self.G_b2))  # returns `G_prob`, which is a Tensor
 
     def discriminator(self, x: Tensor) -> Tensor:
-        D_h1: Tensor = tf.nn.relu(features=(tf.matmul(a=x, b=self.D_W1) + self.D_b1))
-
-        return tf.nn.tanh(x=(tf.matmul(a=D_h1, b=self.G_W2) + self.G_b2))  # returns `D_prob`, which is a Tensor
-
-    @staticmethod
-    def sample_z(n_rows: int, m_cols: int, feature_range: Tuple[float, float] = (-0.01, +0.01)) -> np.ndarray:
-        return np.random.uniform(low=feature_range[0], high=feature_range[1], size=[n_rows, m_cols])
-
-    def impute(self, sess: tf.compat.v1.Session) -> np.ndarray:
-        Z_all: np.ndarray = self.data_mask * self.data_miss + (1 - self.data_mask) * SGAIN.sample_z(
-            n_rows=self.n_obs, m_cols=self.m_dim)
-        imputed_data: np.ndarray = sess.run(
-            fetches=[self.G_sample], feed_dict={self.M: self.data_mask, self.Z: Z_all})[0]
-
-        imputed_data = self.scaler.inverse_transform(
-            X=(self.data_mask * self.data_miss + (1 - self.data_mask) * imputed_data))
-        # imputed_data = rounding(imputed_data=imputed_data, data_x=self.data)
-        ################################################################################################################
-        # TODO: VERIFY THE IMPUTED DATA OF GAIN
-        ################################################################################################################
-        return imputed_data
-
-    def execute(self) -> np.ndarray:
-        """This method implements the Slim GAIN (SGAIN) algorithm [1].
+        D_h1: Tensor = tf.nn.relu(features=(self.matmul(a=x, b=self.D_W1) + self.D_b1))
+
+        return tf.nn.tanh(x=(self.matmul(a=D_h1, b=self.G_W2) + self.G_b2))  # returns `D_prob`, which is a Tensor
+
+    def matmul(self, a: Tensor, b: Tensor) -> Tensor:
+        """Multiplies two float32 Tensors, in bfloat16 if so asked (see `matmul_dtype`), the product is float32."""
+        if self.matmul_dtype == 'bfloat16':
+            return tf.cast(x=tf.matmul(a=tf.cast(x=a, dtype=tf.bfloat16), b=tf.cast(x=b, dtype=tf.bfloat16)),
+                           dtype=tf.float32)
+        return tf.matmul(a=a, b=b)
+
+    def input_pipeline(self) -> Tuple[Tensor, Tensor, Tensor]:
+        """Builds the in-graph sampling of a mini-batch, i.e., the batch indices (drawn with replacement),
+        the re-amputation mask (if any) and the noise are drawn by the graph each time the mini-batch is evaluated,
+        therefore, there is no host-side indexing nor any host-to-graph copy per training step.
+        During a partial fit (see `partial_fit()`), `recent_batch_size` of the rows are drawn from the new rows only.
+
+        Returns
+        -------
+        Tuple[Tensor, Tensor, Tensor]
+            The data, the mask and the noise (i.e., data + noise in missing values) Tensors of a mini-batch.
+        """
+        indices_mb: Tensor = tf.concat(values=[
+            tf.random.uniform(shape=[self.batch_size - self.recent_batch_size], maxval=self.rows_var, dtype=tf.int32),
+            tf.random.uniform(shape=[self.recent_batch_size], minval=self.recent_var, maxval=self.rows_var,
+                              dtype=tf.int32)], axis=0)
+        X_mb: Tensor
+        M_mb: Tensor
+
+        if self.mmap_dir is not None:
+            # the rows are gathered (by the host) from the memory-mapped data, see `gather()`
+            X_mb, M_mb = tf.numpy_function(func=self.gather, inp=[indices_mb], Tout=[tf.float32, tf.float32])
+            X_mb.set_shape(shape=[self.batch_size, self.m_dim])
+            M_mb.set_shape(shape=[self.batch_size, self.m_dim])
+        else:
+            X_mb = tf.gather(params=self.data_var, indices=indices_mb)
+            # the boolean mask is only expanded into a float32 one for the rows of the mini-batch
+            M_mb = tf.cast(x=tf.gather(params=self.mask_var, indices=indices_mb), dtype=tf.float32)
+
+        if self.ampu_rate > 0:
+            # the re-amputated values are hidden from the networks as if they were missing values
+            M_mb = M_mb * tf.cast(x=(tf.random.uniform(shape=tf.shape(input=M_mb)) >= self.ampu_rate), dtype=tf.float32)
+            X_mb = M_mb * X_mb
+        return X_mb, M_mb, M_mb * X_mb + (1 - M_mb) * tf.random.uniform(
+            shape=tf.shape(input=M_mb), minval=-0.01, maxval=+0.01)
+
+    def generate(self, data_mask: np.ndarray, Z: np.ndarray, sess: tf.compat.v1.Session = None) -> np.ndarray:
+        """Runs the (trained) generator, i.e., one forward pass over the given mask and noise."""
+        sess = self.sess if sess is None else sess
+        return sess.run(fetches=[self.G_sample], feed_dict={self.M: data_mask, self.Z: Z})[0]
+
+    def get_weights(self) -> Dict[str, np.ndarray]:
+        return dict(zip(SGAIN.WEIGHTS, self.sess.run(fetches=[getattr(self, name) for name in SGAIN.WEIGHTS])))
+
+    def set_weights(self, weights: Dict[str, np.ndarray]) -> None:
+        if self.sess is None:
+            self.open_session()
+        for name, value in weights.items():
+            getattr(self, name).load(value=value, session=self.sess)
+
+    def optimizer_variables(self) -> List[VariableV1]:
+        """Returns the variables of the optimizers, i.e., their slots and (e.g., Adam) accumulators."""
+        excluded: List[str] = [var.name for var in [*self.theta_G, *self.theta_D, self.data_var, self.mask_var,
+                                                    self.rows_var, self.recent_var]]
+        return [var for var in self.graph.get_collection(key=tf.compat.v1.GraphKeys.GLOBAL_VARIABLES)
+                if var.name not in excluded]
+
+    def get_slots(self) -> Dict[str, np.ndarray]:
+        variables: List[VariableV1] = self.optimizer_variables()
+        return dict(zip([var.op.name for var in variables], self.sess.run(fetches=variables)))
+
+    def set_slots(self, slots: Dict[str, np.ndarray]) -> None:
+        if self.sess is None:
+            self.open_session()
+        for var in self.optimizer_variables():
+            var.load(value=slots[var.op.name], session=self.sess)
+
+    def warm_start(self, state: Dict[str, Dict[str, np.ndarray]]) -> 'SGAIN':
+        # every (new) session initializes the variables from scratch, thus the state is loaded by `open_session()`
+        self.initial_state = state
+        return self
+
+    def fit(self, callback: Callable[[int, Dict[str, float]], None] = None, callback_every: int = 1) -> 'SGAIN':
+        """This method implements (the training of) the Slim GAIN (SGAIN) algorithm [1].
+
+        Parameters
+        ----------
+        callback : Callable[[int, Dict[str, float]], None]
+            A metrics callback, which is called with the iteration and the `LOSSES` every `callback_every` iterations.
+        callback_every : int
+            The number of iterations between calls to the metrics callback.
 
         References
         ----------
@@ -290,46 +393,21 @@ class SGAIN:
         """
         # config: tf.compat.v1.ConfigProto = tf.compat.v1.ConfigProto(device_count={'GPU': 0})
         # sess: tf.compat.v1.Session = tf.compat.v1.Session(config=config)
-        sess: tf.compat.v1.Session = tf.compat.v1.Session()
+        sess: tf.compat.v1.Session = self.open_session()
 
-        sess.run(fetches=tf.compat.v1.global_variables_initializer())
         for iteration in tqdm(range(self.n_iterations)):
-            indices_mb: List[int] = sample_batch_index(total=self.n_obs, batch_size=self.batch_size)
-            X_mb: np.ndarray = self.data_miss[indices_mb, :]
-            M_mb: np.ndarray = self.data_mask[indices_mb, :]
-            Z_mb: np.ndarray = M_mb * X_mb + (1 - M_mb) * SGAIN.sample_z(n_rows=self.batch_size, m_cols=self.m_dim)
-            D_loss_curr: float
-            G_loss_curr: float
-            MSE_loss_curr: float
-            CORR_loss_curr: float  # THIS IS NEW!
-
-            _, D_loss_curr = sess.run(
-                fetches=[self.D_solver, self.D_loss],
-                feed_dict={self.X: X_mb, self.M: M_mb, self.Z: Z_mb})
-
-            # NOTICE THE USE OF `CORR_loss_curr` AND `self.CORR_loss`
-            _, G_loss_curr, MSE_loss_curr, CORR_loss_curr = sess.run(
-                fetches=[self.G_solver, self.G_loss, self.MSE_loss, self.CORR_loss],
-                feed_dict={self.X: X_mb, self.M: M_mb, self.Z: Z_mb})
-
-            if self.verbose and (iteration % (self.n_iterations / 10) == 0):
-                # NOTICE THE USE OF `CORR_loss_curr`
-                info: str = f"iteration: {iteration}; " \
-                            f"D_loss: {D_loss_curr:.4}; G_loss: {G_loss_curr:.4}; " \
-                            f"MSE_loss: {MSE_loss_curr:.4}; CORR_loss: {CORR_loss_curr:.4}"
-
-                tqdm.write(info)
-                logging.info(info)
-
-        if self.verbose:
-            # NOTICE THE USE OF `CORR_loss_curr`
-            info = f"iteration: {iteration}; " \
-                   f"D_loss: {D_loss_curr:.4}; G_loss: {G_loss_curr:.4}; " \
-                   f"MSE_loss: {MSE_loss_curr:.4}; CORR_loss: {CORR_loss_curr:.4}"
-            tqdm.write(info)
-            logging.info(info)
-
-        return self.impute(sess=sess)
+            # the mini-batches are sampled in-graph (see `input_pipeline()`) and both networks are trained by
+            # a single dispatch of the fused step, the losses are only fetched when these are due
+            if self.losses_due(iteration=iteration, callback=callback, callback_every=callback_every):
+                losses: Dict[str, float] = dict(zip(SGAIN.LOSSES, sess.run(
+                    fetches=[self.train_step, *self.step_losses])[1:]))
+                self.report(iteration=iteration, losses=losses, callback=callback, callback_every=callback_every)
+            else:
+                sess.run(fetches=self.train_step)
+            if self.stop_early(iteration=iteration):
+                break
+
+        return self
 
 
 class WSGAIN(SGAIN):
@@ -344,6 +422,10 @@ class WSGAIN(SGAIN):
         "SGAIN, WSGAIN-CP and WSGAIN-GP: Novel GAN Methods for Missing Data Imputation."
         International Conference on Computational Science (ICCS). Springer, Cham, 2021.
     """
+
+    FUSED_STEP: bool = False
+    """The critic is trained a few times more per each train of the generator, hence, there is no fused step."""
+
     def __init__(self, data: np.ndarray, algo_parameters: Dict[str, Any] = {}):
         super().__init__(data=data, algo_parameters=algo_parameters)
         # NOTE: THIS DIVISION IS AN HACK TO PROMOTE FAIR COMPARISONS AS EXPLAINED IN THE ICCS 2021 PAPER,
@@ -357,13 +439,73 @@ class WSGAIN(SGAIN):
         pass
 
     def discriminator(self, x: Tensor) -> Tensor:
-        D_h1: Tensor = tf.nn.relu(features=(tf.matmul(a=x, b=self.D_W1) + self.D_b1))
+        D_h1: Tensor = tf.nn.relu(features=(self.matmul(a=x, b=self.D_W1) + self.D_b1))
 
-        return tf.matmul(a=D_h1, b=self.D_W2) + self.D_b2  # returns `D_prob`, which is a Tensor
+        return self.matmul(a=D_h1, b=self.D_W2) + self.D_b2  # returns `D_prob`, which is a Tensor
 
-    @abc.abstractmethod
-    def execute(self) -> np.ndarray:
-        return None
+    def critic_loss(self, X: Tensor, M: Tensor, G_sample: Tensor) -> Tensor:
+        return tf.reduce_mean(input_tensor=(M * self.discriminator(x=X))) - \
+            tf.reduce_mean(input_tensor=((1 - M) * self.discriminator(x=G_sample)))
+
+    def penalize(self) -> List[Operation]:
+        """Builds the penalty that is applied to the critic after each one of its updates, if any."""
+        return []
+
+    def critic_loop(self) -> Tensor:
+        """Builds the in-graph loop that trains the critic `n_critic` times, i.e., each iteration samples
+        a mini-batch (see `input_pipeline()`), updates the critic and then penalizes it (see `penalize()`),
+        thus the whole inner loop of the critic is a single dispatch (see `fit()`).
+
+        Returns
+        -------
+        Tensor
+            The loss of the critic at the last iteration of the loop, which runs the loop when it is evaluated.
+        """
+        def body(critic: Tensor, D_loss: Tensor) -> Tuple[Tensor, Tensor]:
+            X_mb, M_mb, Z_mb = self.input_pipeline()
+            D_loss = self.critic_loss(X=X_mb, M=M_mb, G_sample=self.generator(z=Z_mb, m=M_mb))
+            # the optimizer (and thus its slots) is the one of `D_solver`
+            D_solver: Operation = self.D_optimizer.minimize(loss=-D_loss, var_list=self.theta_D)
+
+            with tf.control_dependencies(control_inputs=[D_solver]):
+                penalty: List[Operation] = self.penalize()
+            with tf.control_dependencies(control_inputs=[D_solver, *penalty]):
+                return critic + 1, tf.identity(input=D_loss)
+
+        return tf.while_loop(cond=lambda critic, D_loss: critic < self.n_critic, body=body,
+                             loop_vars=[tf.constant(value=0), tf.constant(value=0.00)])[1]
+
+    def fit(self, callback: Callable[[int, Dict[str, float]], None] = None, callback_every: int = 1) -> 'WSGAIN':
+        """This method implements (the training of) the Wasserstein Slim GAIN with Clipping Penalty (WSGAIN-CP) and
+        the Wasserstein Slim GAIN with Gradient Penalty (WSGAIN-GP) algorithms [1],
+        see :meth:`purify.imputation.gain.SGAIN.fit` for the parameters.
+
+        References
+        ----------
+        [1] Neves, Diogo Telmo, Marcel Ganesh Naik, and Alberto Proença.
+            "SGAIN, WSGAIN-CP and WSGAIN-GP: Novel GAN Methods for Missing Data Imputation."
+            International Conference on Computational Science (ICCS). Springer, Cham, 2021.
+        """
+        # config: tf.compat.v1.ConfigProto = tf.compat.v1.ConfigProto(device_count={'GPU': 0})
+        # sess: tf.compat.v1.Session = tf.compat.v1.Session(config=config)
+        sess: tf.compat.v1.Session = self.open_session()
+
+        for iteration in tqdm(range(self.n_iterations)):
+            # two dispatches per iteration, i.e., the in-graph loop that trains the critic a few times more
+            # (see `critic_loop()`) and the train of the generator, the losses are only fetched when these are due
+            if self.losses_due(iteration=iteration, callback=callback, callback_every=callback_every):
+                D_loss_curr: float = sess.run(fetches=self.critic_step)
+                # NOTICE THE USE OF `self.CORR_loss`
+                losses: Dict[str, float] = dict(zip(SGAIN.LOSSES, [D_loss_curr, *sess.run(
+                    fetches=[self.G_solver, self.G_loss, self.MSE_loss, self.CORR_loss])[1:]]))
+                self.report(iteration=iteration, losses=losses, callback=callback, callback_every=callback_every)
+            else:
+                sess.run(fetches=self.critic_step.op)
+                sess.run(fetches=self.G_solver)
+            if self.stop_early(iteration=iteration):
+                break
+
+        return self
 
 
 class WSGAIN_CP(WSGAIN):
@@ -378,69 +520,19 @@ class WSGAIN_CP(WSGAIN):
     def __init__(self, data: np.ndarray, algo_parameters: Dict[str, Any] = {}):
         super().__init__(data=data, algo_parameters=algo_parameters)
         # some refinement needs to be introduced into the GAN architecture due to the clipping penalty
-        self.refine_gan_architecture(algo_parameters=algo_parameters)
+        with self.graph.as_default():
+            self.refine_gan_architecture(algo_parameters=algo_parameters)
+            self.critic_step: Tensor = self.critic_loop()
 
     def refine_gan_architecture(self, algo_parameters: Dict[str, Any]) -> None:
         clip_value: float = algo_parameters['clip_value'] if 'clip_value' in algo_parameters else 0.01
-        clip_value_min: float = min(-1 * clip_value, +1 * clip_value)
-        clip_value_max: float = max(-1 * clip_value, +1 * clip_value)
-
-        self.clip_D: List[Tensor] = [p.assign(value=tf.clip_by_value(
-            t=p, clip_value_min=clip_value_min, clip_value_max=clip_value_max)) for p in self.theta_D]
-
-    def execute(self) -> np.ndarray:
-        """This method implements the Wasserstein Slim GAIN with Clipping Penalty (WSGAIN-CP) algorithm [1].
-
-        References
-        ----------
-        [1] Neves, Diogo Telmo, Marcel Ganesh Naik, and Alberto Proença.
-            "SGAIN, WSGAIN-CP and WSGAIN-GP: Novel GAN Methods for Missing Data Imputation."
-            International Conference on Computational Science (ICCS). Springer, Cham, 2021.
-        """
-        # config: tf.compat.v1.ConfigProto = tf.compat.v1.ConfigProto(device_count={'GPU': 0})
-        # sess: tf.compat.v1.Session = tf.compat.v1.Session(config=config)
-        sess: tf.compat.v1.Session = tf.compat.v1.Session()
+        self.clip_value_min: float = min(-1 * clip_value, +1 * clip_value)
+        self.clip_value_max: float = max(-1 * clip_value, +1 * clip_value)
 
-        sess.run(fetches=tf.compat.v1.global_variables_initializer())
-        for iteration in tqdm(range(self.n_iterations)):
-            D_loss_curr: float
-            G_loss_curr: float
-            MSE_loss_curr: float
-            CORR_loss_curr: float  # THIS IS NEW!
-
-            for _ in range(self.n_critic):  # train the critic a few times more per each train of the generator
-                indices_mb: List[int] = sample_batch_index(total=self.n_obs, batch_size=self.batch_size)
-                X_mb: np.ndarray = self.data_miss[indices_mb, :]
-                M_mb: np.ndarray = self.data_mask[indices_mb, :]
-                Z_mb: np.ndarray = M_mb * X_mb + (1 - M_mb) * SGAIN.sample_z(n_rows=self.batch_size, m_cols=self.m_dim)
-
-                _, D_loss_curr, _ = sess.run(
-                    fetches=[self.D_solver, self.D_loss, self.clip_D],
-                    feed_dict={self.X: X_mb, self.M: M_mb, self.Z: Z_mb})
-
-            # NOTICE THE USE OF `CORR_loss_curr` AND `self.CORR_loss`
-            _, G_loss_curr, MSE_loss_curr, CORR_loss_curr = sess.run(
-                fetches=[self.G_solver, self.G_loss, self.MSE_loss, self.CORR_loss],
-                feed_dict={self.X: X_mb, self.M: M_mb, self.Z: Z_mb})
-
-            if self.verbose and (iteration % (self.n_iterations / 10) == 0):
-                # NOTICE THE USE OF `CORR_loss_curr`
-                info: str = f"iteration: {iteration}; " \
-                            f"D_loss: {D_loss_curr:.4}; G_loss: {G_loss_curr:.4}; " \
-                            f"MSE_loss: {MSE_loss_curr:.4}; CORR_loss: {CORR_loss_curr:.4}"
-
-                tqdm.write(info)
-                logging.info(info)
-
-        if self.verbose:
-            # NOTICE THE USE OF `CORR_loss_curr`
-            info = f"iteration: {iteration}; " \
-                   f"D_loss: {D_loss_curr:.4}; G_loss: {G_loss_curr:.4}; " \
-                   f"MSE_loss: {MSE_loss_curr:.4}; CORR_loss: {CORR_loss_curr:.4}"
-            tqdm.write(info)
-            logging.info(info)
-
-        return self.impute(sess=sess)
+    def penalize(self) -> List[Operation]:
+        # the clipping of the weights of the critic
+        return [p.assign(value=tf.clip_by_value(
+            t=p, clip_value_min=self.clip_value_min, clip_value_max=self.clip_value_max)) for p in self.theta_D]
 
 
 class WSGAIN_GP(WSGAIN):
@@ -453,14 +545,27 @@ class WSGAIN_GP(WSGAIN):
         International Conference on Computational Science (ICCS). Springer, Cham, 2021.
     """
     def __init__(self, data: np.ndarray, algo_parameters: Dict[str, Any] = {}):
-        super().__init__(data=data, algo_parameters=algo_parameters)
+        # the weight of the gradient penalty is set beforehand, since the graph (see `discriminator_loss()`) needs it
         self.lambd: float = algo_parameters['lambd'] if 'lambd' in algo_parameters else 10
+        super().__init__(data=data, algo_parameters=algo_parameters)
         # some refinement needs to be introduced into the GAN architecture due to the gradient penalty
-        self.refine_gan_architecture(algo_parameters=algo_parameters)
+        with self.graph.as_default():
+            self.refine_gan_architecture(algo_parameters=algo_parameters)
+            self.critic_step: Tensor = self.critic_loop()
 
     def refine_gan_architecture(self, algo_parameters: Dict[str, Any]) -> None:
-        eps: np.ndarray = SGAIN.sample_z(n_rows=self.batch_size, m_cols=self.m_dim)
-        X_inter: Tensor = eps * (self.M * self.X) + (1 - eps) * ((1 - self.M) * self.G_sample)
+        # the gradient penalty is part of the loss of the critic (see `discriminator_loss()`), thus of the solver
+        # that `gan_architecture()` builds, hence nothing is rebuilt (the iterations of `critic_loop()` build their own)
+        pass
+
+    def discriminator_loss(self) -> Tensor:
+        return self.critic_loss(X=self.X, M=self.M, G_sample=self.G_sample)
+
+    def critic_loss(self, X: Tensor, M: Tensor, G_sample: Tensor) -> Tensor:
+        # the interpolation weights are drawn in-graph, thus they are new ones at each step (and iteration of the loop),
+        # from U(0, 1) as in WGAN-GP, hence the penalized points span the segments between real and generated samples
+        eps: Tensor = tf.random.uniform(shape=tf.shape(input=M), minval=0.00, maxval=1.00)
+        X_inter: Tensor = eps * (M * X) + (1 - eps) * ((1 - M) * G_sample)
         grad: Tensor = tf.gradients(ys=self.discriminator(x=X_inter), xs=[X_inter])[0]
         # note: `self.epsilon` is used as a workaround to the bug mentioned in
         #       https://github.com/pytorch/pytorch/issues/2534
@@ -470,61 +575,4 @@ class WSGAIN_GP(WSGAIN):
         grad_norm: Tensor = tf.sqrt(self.epsilon + tf.reduce_sum(input_tensor=(grad ** 2), axis=1))
         grad_pen: Tensor = self.lambd * tf.reduce_mean(input_tensor=((grad_norm - 1) ** 2))
 
-        self.D_loss: Tensor = tf.reduce_mean(input_tensor=(self.M * self.D_real)) - tf.reduce_mean(
-            input_tensor=((1 - self.M) * self.D_fake)) + grad_pen
-
-    def execute(self) -> np.ndarray:
-        """This method implements the Wasserstein Slim GAIN with Clipping Penalty (WSGAIN-CP) algorithm [1].
-
-        References
-        ----------
-        [1] Neves, Diogo Telmo, Marcel Ganesh Naik, and Alberto Proença.
-            "SGAIN, WSGAIN-CP and WSGAIN-GP: Novel GAN Methods for Missing Data Imputation."
-            International Conference on Computational Science (ICCS). Springer, Cham, 2021.
-        """
-        # config: tf.compat.v1.ConfigProto = tf.compat.v1.ConfigProto(device_count={'GPU': 0})
-        # sess: tf.compat.v1.Session = tf.compat.v1.Session(config=config)
-        sess: tf.compat.v1.Session = tf.compat.v1.Session()
-
-        sess.run(fetches=tf.compat.v1.global_variables_initializer())
-        sess.run(fetches=tf.compat.v1.global_variables_initializer())
-        for iteration in tqdm(range(self.n_iterations)):
-            D_loss_curr: float
-            G_loss_curr: float
-            MSE_loss_curr: float
-            CORR_loss_curr: float  # THIS IS NEW!
-
-            for _ in range(self.n_critic):  # train the critic a few times more per each train of the generator
-                indices_mb: List[int] = sample_batch_index(total=self.n_obs, batch_size=self.batch_size)
-                X_mb: np.ndarray = self.data_miss[indices_mb, :]
-                M_mb: np.ndarray = self.data_mask[indices_mb, :]
-                Z_mb: np.ndarray = M_mb * X_mb + (1 - M_mb) * SGAIN.sample_z(n_rows=self.batch_size, m_cols=self.m_dim)
-
-                _, D_loss_curr = sess.run(
-                    fetches=[self.D_solver, self.D_loss],
-                    feed_dict={self.X: X_mb, self.M: M_mb, self.Z: Z_mb})
-
-            # NOTICE THE USE OF `CORR_loss_curr` AND `self.CORR_loss`
-            _, G_loss_curr, MSE_loss_curr, CORR_loss_curr = sess.run(
-                fetches=[self.G_solver, self.G_loss, self.MSE_loss, self.CORR_loss],
-                feed_dict={self.X: X_mb, self.M: M_mb, self.Z: Z_mb})
-
-            if self.verbose and (iteration % (self.n_iterations / 10) == 0):
-                # NOTICE THE USE OF `CORR_loss_curr`
-                info: str = f"iteration: {iteration}; " \
-                            f"D_loss: {D_loss_curr:.4}; G_loss: {G_loss_curr:.4}; " \
-                            f"MSE_loss: {MSE_loss_curr:.4}; CORR_loss: {CORR_loss_curr:.4}"
-
-                tqdm.write(info)
-                logging.info(info)
-
-        if self.verbose:
-            # NOTICE THE USE OF `CORR_loss_curr`
-            info = f"iteration: {iteration}; " \
-                   f"D_loss: {D_loss_curr:.4}; G_loss: {G_loss_curr:.4}; " \
-                   f"MSE_loss: {MSE_loss_curr:.4}; CORR_loss: {CORR_loss_curr:.4}"
-            tqdm.write(info)
-            logging.info(info)
-
-        return self.impute(sess=sess)
-
+        return super().critic_loss(X=X, M=M, G_sample=G_sample) + grad_pen
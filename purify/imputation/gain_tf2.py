@@ -0,0 +1,497 @@
+########################################################################################################################
+# Research Centers
+# ----------------
+# Medical Informatics Group
+# BIH - Berlin Institute of Health
+# Charité - Universitätsmedizin Berlin
+# https://www.bihealth.org/en/research/research-groups/fabian-prasser/
+#
+# Centro ALGORITMI - School of Engineering – University of Minho
+# Braga - Portugal
+# http://algoritmi.uminho.pt/
+#
+#
+# Description
+# -----------
+# This module implements the SGAIN, WSGAIN-CP and WSGAIN-GP algorithms on TensorFlow 2, i.e., eager variables and
+# training steps that are compiled by XLA (`tf.function(jit_compile=True)`), rather than the TensorFlow 1 (compat)
+# graphs and sessions of `purify.imputation.gain`, which is named the session engine.
+# The algorithms, their parameters, their update rules (see `Optimizer`) and the format of their saved models are
+# the same ones of the session engine, thus a model trained by one engine can be loaded by the other.
+# An engine is picked through `algo_parameters['engine']` (see `purify.generation.tabulator.TabularDataGenerator`).
+#
+#
+# Moto
+# ----
+# "We think too much and feel too little. More than machinery we need humanity."
+#                         -- Excerpt of the final speech from The Great Dictator
+#
+#
+# Authors
+# -------
+# diogo telmo neves -- {dneves@di.uminho.pt, diogo-telmo.neves@charite.de, tada.science@gmail.com}
+#
+#
+# Copyright
+# ---------
+# Copyright (c) 2021 diogo telmo neves.
+# All rights reserved.
+#
+#
+# Conditions
+# ----------
+# This code is free/open source code but the following conditions must be met:
+#   * Redistributions of source code must retain the above copyright notice, this list of conditions and
+#     the following disclaimer in the documentation and/or other materials provided with the distribution.
+#   * Redistributions in binary form must reproduce the above copyright notice, this list of conditions and
+#     the following disclaimer in the documentation and/or other materials provided with the distribution.
+#
+#
+# DISCLAIMER
+# ----------
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND
+# FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR
+# TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#
+# Date
+# ----
+# October 2026
+########################################################################################################################
+
+import numpy as np
+
+import tensorflow as tf
+
+from purify.imputation import gain
+from purify.imputation.base import BaseSGAIN
+
+from tqdm import tqdm
+
+import logging
+
+from typing import Any, Callable, Dict, List, Tuple
+
+
+class Optimizer:
+    """This class implements the update rules of the `tf.compat.v1.train` optimizers used by the session engine,
+    i.e., gradient descent (GDA), RMSProp and Adam, on `tf.Variable`s that can be updated by compiled functions.
+    """
+
+    def __init__(self, model: gain.SGAIN, var_list: List[tf.Variable]):
+        self.optimizer: str = model.optimizer
+        self.learn_rate: float = model.learn_rate
+        self.beta_1: float = model.beta_1
+        self.beta_2: float = model.beta_2
+        self.decay: float = model.decay
+        self.momentum: float = model.momentum
+        self.epsilon: float = model.epsilon
+        self.var_list: List[tf.Variable] = var_list
+        # the slots of each variable, the ones of RMSProp are initialized as the ones of `tf.compat.v1.train`
+        self.slots: Dict[str, List[tf.Variable]] = {}
+        if self.optimizer == 'RMSProp':
+            self.slots['rms'] = [
+                tf.Variable(initial_value=tf.ones_like(input=var), trainable=False) for var in var_list]
+            self.slots['momentum'] = [
+                tf.Variable(initial_value=tf.zeros_like(input=var), trainable=False) for var in var_list]
+        elif self.optimizer != 'GDA':  # self.optimizer == 'Adam':
+            self.slots['m'] = [tf.Variable(initial_value=tf.zeros_like(input=var), trainable=False) for var in var_list]
+            self.slots['v'] = [tf.Variable(initial_value=tf.zeros_like(input=var), trainable=False) for var in var_list]
+        self.beta_1_power: tf.Variable = tf.Variable(initial_value=self.beta_1, dtype=tf.float32, trainable=False)
+        self.beta_2_power: tf.Variable = tf.Variable(initial_value=self.beta_2, dtype=tf.float32, trainable=False)
+
+    def apply(self, grads: List[tf.Tensor]) -> None:
+        """Updates the variables given their gradients, a `None` gradient (i.e., of a variable that does NOT take
+        part in the loss) is skipped as `tf.compat.v1.train.Optimizer.minimize()` does.
+        """
+        learn_rate: tf.Tensor = self.learn_rate * tf.sqrt(1 - self.beta_2_power) / (1 - self.beta_1_power)
+
+        for i, (var, grad) in enumerate(zip(self.var_list, grads)):
+            if grad is None:
+                continue
+            if self.optimizer == 'GDA':
+                var.assign_sub(delta=(self.learn_rate * grad))
+            elif self.optimizer == 'RMSProp':
+                self.slots['rms'][i].assign_add(delta=((grad ** 2 - self.slots['rms'][i]) * (1 - self.decay)))
+                self.slots['momentum'][i].assign(value=(self.momentum * self.slots['momentum'][i] + self.learn_rate *
+                                                        grad / tf.sqrt(self.slots['rms'][i] + self.epsilon)))
+                var.assign_sub(delta=self.slots['momentum'][i])
+            else:  # self.optimizer == 'Adam':
+                self.slots['m'][i].assign_add(delta=((grad - self.slots['m'][i]) * (1 - self.beta_1)))
+                self.slots['v'][i].assign_add(delta=((grad ** 2 - self.slots['v'][i]) * (1 - self.beta_2)))
+                var.assign_sub(delta=(learn_rate * self.slots['m'][i] / (tf.sqrt(self.slots['v'][i]) + self.epsilon)))
+        if self.optimizer == 'Adam':
+            self.beta_1_power.assign(value=(self.beta_1_power * self.beta_1))
+            self.beta_2_power.assign(value=(self.beta_2_power * self.beta_2))
+
+    def get_slots(self) -> Dict[str, np.ndarray]:
+        """Returns the slots of each variable (by slot name and index) along with the powers of the betas."""
+        return {**{f"{name}/{i}": slot.numpy() for name, slots in self.slots.items() for i, slot in enumerate(slots)},
+                'beta_1_power': self.beta_1_power.numpy(), 'beta_2_power': self.beta_2_power.numpy()}
+
+    def set_slots(self, slots: Dict[str, np.ndarray]) -> None:
+        for name, values in self.slots.items():
+            for i, slot in enumerate(values):
+                slot.assign(value=slots[f"{name}/{i}"])
+        self.beta_1_power.assign(value=slots['beta_1_power'])
+        self.beta_2_power.assign(value=slots['beta_2_power'])
+
+
+class SGAIN(gain.SGAIN):
+    """This class implements the Slim GAIN (SGAIN) algorithm [1] on the TensorFlow 2 engine, the parameters,
+    the persistence and the imputation of a model are the ones of :class:`purify.imputation.gain.SGAIN`.
+
+    References
+    ----------
+    [1] Neves, Diogo Telmo, Marcel Ganesh Naik, and Alberto Proença.
+        "SGAIN, WSGAIN-CP and WSGAIN-GP: Novel GAN Methods for Missing Data Imputation."
+        International Conference on Computational Science (ICCS). Springer, Cham, 2021.
+    """
+
+    def __init__(self, data: np.ndarray, algo_parameters: Dict[str, Any] = {}):
+        # there is neither a graph nor a session (see `build()`), thus the initializer of the session engine is
+        # skipped, i.e., no (empty) graph is created and there is neither a `sess` nor an `initial_state`
+        BaseSGAIN.__init__(self, data=data, algo_parameters=algo_parameters)
+
+    def close(self) -> None:
+        """Releases the memory-mapped files of the data, if any, there is no session to close."""
+        BaseSGAIN.close(self)
+
+    def build(self) -> None:
+        """Builds the model, i.e., its variables and its compiled training step(s), there is neither a graph nor
+        a session. The variables are initialized right away, thus calling `fit()` again resumes the training.
+        """
+        self.configure_threading()
+        # draws the initial weights as well as the mini-batches, hence a given seed makes the training reproducible
+        self.rng: tf.random.Generator = tf.random.Generator.from_seed(seed=self.seed) if self.seed is not None \
+            else tf.random.Generator.from_non_deterministic_state()
+        if self.seed is not None:
+            np.random.seed(seed=self.seed)
+        # the (scaled) data and its mask, they are (re-)loaded by `fit()`
+        self.data_var: tf.Variable = tf.Variable(initial_value=tf.zeros(shape=[0, self.m_dim]), trainable=False,
+                                                 shape=tf.TensorShape(dims=[None, self.m_dim]))
+        self.mask_var: tf.Variable = tf.Variable(initial_value=tf.zeros(shape=[0, self.m_dim], dtype=tf.bool),
+                                                 trainable=False, shape=tf.TensorShape(dims=[None, self.m_dim]))
+        # the number of rows and the first new row of a partial fit (see `input_pipeline()`), also (re-)loaded
+        self.rows_var: tf.Variable = tf.Variable(initial_value=self.n_obs, trainable=False, dtype=tf.int32)
+        self.recent_var: tf.Variable = tf.Variable(initial_value=0, trainable=False, dtype=tf.int32)
+
+        self.G_W1: tf.Variable = tf.Variable(initial_value=self.uniform(shape=[2 * self.m_dim, self.m_dim]))
+        self.G_b1: tf.Variable = tf.Variable(initial_value=tf.zeros(shape=[self.m_dim]))
+
+        self.G_W2: tf.Variable = tf.Variable(initial_value=self.uniform(shape=[self.m_dim, self.m_dim]))
+        self.G_b2: tf.Variable = tf.Variable(initial_value=tf.zeros(shape=[self.m_dim]))
+
+        self.theta_G: List[tf.Variable] = [self.G_W1, self.G_W2, self.G_b1, self.G_b2]
+
+        self.D_W1: tf.Variable = tf.Variable(initial_value=self.uniform(shape=[self.m_dim, self.m_dim]))
+        self.D_b1: tf.Variable = tf.Variable(initial_value=tf.zeros(shape=[self.m_dim]))
+
+        self.D_W2: tf.Variable = tf.Variable(initial_value=self.uniform(shape=[self.m_dim, self.m_dim]))
+        self.D_b2: tf.Variable = tf.Variable(initial_value=tf.zeros(shape=[self.m_dim]))
+
+        self.theta_D: List[tf.Variable] = [self.D_W1, self.D_W2, self.D_b1, self.D_b2]
+
+        self.G_optimizer: Optimizer = Optimizer(model=self, var_list=self.theta_G)
+        self.D_optimizer: Optimizer = Optimizer(model=self, var_list=self.theta_D)
+        # the memory-mapped data is gathered by the host (see `input_pipeline()`), which XLA can NOT compile
+        self.train_step: Callable[[], List[tf.Tensor]] = tf.function(
+            func=self.fused_step, jit_compile=self.mmap_dir is None)
+
+    def configure_threading(self) -> None:
+        """Sets the number of threads of the intra-op and inter-op pools, if given. Unlike a session, these pools are
+        process-wide and can only be set before TensorFlow initializes its runtime, otherwise they are kept as they are.
+        """
+        try:
+            if self.intra_op_threads > 0 and \
+                    tf.config.threading.get_intra_op_parallelism_threads() != self.intra_op_threads:
+                tf.config.threading.set_intra_op_parallelism_threads(num_threads=self.intra_op_threads)
+            if self.inter_op_threads > 0 and \
+                    tf.config.threading.get_inter_op_parallelism_threads() != self.inter_op_threads:
+                tf.config.threading.set_inter_op_parallelism_threads(num_threads=self.inter_op_threads)
+        except RuntimeError:
+            logging.warning("The TensorFlow runtime is already initialized, thus its threading is NOT changed.")
+
+    def uniform(self, shape: List[int]) -> tf.Tensor:
+        return self.rng.uniform(shape=shape, minval=-0.01, maxval=+0.01)
+
+    def load_data(self) -> None:
+        """Loads the (scaled) data and its mask into the model, which is what a new session does on the session
+        engine (see :meth:`purify.imputation.gain.SGAIN.open_session`).
+        """
+        data_miss, data_mask = self.resident_data()
+        self.data_var.assign(value=data_miss)
+        self.mask_var.assign(value=data_mask)
+        self.rows_var.assign(value=self.n_obs)
+        self.recent_var.assign(value=self.recent_row)
+
+    def input_pipeline(self) -> Tuple[tf.Tensor, tf.Tensor, tf.Tensor]:
+        """Samples a mini-batch, as :meth:`purify.imputation.gain.SGAIN.input_pipeline` does, but from the random
+        number generator of the model, which is compatible with XLA.
+        """
+        indices_mb: tf.Tensor = tf.concat(values=[
+            self.rng.uniform(shape=[self.batch_size - self.recent_batch_size], minval=0, maxval=self.rows_var,
+                             dtype=tf.int32),
+            self.rng.uniform(shape=[self.recent_batch_size], minval=self.recent_var, maxval=self.rows_var,
+                             dtype=tf.int32)], axis=0)
+        X_mb: tf.Tensor
+        M_mb: tf.Tensor
+
+        if self.mmap_dir is not None:
+            # the rows are gathered (by the host) from the memory-mapped data, see `gather()`
+            X_mb, M_mb = tf.numpy_function(func=self.gather, inp=[indices_mb], Tout=[tf.float32, tf.float32])
+            X_mb.set_shape(shape=[self.batch_size, self.m_dim])
+            M_mb.set_shape(shape=[self.batch_size, self.m_dim])
+        else:
+            X_mb = tf.gather(params=self.data_var, indices=indices_mb)
+            # the boolean mask is only expanded into a float32 one for the rows of the mini-batch
+            M_mb = tf.cast(x=tf.gather(params=self.mask_var, indices=indices_mb), dtype=tf.float32)
+
+        if self.ampu_rate > 0:
+            # the re-amputated values are hidden from the networks as if they were missing values
+            M_mb = M_mb * tf.cast(x=(self.rng.uniform(shape=[self.batch_size, self.m_dim]) >= self.ampu_rate),
+                                  dtype=tf.float32)
+            X_mb = M_mb * X_mb
+        return X_mb, M_mb, M_mb * X_mb + (1 - M_mb) * self.uniform(shape=[self.batch_size, self.m_dim])
+
+    def discriminator_loss(self, X: tf.Tensor, M: tf.Tensor, G_sample: tf.Tensor) -> tf.Tensor:
+        return tf.reduce_mean(input_tensor=(M * self.discriminator(x=X))) - \
+            tf.reduce_mean(input_tensor=((1 - M) * self.discriminator(x=G_sample)))
+
+    def generator_losses(self, X: tf.Tensor, M: tf.Tensor, Z: tf.Tensor) -> Tuple[tf.Tensor, tf.Tensor, tf.Tensor]:
+        """Returns the loss of the generator, the MSE loss and the CORR loss."""
+        G_sample: tf.Tensor = self.generator(z=Z, m=M)
+        D_fake: tf.Tensor = self.discriminator(x=G_sample)
+        CORR_loss: tf.Tensor = self.correlation(x=X, y=G_sample)
+        MSE_loss: tf.Tensor = tf.reduce_mean(input_tensor=(M * (X - G_sample)) ** 2) / tf.reduce_mean(input_tensor=M)
+
+        if self.loss == 'mse':
+            return -tf.reduce_mean(input_tensor=((1 - M) * D_fake)) + self.alpha * MSE_loss, MSE_loss, CORR_loss
+        elif self.loss == 'corr':
+            return -tf.reduce_mean(input_tensor=((1 - M) * D_fake)) + self.alpha * (1 - CORR_loss), MSE_loss, CORR_loss
+        else:  # both
+            return -tf.reduce_mean(input_tensor=((1 - M) * D_fake)) + \
+                   self.alpha * (MSE_loss + (1 - CORR_loss)), MSE_loss, CORR_loss
+
+    def fused_step(self) -> List[tf.Tensor]:
+        """Trains the discriminator and then, on the same mini-batch and against the updated discriminator,
+        trains the generator (see :attr:`purify.imputation.gain.SGAIN.train_step`).
+
+        Returns
+        -------
+        List[tf.Tensor]
+            The `LOSSES`.
+        """
+        X, M, Z = self.input_pipeline()
+
+        with tf.GradientTape() as tape:
+            D_loss: tf.Tensor = self.discriminator_loss(X=X, M=M, G_sample=self.generator(z=Z, m=M))
+        self.D_optimizer.apply(grads=tape.gradient(target=-D_loss, sources=self.theta_D))
+        with tf.GradientTape() as tape:
+            G_loss, MSE_loss, CORR_loss = self.generator_losses(X=X, M=M, Z=Z)
+        self.G_optimizer.apply(grads=tape.gradient(target=G_loss, sources=self.theta_G))
+        return [D_loss, G_loss, MSE_loss, CORR_loss]
+
+    def get_weights(self) -> Dict[str, np.ndarray]:
+        return {name: getattr(self, name).numpy() for name in gain.SGAIN.WEIGHTS}
+
+    def set_weights(self, weights: Dict[str, np.ndarray]) -> None:
+        for name, value in weights.items():
+            getattr(self, name).assign(value=value)
+
+    def get_slots(self) -> Dict[str, np.ndarray]:
+        return {f"{optimizer}/{name}": value for optimizer in ('G_optimizer', 'D_optimizer')
+                for name, value in getattr(self, optimizer).get_slots().items()}
+
+    def set_slots(self, slots: Dict[str, np.ndarray]) -> None:
+        for optimizer in ('G_optimizer', 'D_optimizer'):
+            getattr(self, optimizer).set_slots(slots={name[len(optimizer) + 1:]: value for name, value in slots.items()
+                                                      if name.startswith(f"{optimizer}/")})
+
+    def warm_start(self, state: Dict[str, Dict[str, np.ndarray]]) -> 'SGAIN':
+        # the variables outlive `fit()`, thus the state is loaded right away (unlike on the session engine)
+        return BaseSGAIN.warm_start(self, state=state)
+
+    def generate(self, data_mask: np.ndarray, Z: np.ndarray, sess: tf.compat.v1.Session = None) -> np.ndarray:
+        """Runs the (trained) generator, i.e., one forward pass over the given mask and noise (`sess` is ignored)."""
+        return self.generator(z=tf.constant(value=Z, dtype=tf.float32),
+                              m=tf.constant(value=data_mask, dtype=tf.float32)).numpy()
+
+    def fit(self, callback: Callable[[int, Dict[str, float]], None] = None, callback_every: int = 1) -> 'SGAIN':
+        """This method implements (the training of) the Slim GAIN (SGAIN) algorithm [1],
+        see :meth:`purify.imputation.gain.SGAIN.fit` for the parameters.
+
+        References
+        ----------
+        [1] Neves, Diogo Telmo, Marcel Ganesh Naik, and Alberto Proença.
+            "SGAIN, WSGAIN-CP and WSGAIN-GP: Novel GAN Methods for Missing Data Imputation."
+            International Conference on Computational Science (ICCS). Springer, Cham, 2021.
+        """
+        self.load_data()
+        for iteration in tqdm(range(self.n_iterations)):
+            # one dispatch of the compiled fused step, the losses are only copied out when these are due
+            losses: List[tf.Tensor] = self.train_step()
+
+            if self.losses_due(iteration=iteration, callback=callback, callback_every=callback_every):
+                # the mean is the loss itself, unless there are several replicas (see `purify.imputation.ensemble`)
+                self.report(iteration=iteration,
+                            losses=dict(zip(gain.SGAIN.LOSSES, [float(tf.reduce_mean(input_tensor=loss))
+                                                                for loss in losses])),
+                            callback=callback, callback_every=callback_every)
+            if self.stop_early(iteration=iteration):
+                break
+
+        return self
+
+
+class WSGAIN(SGAIN):
+    """This class is the TensorFlow 2 counterpart of :class:`purify.imputation.gain.WSGAIN`, i.e., it implements
+    what the WSGAIN-CP and the WSGAIN-GP algorithms [1] have in common.
+
+    References
+    ----------
+    [1] Neves, Diogo Telmo, Marcel Ganesh Naik, and Alberto Proença.
+        "SGAIN, WSGAIN-CP and WSGAIN-GP: Novel GAN Methods for Missing Data Imputation."
+        International Conference on Computational Science (ICCS). Springer, Cham, 2021.
+    """
+
+    def __init__(self, data: np.ndarray, algo_parameters: Dict[str, Any] = {}):
+        super().__init__(data=data, algo_parameters=algo_parameters)
+        # NOTE: THE SAME HACK OF `purify.imputation.gain.WSGAIN` TO PROMOTE FAIR COMPARISONS
+        self.n_iterations: int = int(np.ceil(self.n_iterations / 3))
+        self.n_critic: int = algo_parameters['n_critic'] if 'n_critic' in algo_parameters else 5
+
+    def build(self) -> None:
+        super().build()
+        self.critic_step: Callable[[], tf.Tensor] = tf.function(
+            func=self.critic_loop, jit_compile=self.mmap_dir is None)
+        self.generator_step: Callable[[], List[tf.Tensor]] = tf.function(
+            func=self.generator_train_step, jit_compile=self.mmap_dir is None)
+
+    def discriminator(self, x: tf.Tensor) -> tf.Tensor:
+        return gain.WSGAIN.discriminator(self, x=x)
+
+    def critic_loss(self, X: tf.Tensor, M: tf.Tensor, G_sample: tf.Tensor) -> tf.Tensor:
+        return self.discriminator_loss(X=X, M=M, G_sample=G_sample)
+
+    def penalize(self) -> None:
+        """Applies a penalty to the critic after each one of its updates, if any."""
+        pass
+
+    def critic_train_step(self) -> tf.Tensor:
+        X, M, Z = self.input_pipeline()
+
+        with tf.GradientTape() as tape:
+            D_loss: tf.Tensor = self.critic_loss(X=X, M=M, G_sample=self.generator(z=Z, m=M))
+        self.D_optimizer.apply(grads=tape.gradient(target=-D_loss, sources=self.theta_D))
+        self.penalize()
+        return D_loss
+
+    def critic_loop(self) -> tf.Tensor:
+        """Trains the critic `n_critic` times, the loop is unrolled into the compiled step, thus the whole inner loop
+        of the critic is a single dispatch (see :meth:`purify.imputation.gain.WSGAIN.critic_loop`).
+
+        Returns
+        -------
+        tf.Tensor
+            The loss of the critic at the last iteration of the loop.
+        """
+        D_loss: tf.Tensor = None
+
+        for _ in range(self.n_critic):
+            D_loss = self.critic_train_step()
+        return D_loss
+
+    def generator_train_step(self) -> List[tf.Tensor]:
+        X, M, Z = self.input_pipeline()
+
+        with tf.GradientTape() as tape:
+            G_loss, MSE_loss, CORR_loss = self.generator_losses(X=X, M=M, Z=Z)
+        self.G_optimizer.apply(grads=tape.gradient(target=G_loss, sources=self.theta_G))
+        return [G_loss, MSE_loss, CORR_loss]
+
+    def fit(self, callback: Callable[[int, Dict[str, float]], None] = None, callback_every: int = 1) -> 'WSGAIN':
+        """This method implements (the training of) the WSGAIN-CP and the WSGAIN-GP algorithms [1],
+        see :meth:`purify.imputation.gain.SGAIN.fit` for the parameters.
+
+        References
+        ----------
+        [1] Neves, Diogo Telmo, Marcel Ganesh Naik, and Alberto Proença.
+            "SGAIN, WSGAIN-CP and WSGAIN-GP: Novel GAN Methods for Missing Data Imputation."
+            International Conference on Computational Science (ICCS). Springer, Cham, 2021.
+        """
+        self.load_data()
+        for iteration in tqdm(range(self.n_iterations)):
+            D_loss: tf.Tensor
+            G_losses: List[tf.Tensor]
+
+            # train the critic a few times more per each train of the generator, i.e., two dispatches per iteration
+            D_loss = self.critic_step()
+            G_losses = self.generator_step()
+
+            if self.losses_due(iteration=iteration, callback=callback, callback_every=callback_every):
+                self.report(iteration=iteration,
+                            losses=dict(zip(gain.SGAIN.LOSSES, [float(loss) for loss in [D_loss, *G_losses]])),
+                            callback=callback, callback_every=callback_every)
+            if self.stop_early(iteration=iteration):
+                break
+
+        return self
+
+
+class WSGAIN_CP(WSGAIN):
+    """This class implements the Wasserstein Slim GAIN with Clipping Penalty (WSGAIN-CP) algorithm [1]
+    on the TensorFlow 2 engine.
+
+    References
+    ----------
+    [1] Neves, Diogo Telmo, Marcel Ganesh Naik, and Alberto Proença.
+        "SGAIN, WSGAIN-CP and WSGAIN-GP: Novel GAN Methods for Missing Data Imputation."
+        International Conference on Computational Science (ICCS). Springer, Cham, 2021.
+    """
+    def __init__(self, data: np.ndarray, algo_parameters: Dict[str, Any] = {}):
+        super().__init__(data=data, algo_parameters=algo_parameters)
+        clip_value: float = algo_parameters['clip_value'] if 'clip_value' in algo_parameters else 0.01
+        self.clip_value_min: float = min(-1 * clip_value, +1 * clip_value)
+        self.clip_value_max: float = max(-1 * clip_value, +1 * clip_value)
+
+    def penalize(self) -> None:
+        for p in self.theta_D:
+            p.assign(value=tf.clip_by_value(
+                t=p, clip_value_min=self.clip_value_min, clip_value_max=self.clip_value_max))
+
+
+class WSGAIN_GP(WSGAIN):
+    """This class implements the Wasserstein Slim GAIN with Gradient Penalty (WSGAIN-GP) algorithm [1]
+    on the TensorFlow 2 engine, the interpolation weights of the gradient penalty are drawn at each step.
+
+    References
+    ----------
+    [1] Neves, Diogo Telmo, Marcel Ganesh Naik, and Alberto Proença.
+        "SGAIN, WSGAIN-CP and WSGAIN-GP: Novel GAN Methods for Missing Data Imputation."
+        International Conference on Computational Science (ICCS). Springer, Cham, 2021.
+    """
+    def __init__(self, data: np.ndarray, algo_parameters: Dict[str, Any] = {}):
+        super().__init__(data=data, algo_parameters=algo_parameters)
+        self.lambd: float = algo_parameters['lambd'] if 'lambd' in algo_parameters else 10
+
+    def critic_loss(self, X: tf.Tensor, M: tf.Tensor, G_sample: tf.Tensor) -> tf.Tensor:
+        # the interpolation weights are drawn from U(0, 1), see `purify.imputation.gain.WSGAIN_GP`
+        eps: tf.Tensor = self.rng.uniform(shape=[self.batch_size, self.m_dim], minval=0.00, maxval=1.00)
+        X_inter: tf.Tensor = eps * (M * X) + (1 - eps) * ((1 - M) * G_sample)
+
+        with tf.GradientTape() as tape:
+            tape.watch(tensor=X_inter)
+            D_inter: tf.Tensor = self.discriminator(x=X_inter)
+        grad: tf.Tensor = tape.gradient(target=D_inter, sources=X_inter)
+        # note: `self.epsilon` is used as a workaround, see `purify.imputation.gain.WSGAIN_GP`
+        grad_norm: tf.Tensor = tf.sqrt(self.epsilon + tf.reduce_sum(input_tensor=(grad ** 2), axis=1))
+        grad_pen: tf.Tensor = self.lambd * tf.reduce_mean(input_tensor=((grad_norm - 1) ** 2))
+
+        return self.discriminator_loss(X=X, M=M, G_sample=G_sample) + grad_pen
@@ -0,0 +1,473 @@
+########################################################################################################################
+# Research Centers
+# ----------------
+# Medical Informatics Group
+# BIH - Berlin Institute of Health
+# Charité - Universitätsmedizin Berlin
+# https://www.bihealth.org/en/research/research-groups/fabian-prasser/
+#
+# Centro ALGORITMI - School of Engineering – University of Minho
+# Braga - Portugal
+# http://algoritmi.uminho.pt/
+#
+#
+# Description
+# -----------
+# This module implements the SGAIN, WSGAIN-CP and WSGAIN-GP algorithms on PyTorch, rather than on TensorFlow, behind
+# the same constructor, `fit()`, `impute()` and `execute()` contract of `purify.imputation.gain`, which is named
+# the session engine. Hence, tabular data generation (see `purify.generation.tabulator.TabularDataGenerator`) runs
+# without importing TensorFlow and, in the same process as CTGAN, it shares the thread pools and the allocator of torch.
+# The algorithms, their parameters, their update rules (see `Optimizer`) and the format of their saved models are
+# the same ones of the session engine, thus a model trained by one engine can be loaded by the other.
+#
+#
+# Moto
+# ----
+# "We think too much and feel too little. More than machinery we need humanity."
+#                         -- Excerpt of the final speech from The Great Dictator
+#
+#
+# Authors
+# -------
+# diogo telmo neves -- {dneves@di.uminho.pt, diogo-telmo.neves@charite.de, tada.science@gmail.com}
+#
+#
+# Copyright
+# ---------
+# Copyright (c) 2021 diogo telmo neves.
+# All rights reserved.
+#
+#
+# Conditions
+# ----------
+# This code is free/open source code but the following conditions must be met:
+#   * Redistributions of source code must retain the above copyright notice, this list of conditions and
+#     the following disclaimer in the documentation and/or other materials provided with the distribution.
+#   * Redistributions in binary form must reproduce the above copyright notice, this list of conditions and
+#     the following disclaimer in the documentation and/or other materials provided with the distribution.
+#
+#
+# DISCLAIMER
+# ----------
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND
+# FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR
+# TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#
+# Date
+# ----
+# October 2026
+########################################################################################################################
+
+import numpy as np
+
+import torch
+
+from purify.imputation.base import BaseSGAIN
+
+from tqdm import tqdm
+
+import logging
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+class Optimizer:
+    """This class implements the update rules of the `tf.compat.v1.train` optimizers used by the session engine,
+    i.e., gradient descent (GDA), RMSProp and Adam, see :class:`purify.imputation.gain_tf2.Optimizer`.
+    """
+
+    def __init__(self, model: BaseSGAIN, var_list: List[torch.Tensor]):
+        self.optimizer: str = model.optimizer
+        self.learn_rate: float = model.learn_rate
+        self.beta_1: float = model.beta_1
+        self.beta_2: float = model.beta_2
+        self.decay: float = model.decay
+        self.momentum: float = model.momentum
+        self.epsilon: float = model.epsilon
+        self.var_list: List[torch.Tensor] = var_list
+        # the slots of each variable, the ones of RMSProp are initialized as the ones of `tf.compat.v1.train`
+        self.slots: Dict[str, List[torch.Tensor]] = {}
+        if self.optimizer == 'RMSProp':
+            self.slots['rms'] = [torch.ones_like(input=var) for var in var_list]
+            self.slots['momentum'] = [torch.zeros_like(input=var) for var in var_list]
+        elif self.optimizer != 'GDA':  # self.optimizer == 'Adam':
+            self.slots['m'] = [torch.zeros_like(input=var) for var in var_list]
+            self.slots['v'] = [torch.zeros_like(input=var) for var in var_list]
+        self.beta_1_power: float = self.beta_1
+        self.beta_2_power: float = self.beta_2
+
+    @torch.no_grad()
+    def apply(self, grads: List[Optional[torch.Tensor]]) -> None:
+        """Updates the variables (in place) given their gradients, a `None` gradient is skipped."""
+        learn_rate: float = self.learn_rate * np.sqrt(1 - self.beta_2_power) / (1 - self.beta_1_power)
+
+        for i, (var, grad) in enumerate(zip(self.var_list, grads)):
+            if grad is None:
+                continue
+            if self.optimizer == 'GDA':
+                var.sub_(grad, alpha=self.learn_rate)
+            elif self.optimizer == 'RMSProp':
+                self.slots['rms'][i].add_((grad ** 2 - self.slots['rms'][i]) * (1 - self.decay))
+                self.slots['momentum'][i].mul_(self.momentum).add_(
+                    self.learn_rate * grad / torch.sqrt(self.slots['rms'][i] + self.epsilon))
+                var.sub_(self.slots['momentum'][i])
+            else:  # self.optimizer == 'Adam':
+                self.slots['m'][i].add_((grad - self.slots['m'][i]) * (1 - self.beta_1))
+                self.slots['v'][i].add_((grad ** 2 - self.slots['v'][i]) * (1 - self.beta_2))
+                var.sub_(learn_rate * self.slots['m'][i] / (torch.sqrt(self.slots['v'][i]) + self.epsilon))
+        if self.optimizer == 'Adam':
+            self.beta_1_power *= self.beta_1
+            self.beta_2_power *= self.beta_2
+
+    def get_slots(self) -> Dict[str, np.ndarray]:
+        """Returns the slots of each variable (by slot name and index) along with the powers of the betas."""
+        return {**{f"{name}/{i}": slot.cpu().numpy().copy()
+                   for name, slots in self.slots.items() for i, slot in enumerate(slots)},
+                'beta_1_power': np.array(self.beta_1_power), 'beta_2_power': np.array(self.beta_2_power)}
+
+    @torch.no_grad()
+    def set_slots(self, slots: Dict[str, np.ndarray]) -> None:
+        for name, values in self.slots.items():
+            for i, slot in enumerate(values):
+                slot.copy_(torch.as_tensor(data=slots[f"{name}/{i}"], dtype=torch.float32))
+        self.beta_1_power = float(slots['beta_1_power'])
+        self.beta_2_power = float(slots['beta_2_power'])
+
+
+class SGAIN(BaseSGAIN):
+    """This class implements the Slim GAIN (SGAIN) algorithm [1] on PyTorch.
+
+    References
+    ----------
+    [1] Neves, Diogo Telmo, Marcel Ganesh Naik, and Alberto Proença.
+        "SGAIN, WSGAIN-CP and WSGAIN-GP: Novel GAN Methods for Missing Data Imputation."
+        International Conference on Computational Science (ICCS). Springer, Cham, 2021.
+    """
+
+    def __init__(self, data: np.ndarray, algo_parameters: Dict[str, Any] = {}):
+        # the device of the tensors of the model, e.g., 'cpu' or 'cuda:0'
+        self.device: torch.device = torch.device(algo_parameters['device'] if 'device' in algo_parameters else 'cpu')
+        super().__init__(data=data, algo_parameters=algo_parameters)
+
+    def build(self) -> None:
+        """Builds the model, i.e., its weights and their optimizers. The weights are initialized right away,
+        thus calling `fit()` again resumes the training.
+        """
+        self.configure_threading()
+        # draws the initial weights as well as the mini-batches, hence a given seed makes the training reproducible
+        self.rng: torch.Generator = torch.Generator(device=self.device)
+        if self.seed is not None:
+            np.random.seed(seed=self.seed)
+            self.rng.manual_seed(self.seed)
+        else:
+            self.rng.seed()
+        # the (scaled) data and its mask, they are (re-)loaded by `fit()`
+        self.data_var: torch.Tensor = None
+        self.mask_var: torch.Tensor = None
+
+        self.G_W1: torch.Tensor = self.uniform(shape=[2 * self.m_dim, self.m_dim]).requires_grad_()
+        self.G_b1: torch.Tensor = torch.zeros(self.m_dim, device=self.device, requires_grad=True)
+
+        self.G_W2: torch.Tensor = self.uniform(shape=[self.m_dim, self.m_dim]).requires_grad_()
+        self.G_b2: torch.Tensor = torch.zeros(self.m_dim, device=self.device, requires_grad=True)
+
+        self.theta_G: List[torch.Tensor] = [self.G_W1, self.G_W2, self.G_b1, self.G_b2]
+
+        self.D_W1: torch.Tensor = self.uniform(shape=[self.m_dim, self.m_dim]).requires_grad_()
+        self.D_b1: torch.Tensor = torch.zeros(self.m_dim, device=self.device, requires_grad=True)
+
+        self.D_W2: torch.Tensor = self.uniform(shape=[self.m_dim, self.m_dim]).requires_grad_()
+        self.D_b2: torch.Tensor = torch.zeros(self.m_dim, device=self.device, requires_grad=True)
+
+        self.theta_D: List[torch.Tensor] = [self.D_W1, self.D_W2, self.D_b1, self.D_b2]
+
+        self.G_optimizer: Optimizer = Optimizer(model=self, var_list=self.theta_G)
+        self.D_optimizer: Optimizer = Optimizer(model=self, var_list=self.theta_D)
+
+    def configure_threading(self) -> None:
+        """Sets the number of threads of the intra-op and inter-op pools, if given. These pools are process-wide and
+        the inter-op one can only be set before PyTorch runs any parallel work, otherwise it is kept as it is.
+        """
+        if self.intra_op_threads > 0:
+            torch.set_num_threads(self.intra_op_threads)
+        if self.inter_op_threads > 0 and torch.get_num_interop_threads() != self.inter_op_threads:
+            try:
+                torch.set_num_interop_threads(self.inter_op_threads)
+            except RuntimeError:
+                logging.warning("The inter-op pool of PyTorch is already in use, thus its threading is NOT changed.")
+
+    def uniform(self, shape: List[int]) -> torch.Tensor:
+        return torch.rand(*shape, generator=self.rng, device=self.device) * 0.02 - 0.01
+
+    def load_data(self) -> None:
+        """Loads the (scaled) data and its mask into the model (i.e., onto its device)."""
+        data_miss, data_mask = self.resident_data()
+        self.data_var = torch.as_tensor(data=data_miss, dtype=torch.float32, device=self.device)
+        self.mask_var = torch.as_tensor(data=data_mask, dtype=torch.bool, device=self.device)
+
+    def correlation(self, x: torch.Tensor, y: torch.Tensor) -> torch.Tensor:
+        x_delta: torch.Tensor = x - torch.mean(x)
+        y_delta: torch.Tensor = y - torch.mean(y)
+
+        # the (population) standard deviation, as `tf.math.reduce_std`
+        return torch.mean(x_delta * y_delta) / (torch.sqrt(torch.mean(x_delta ** 2)) *
+                                                torch.sqrt(torch.mean(y_delta ** 2)))
+
+    def generator(self, z: torch.Tensor, m: torch.Tensor) -> torch.Tensor:
+        G_h1: torch.Tensor = torch.relu(self.matmul(a=torch.cat([z, m], dim=1), b=self.G_W1) + self.G_b1)
+
+        return torch.tanh(self.matmul(a=G_h1, b=self.G_W2) + self.G_b2)  # returns `G_prob`
+
+    def discriminator(self, x: torch.Tensor) -> torch.Tensor:
+        D_h1: torch.Tensor = torch.relu(self.matmul(a=x, b=self.D_W1) + self.D_b1)
+
+        # the second layer of the generator, as in `purify.imputation.gain.SGAIN.discriminator`
+        return torch.tanh(self.matmul(a=D_h1, b=self.G_W2) + self.G_b2)  # returns `D_prob`
+
+    def matmul(self, a: torch.Tensor, b: torch.Tensor) -> torch.Tensor:
+        """Multiplies two float32 tensors, in bfloat16 if so asked (see `matmul_dtype`), the product is float32."""
+        if self.matmul_dtype == 'bfloat16':
+            return (a.to(dtype=torch.bfloat16) @ b.to(dtype=torch.bfloat16)).to(dtype=torch.float32)
+        return a @ b
+
+    def input_pipeline(self) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+        """Samples a mini-batch, as :meth:`purify.imputation.gain.SGAIN.input_pipeline` does, but on the device."""
+        # during a partial fit (see `partial_fit()`), `recent_batch_size` of the rows are drawn from the new rows only
+        indices_mb: torch.Tensor = torch.cat([
+            torch.randint(high=self.n_obs, size=(self.batch_size - self.recent_batch_size,), generator=self.rng,
+                          device=self.device),
+            torch.randint(low=self.recent_row, high=self.n_obs, size=(self.recent_batch_size,), generator=self.rng,
+                          device=self.device)])
+        X_mb: torch.Tensor
+        M_mb: torch.Tensor
+
+        if self.mmap_dir is not None:
+            # the rows are gathered (by the host) from the memory-mapped data, see `gather()`
+            X_mb, M_mb = [torch.as_tensor(data=batch, device=self.device)
+                          for batch in self.gather(indices=indices_mb.cpu().numpy())]
+        else:
+            X_mb = self.data_var[indices_mb]
+            # the boolean mask is only expanded into a float32 one for the rows of the mini-batch
+            M_mb = self.mask_var[indices_mb].to(dtype=torch.float32)
+
+        if self.ampu_rate > 0:
+            # the re-amputated values are hidden from the networks as if they were missing values
+            M_mb = M_mb * (torch.rand(*M_mb.shape, generator=self.rng, device=self.device) >= self.ampu_rate)
+            X_mb = M_mb * X_mb
+        return X_mb, M_mb, M_mb * X_mb + (1 - M_mb) * self.uniform(shape=[self.batch_size, self.m_dim])
+
+    def discriminator_loss(self, X: torch.Tensor, M: torch.Tensor, G_sample: torch.Tensor) -> torch.Tensor:
+        return torch.mean(M * self.discriminator(x=X)) - torch.mean((1 - M) * self.discriminator(x=G_sample))
+
+    def generator_losses(self, X: torch.Tensor, M: torch.Tensor, G_sample: torch.Tensor) \
+            -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+        """Returns the loss of the generator, the MSE loss and the CORR loss."""
+        D_fake: torch.Tensor = self.discriminator(x=G_sample)
+        CORR_loss: torch.Tensor = self.correlation(x=X, y=G_sample)
+        MSE_loss: torch.Tensor = torch.mean((M * (X - G_sample)) ** 2) / torch.mean(M)
+
+        if self.loss == 'mse':
+            return -torch.mean((1 - M) * D_fake) + self.alpha * MSE_loss, MSE_loss, CORR_loss
+        elif self.loss == 'corr':
+            return -torch.mean((1 - M) * D_fake) + self.alpha * (1 - CORR_loss), MSE_loss, CORR_loss
+        else:  # both
+            return -torch.mean((1 - M) * D_fake) + self.alpha * (MSE_loss + (1 - CORR_loss)), MSE_loss, CORR_loss
+
+    @staticmethod
+    def gradients(loss: torch.Tensor, var_list: List[torch.Tensor]) -> List[Optional[torch.Tensor]]:
+        return list(torch.autograd.grad(outputs=loss, inputs=var_list, allow_unused=True))
+
+    def fused_step(self) -> List[torch.Tensor]:
+        """Trains the discriminator and then, on the same mini-batch and against the updated discriminator,
+        trains the generator (see :attr:`purify.imputation.gain.SGAIN.train_step`).
+
+        Returns
+        -------
+        List[torch.Tensor]
+            The `LOSSES`.
+        """
+        X, M, Z = self.input_pipeline()
+        G_sample: torch.Tensor = self.generator(z=Z, m=M)
+        D_loss: torch.Tensor = self.discriminator_loss(X=X, M=M, G_sample=G_sample.detach())
+
+        self.D_optimizer.apply(grads=self.gradients(loss=-D_loss, var_list=self.theta_D))
+        # the generator is NOT updated yet, thus its sample is reused
+        G_loss, MSE_loss, CORR_loss = self.generator_losses(X=X, M=M, G_sample=G_sample)
+        self.G_optimizer.apply(grads=self.gradients(loss=G_loss, var_list=self.theta_G))
+        return [D_loss, G_loss, MSE_loss, CORR_loss]
+
+    def get_weights(self) -> Dict[str, np.ndarray]:
+        return {name: getattr(self, name).detach().cpu().numpy().copy() for name in BaseSGAIN.WEIGHTS}
+
+    def set_weights(self, weights: Dict[str, np.ndarray]) -> None:
+        with torch.no_grad():
+            for name, value in weights.items():
+                getattr(self, name).copy_(torch.as_tensor(data=value, dtype=torch.float32))
+
+    def get_slots(self) -> Dict[str, np.ndarray]:
+        return {f"{optimizer}/{name}": value for optimizer in ('G_optimizer', 'D_optimizer')
+                for name, value in getattr(self, optimizer).get_slots().items()}
+
+    def set_slots(self, slots: Dict[str, np.ndarray]) -> None:
+        for optimizer in ('G_optimizer', 'D_optimizer'):
+            getattr(self, optimizer).set_slots(slots={name[len(optimizer) + 1:]: value for name, value in slots.items()
+                                                      if name.startswith(f"{optimizer}/")})
+
+    @torch.no_grad()
+    def generate(self, data_mask: np.ndarray, Z: np.ndarray, sess: Any = None) -> np.ndarray:
+        """Runs the (trained) generator, i.e., one forward pass over the given mask and noise (`sess` is ignored)."""
+        return self.generator(z=torch.as_tensor(data=Z, dtype=torch.float32, device=self.device),
+                              m=torch.as_tensor(data=data_mask, dtype=torch.float32, device=self.device)).cpu().numpy()
+
+    def fit(self, callback: Callable[[int, Dict[str, float]], None] = None, callback_every: int = 1) -> 'SGAIN':
+        """This method implements (the training of) the Slim GAIN (SGAIN) algorithm [1],
+        see :meth:`purify.imputation.gain.SGAIN.fit` for the parameters.
+
+        References
+        ----------
+        [1] Neves, Diogo Telmo, Marcel Ganesh Naik, and Alberto Proença.
+            "SGAIN, WSGAIN-CP and WSGAIN-GP: Novel GAN Methods for Missing Data Imputation."
+            International Conference on Computational Science (ICCS). Springer, Cham, 2021.
+        """
+        self.load_data()
+        for iteration in tqdm(range(self.n_iterations)):
+            # the losses are only copied out (i.e., synchronized with the device) when these are due
+            losses: List[torch.Tensor] = self.fused_step()
+
+            if self.losses_due(iteration=iteration, callback=callback, callback_every=callback_every):
+                self.report(iteration=iteration, losses=dict(zip(BaseSGAIN.LOSSES, [loss.item() for loss in losses])),
+                            callback=callback, callback_every=callback_every)
+            if self.stop_early(iteration=iteration):
+                break
+
+        return self
+
+
+class WSGAIN(SGAIN):
+    """This class is the PyTorch counterpart of :class:`purify.imputation.gain.WSGAIN`, i.e., it implements
+    what the WSGAIN-CP and the WSGAIN-GP algorithms [1] have in common.
+
+    References
+    ----------
+    [1] Neves, Diogo Telmo, Marcel Ganesh Naik, and Alberto Proença.
+        "SGAIN, WSGAIN-CP and WSGAIN-GP: Novel GAN Methods for Missing Data Imputation."
+        International Conference on Computational Science (ICCS). Springer, Cham, 2021.
+    """
+
+    def __init__(self, data: np.ndarray, algo_parameters: Dict[str, Any] = {}):
+        super().__init__(data=data, algo_parameters=algo_parameters)
+        # NOTE: THE SAME HACK OF `purify.imputation.gain.WSGAIN` TO PROMOTE FAIR COMPARISONS
+        self.n_iterations: int = int(np.ceil(self.n_iterations / 3))
+        self.n_critic: int = algo_parameters['n_critic'] if 'n_critic' in algo_parameters else 5
+
+    def discriminator(self, x: torch.Tensor) -> torch.Tensor:
+        D_h1: torch.Tensor = torch.relu(self.matmul(a=x, b=self.D_W1) + self.D_b1)
+
+        return self.matmul(a=D_h1, b=self.D_W2) + self.D_b2  # returns `D_prob`
+
+    def critic_loss(self, X: torch.Tensor, M: torch.Tensor, G_sample: torch.Tensor) -> torch.Tensor:
+        return self.discriminator_loss(X=X, M=M, G_sample=G_sample)
+
+    def penalize(self) -> None:
+        """Applies a penalty to the critic after each one of its updates, if any."""
+        pass
+
+    def critic_step(self) -> torch.Tensor:
+        X, M, Z = self.input_pipeline()
+
+        with torch.no_grad():
+            G_sample: torch.Tensor = self.generator(z=Z, m=M)
+        D_loss: torch.Tensor = self.critic_loss(X=X, M=M, G_sample=G_sample)
+        self.D_optimizer.apply(grads=self.gradients(loss=-D_loss, var_list=self.theta_D))
+        self.penalize()
+        return D_loss
+
+    def generator_step(self) -> List[torch.Tensor]:
+        X, M, Z = self.input_pipeline()
+        G_loss, MSE_loss, CORR_loss = self.generator_losses(X=X, M=M, G_sample=self.generator(z=Z, m=M))
+
+        self.G_optimizer.apply(grads=self.gradients(loss=G_loss, var_list=self.theta_G))
+        return [G_loss, MSE_loss, CORR_loss]
+
+    def fit(self, callback: Callable[[int, Dict[str, float]], None] = None, callback_every: int = 1) -> 'WSGAIN':
+        """This method implements (the training of) the WSGAIN-CP and the WSGAIN-GP algorithms [1],
+        see :meth:`purify.imputation.gain.SGAIN.fit` for the parameters.
+
+        References
+        ----------
+        [1] Neves, Diogo Telmo, Marcel Ganesh Naik, and Alberto Proença.
+            "SGAIN, WSGAIN-CP and WSGAIN-GP: Novel GAN Methods for Missing Data Imputation."
+            International Conference on Computational Science (ICCS). Springer, Cham, 2021.
+        """
+        self.load_data()
+        for iteration in tqdm(range(self.n_iterations)):
+            D_loss: torch.Tensor
+            G_losses: List[torch.Tensor]
+
+            for _ in range(self.n_critic):  # train the critic a few times more per each train of the generator
+                D_loss = self.critic_step()
+            G_losses = self.generator_step()
+
+            if self.losses_due(iteration=iteration, callback=callback, callback_every=callback_every):
+                self.report(iteration=iteration,
+                            losses=dict(zip(BaseSGAIN.LOSSES, [loss.item() for loss in [D_loss, *G_losses]])),
+                            callback=callback, callback_every=callback_every)
+            if self.stop_early(iteration=iteration):
+                break
+
+        return self
+
+
+class WSGAIN_CP(WSGAIN):
+    """This class implements the Wasserstein Slim GAIN with Clipping Penalty (WSGAIN-CP) algorithm [1] on PyTorch.
+
+    References
+    ----------
+    [1] Neves, Diogo Telmo, Marcel Ganesh Naik, and Alberto Proença.
+        "SGAIN, WSGAIN-CP and WSGAIN-GP: Novel GAN Methods for Missing Data Imputation."
+        International Conference on Computational Science (ICCS). Springer, Cham, 2021.
+    """
+    def __init__(self, data: np.ndarray, algo_parameters: Dict[str, Any] = {}):
+        super().__init__(data=data, algo_parameters=algo_parameters)
+        clip_value: float = algo_parameters['clip_value'] if 'clip_value' in algo_parameters else 0.01
+        self.clip_value_min: float = min(-1 * clip_value, +1 * clip_value)
+        self.clip_value_max: float = max(-1 * clip_value, +1 * clip_value)
+
+    @torch.no_grad()
+    def penalize(self) -> None:
+        for p in self.theta_D:
+            p.clamp_(min=self.clip_value_min, max=self.clip_value_max)
+
+
+class WSGAIN_GP(WSGAIN):
+    """This class implements the Wasserstein Slim GAIN with Gradient Penalty (WSGAIN-GP) algorithm [1] on PyTorch,
+    the interpolation weights of the gradient penalty are drawn at each step.
+
+    References
+    ----------
+    [1] Neves, Diogo Telmo, Marcel Ganesh Naik, and Alberto Proença.
+        "SGAIN, WSGAIN-CP and WSGAIN-GP: Novel GAN Methods for Missing Data Imputation."
+        International Conference on Computational Science (ICCS). Springer, Cham, 2021.
+    """
+    def __init__(self, data: np.ndarray, algo_parameters: Dict[str, Any] = {}):
+        super().__init__(data=data, algo_parameters=algo_parameters)
+        self.lambd: float = algo_parameters['lambd'] if 'lambd' in algo_parameters else 10
+
+    def critic_loss(self, X: torch.Tensor, M: torch.Tensor, G_sample: torch.Tensor) -> torch.Tensor:
+        # the interpolation weights are drawn from U(0, 1), see `purify.imputation.gain.WSGAIN_GP`
+        eps: torch.Tensor = torch.rand(self.batch_size, self.m_dim, generator=self.rng, device=self.device)
+        X_inter: torch.Tensor = (eps * (M * X) + (1 - eps) * ((1 - M) * G_sample)).requires_grad_()
+        grad: torch.Tensor = torch.autograd.grad(
+            outputs=self.discriminator(x=X_inter).sum(), inputs=X_inter, create_graph=True)[0]
+        # note: `self.epsilon` is used as a workaround, see `purify.imputation.gain.WSGAIN_GP`
+        grad_norm: torch.Tensor = torch.sqrt(self.epsilon + torch.sum(grad ** 2, dim=1))
+        grad_pen: torch.Tensor = self.lambd * torch.mean((grad_norm - 1) ** 2)
+
+        return self.discriminator_loss(X=X, M=M, G_sample=G_sample) + grad_pen
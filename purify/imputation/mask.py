@@ -0,0 +1,139 @@
+########################################################################################################################
+# Research Centers
+# ----------------
+# Medical Informatics Group
+# BIH - Berlin Institute of Health
+# Charité - Universitätsmedizin Berlin
+# https://www.bihealth.org/en/research/research-groups/fabian-prasser/
+#
+# Centro ALGORITMI - School of Engineering – University of Minho
+# Braga - Portugal
+# http://algoritmi.uminho.pt/
+#
+#
+# Description
+# -----------
+# This module implements a compact (i.e., bit-packed) boolean mask, which is how the purify package keeps
+# its missingness and amputation masks, i.e., 1 bit per cell rather than 4 (or 8) bytes per cell of a float mask.
+# A mask is only expanded (e.g., into a float mask) for the rows at hand, e.g., for a mini-batch or a chunk of rows.
+#
+#
+# Moto
+# ----
+# "We think too much and feel too little. More than machinery we need humanity."
+#                         -- Excerpt of the final speech from The Great Dictator
+#
+#
+# Authors
+# -------
+# diogo telmo neves -- {dneves@di.uminho.pt, diogo-telmo.neves@charite.de, tada.science@gmail.com}
+#
+#
+# Copyright
+# ---------
+# Copyright (c) 2021 diogo telmo neves.
+# All rights reserved.
+#
+#
+# Conditions
+# ----------
+# This code is free/open source code but the following conditions must be met:
+#   * Redistributions of source code must retain the above copyright notice, this list of conditions and
+#     the following disclaimer in the documentation and/or other materials provided with the distribution.
+#   * Redistributions in binary form must reproduce the above copyright notice, this list of conditions and
+#     the following disclaimer in the documentation and/or other materials provided with the distribution.
+#
+#
+# DISCLAIMER
+# ----------
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND
+# FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR
+# TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#
+# Date
+# ----
+# October 2026
+########################################################################################################################
+
+import numpy as np
+
+from typing import Tuple, Union
+
+
+class Mask:
+    """A boolean mask of shape `(n_rows, m_dim)` whose rows are bit-packed (see `np.packbits()`), i.e., each row is
+    stored in `ceil(m_dim / 8)` bytes, which cuts the memory of a boolean mask by 8x and the one of a float32 (float64)
+    mask by 32x (64x). The rows are unpacked (see `unpack()`) or expanded (see `expand()`) on demand only.
+    """
+
+    def __init__(self, bits: np.ndarray, m_dim: int):
+        """
+        Parameters
+        ----------
+        bits : np.ndarray
+            The bit-packed rows, an `np.uint8` array of shape `(n_rows, ceil(m_dim / 8))` (e.g., memory-mapped).
+        m_dim : int
+            The number of columns of the mask.
+        """
+        if bits.ndim != 2 or bits.shape[1] != (m_dim + 7) // 8:
+            raise ValueError(f"Expecting bit-packed rows of shape (n_rows, {(m_dim + 7) // 8}) "
+                             f"but got: {bits.shape}.")
+        self.bits: np.ndarray = bits
+        self.m_dim: int = m_dim
+
+    @classmethod
+    def pack(cls, mask: np.ndarray) -> 'Mask':
+        """Packs a boolean mask of shape `(n_rows, m_dim)`."""
+        return cls(bits=np.packbits(np.asarray(mask, dtype=bool), axis=1), m_dim=mask.shape[1])
+
+    @classmethod
+    def observed(cls, data: np.ndarray, chunk_rows: int = 2 ** 16) -> 'Mask':
+        """Packs the mask of the observed (i.e., NOT NaN) values of the data, chunk by chunk of `chunk_rows` rows,
+        thus no full-size boolean (let alone float) mask is ever held in memory.
+        """
+        bits: np.ndarray = np.empty(shape=(data.shape[0], (data.shape[1] + 7) // 8), dtype=np.uint8)
+
+        for start in range(0, data.shape[0], chunk_rows):
+            bits[start:(start + chunk_rows)] = np.packbits(~np.isnan(data[start:(start + chunk_rows)]), axis=1)
+        return cls(bits=bits, m_dim=data.shape[1])
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.bits.shape[0], self.m_dim
+
+    @property
+    def nbytes(self) -> int:
+        return self.bits.nbytes
+
+    def __len__(self) -> int:
+        return self.bits.shape[0]
+
+    def __getitem__(self, rows: Union[slice, np.ndarray]) -> 'Mask':
+        """Returns the (still bit-packed) mask of the given rows, i.e., either a slice or an array of indices."""
+        return Mask(bits=self.bits[rows], m_dim=self.m_dim)
+
+    def unpack(self, rows: Union[slice, np.ndarray] = None) -> np.ndarray:
+        """Unpacks the given rows (by default, all of them) into a boolean mask of shape `(n_rows, m_dim)`."""
+        return np.unpackbits(self.bits if rows is None else self.bits[rows], axis=1, count=self.m_dim).view(bool)
+
+    def expand(self, rows: Union[slice, np.ndarray] = None, dtype: np.dtype = np.float32) -> np.ndarray:
+        """Expands the given rows (by default, all of them) into a mask of ones and zeros of the given data type,
+        e.g., the float32 mask of a mini-batch that the networks are fed with.
+        """
+        return self.unpack(rows=rows).astype(dtype=dtype)
+
+    @staticmethod
+    def as_bool(mask: Union[np.ndarray, 'Mask'], rows: Union[slice, np.ndarray] = None) -> np.ndarray:
+        """Returns the given rows (by default, all of them) of either a boolean or a (bit-packed) `Mask` mask
+        as a boolean mask, thus the callers accept both.
+        """
+        if isinstance(mask, Mask):
+            return mask.unpack(rows=rows)
+        return np.asarray(mask if rows is None else mask[rows], dtype=bool)
@@ -0,0 +1,192 @@
+########################################################################################################################
+# Research Centers
+# ----------------
+# Medical Informatics Group
+# BIH - Berlin Institute of Health
+# Charité - Universitätsmedizin Berlin
+# https://www.bihealth.org/en/research/research-groups/fabian-prasser/
+#
+# Centro ALGORITMI - School of Engineering – University of Minho
+# Braga - Portugal
+# http://algoritmi.uminho.pt/
+#
+#
+# Description
+# -----------
+# This module is a runtime that imputes missing values with a trained generator of the SGAIN family using NumPy only,
+# i.e., without importing any deep learning framework (nor scikit-learn).
+# The generator is just two dense layers (`G_W1`, `G_b1`, `G_W2`, `G_b2`) with relu/tanh activations, whereas
+# the `MinMaxScaler` is just an affine map (`min_`, `scale_`). Therefore, `export()` writes those arrays, as `.npy`
+# files, into a directory, which `Imputer.load()` memory-maps, thus a serving process starts in milliseconds.
+#
+#
+# Moto
+# ----
+# "We think too much and feel too little. More than machinery we need humanity."
+#                         -- Excerpt of the final speech from The Great Dictator
+#
+#
+# Authors
+# -------
+# diogo telmo neves -- {dneves@di.uminho.pt, diogo-telmo.neves@charite.de, tada.science@gmail.com}
+#
+#
+# Copyright
+# ---------
+# Copyright (c) 2021 diogo telmo neves.
+# All rights reserved.
+#
+#
+# Conditions
+# ----------
+# This code is free/open source code but the following conditions must be met:
+#   * Redistributions of source code must retain the above copyright notice, this list of conditions and
+#     the following disclaimer in the documentation and/or other materials provided with the distribution.
+#   * Redistributions in binary form must reproduce the above copyright notice, this list of conditions and
+#     the following disclaimer in the documentation and/or other materials provided with the distribution.
+#
+#
+# DISCLAIMER
+# ----------
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES,
+# INCLUDING, BUT NOT LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND
+# FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR
+# TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#
+# Date
+# ----
+# October 2026
+########################################################################################################################
+
+import numpy as np
+
+import json
+import os
+
+from typing import Dict, List, Tuple
+
+FORMAT_VERSION: int = 1
+"""The version of the format of the directories written by `export()`."""
+
+WEIGHTS: Tuple[str, ...] = ('G_W1', 'G_b1', 'G_W2', 'G_b2')
+"""The names of the weights of the generator."""
+
+SCALER_ATTRIBUTES: Tuple[str, ...] = ('min_', 'scale_')
+"""The fitted attributes of the `MinMaxScaler` that are needed to scale the data and to invert that scaling."""
+
+
+def export(state: Dict[str, np.ndarray], path: str) -> None:
+    """Exports the generator and the scaler of a trained model into a directory of `.npy` files.
+
+    Parameters
+    ----------
+    state : Dict[str, np.ndarray]
+        The state of a trained model (see `purify.imputation.base.BaseSGAIN.state()`), e.g., `model.state()` or
+        the (loaded) archive written by `save()`, which does NOT need any deep learning framework.
+    path : str
+        The path of the directory, which is created if it does NOT exist.
+    """
+    os.makedirs(name=path, exist_ok=True)
+    for name in WEIGHTS:
+        np.save(file=os.path.join(path, f"{name}.npy"), arr=np.ascontiguousarray(state[f"weights/{name}"]))
+    for name in SCALER_ATTRIBUTES:
+        np.save(file=os.path.join(path, f"{name}.npy"), arr=np.asarray(state[f"scaler/{name}"], dtype=float))
+    with open(file=os.path.join(path, 'format.json'), mode='w') as file:
+        json.dump(obj={'format_version': FORMAT_VERSION, 'algo': str(state['algo'])}, fp=file)
+
+
+class Imputer:
+    """This class imputes missing values with a trained generator of the SGAIN family, using NumPy only,
+    as :meth:`purify.imputation.base.BaseSGAIN.impute_many` does.
+    """
+
+    def __init__(self,
+                 weights: Dict[str, np.ndarray],
+                 scaler: Dict[str, np.ndarray],
+                 seed: int = None,
+                 chunk_rows: int = 2 ** 16):
+        self.G_W1: np.ndarray = weights['G_W1']
+        self.G_b1: np.ndarray = weights['G_b1']
+        self.G_W2: np.ndarray = weights['G_W2']
+        self.G_b2: np.ndarray = weights['G_b2']
+        # the data is imputed in the precision of the generator (i.e., float32), as by the engines
+        self.min_: np.ndarray = np.asarray(scaler['min_'], dtype=self.G_W1.dtype)
+        self.scale_: np.ndarray = np.asarray(scaler['scale_'], dtype=self.G_W1.dtype)
+        self.m_dim: int = self.G_W2.shape[1]
+        # draws the noise of the missing values
+        self.rng: np.random.Generator = np.random.default_rng(seed=seed)
+        # the number of rows that are imputed at once (see `impute_many()`), which bounds the memory of the imputation
+        self.chunk_rows: int = chunk_rows
+
+    @classmethod
+    def load(cls, path: str, mmap_mode: str = 'r', seed: int = None, chunk_rows: int = 2 ** 16) -> 'Imputer':
+        """Loads a generator exported by `export()`, its arrays are memory-mapped (unless `mmap_mode` is `None`)."""
+        with open(file=os.path.join(path, 'format.json'), mode='r') as file:
+            version: int = json.load(fp=file)['format_version']
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Expecting the format version {FORMAT_VERSION} but got: {version}.")
+        return cls(weights={name: np.load(file=os.path.join(path, f"{name}.npy"), mmap_mode=mmap_mode)
+                            for name in WEIGHTS},
+                   scaler={name: np.load(file=os.path.join(path, f"{name}.npy"), mmap_mode=mmap_mode)
+                           for name in SCALER_ATTRIBUTES},
+                   seed=seed,
+                   chunk_rows=chunk_rows)
+
+    def transform(self, data: np.ndarray) -> np.ndarray:
+        return data * self.scale_ + self.min_
+
+    def inverse_transform(self, data: np.ndarray) -> np.ndarray:
+        return (data - self.min_) / self.scale_
+
+    def generator(self, z: np.ndarray, m: np.ndarray) -> np.ndarray:
+        G_h1: np.ndarray = np.maximum(np.concatenate([z, m], axis=1) @ self.G_W1 + self.G_b1, 0)
+
+        return np.tanh(G_h1 @ self.G_W2 + self.G_b2)  # returns `G_prob`
+
+    def impute(self, data: np.ndarray, ampu_mask: np.ndarray = None) -> np.ndarray:
+        """Imputes the missing values of the data (see `impute_many()`)."""
+        return self.impute_many(data=data, ampu_masks=[ampu_mask])[0]
+
+    def impute_many(self, data: np.ndarray, ampu_masks: List[np.ndarray]) -> np.ndarray:
+        """Imputes several amputations of the data at once, i.e., one forward pass of the generator per chunk of
+        `chunk_rows` rows (over the K amputations of the chunk), which is written into a preallocated output,
+        thus neither the data (e.g., it can be memory-mapped) nor its K copies are ever densified as a whole.
+
+        Parameters
+        ----------
+        data : np.ndarray
+            The data, whose missing values are NaNs.
+        ampu_masks : List[np.ndarray]
+            K boolean masks of the shape of `data`, each one marks the (observed) values to be amputated before
+            the respective imputation, a `None` mask means that only the missing values are imputed.
+
+        Returns
+        -------
+        np.ndarray
+            The K imputations of the data, an array of shape `(K, n_rows, m_dim)`.
+        """
+        n_rows: int = data.shape[0]
+        imputed_data: np.ndarray = np.empty(shape=(len(ampu_masks), n_rows, self.m_dim), dtype=self.G_W1.dtype)
+
+        for start in range(0, n_rows, self.chunk_rows):
+            stop: int = min(start + self.chunk_rows, n_rows)
+            chunk: np.ndarray = np.asarray(data[start:stop], dtype=self.G_W1.dtype)
+            data_mask: np.ndarray = (~np.isnan(chunk)).astype(dtype=self.G_W1.dtype)
+            data_miss: np.ndarray = np.nan_to_num(x=self.transform(data=chunk), nan=0.00)
+
+            data_mask = np.concatenate([data_mask if ampu_mask is None else
+                                        np.where(ampu_mask[start:stop], 0.00, data_mask) for ampu_mask in ampu_masks],
+                                       axis=0)
+            data_miss = np.tile(A=data_miss, reps=(len(ampu_masks), 1))
+            Z_all: np.ndarray = data_mask * data_miss + (1 - data_mask) * (
+                0.02 * self.rng.random(size=data_mask.shape, dtype=self.G_W1.dtype) - 0.01)
+            imputed_data[:, start:stop, :] = self.inverse_transform(
+                data=(data_mask * data_miss + (1 - data_mask) * self.generator(z=Z_all, m=data_mask))).reshape(
+                len(ampu_masks), stop - start, self.m_dim)
+        return imputed_data